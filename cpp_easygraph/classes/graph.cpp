@@ -6,6 +6,7 @@ Graph::Graph() {
 	this->id = 0;
 	this->dirty_nodes = true;
 	this->dirty_adj = true;
+	this->version = 0;
 	this->node_to_id = py::dict();
 	this->id_to_node = py::dict();
 	this->graph = py::dict();
@@ -83,6 +84,7 @@ py::object Graph_add_node(py::tuple args, py::dict kwargs) {
 	Graph& self = py::extract<Graph&>(args[0]);
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	py::object one_node_for_adding = args[1];
 	py::dict node_attr = kwargs;
 	_add_one_node(self, one_node_for_adding, node_attr);
@@ -92,6 +94,7 @@ py::object Graph_add_node(py::tuple args, py::dict kwargs) {
 py::object Graph_add_nodes(Graph& self, py::list nodes_for_adding, py::list nodes_attr) {
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	if (py::len(nodes_attr) != 0) {
 		if (py::len(nodes_for_adding) != py::len(nodes_attr)) {
 			PyErr_Format(PyExc_AssertionError, "Nodes and Attributes lists must have same length.");
@@ -116,6 +119,7 @@ py::object Graph_add_nodes_from(py::tuple args, py::dict kwargs) {
 	Graph& self = py::extract<Graph&>(args[0]);
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	py::list nodes_for_adding = py::list(args[1]);
 	for (int i = 0;i < py::len(nodes_for_adding);i++) {
 		bool newnode;
@@ -165,6 +169,7 @@ py::object Graph_add_nodes_from(py::tuple args, py::dict kwargs) {
 py::object Graph_remove_node(Graph& self, py::object node_to_remove) {
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	if (!self.node_to_id.contains(node_to_remove)) {
 		PyErr_Format(PyExc_KeyError, "No node %R in graph.", node_to_remove.ptr());
 		return py::object();
@@ -185,6 +190,7 @@ py::object Graph_remove_nodes(py::object self, py::list nodes_to_remove) {
 	Graph& self_ = py::extract<Graph&>(self);
 	self_.dirty_nodes = true;
 	self_.dirty_adj = true;
+	self_.version++;
 	for (int i = 0;i < py::len(nodes_to_remove);i++) {
 		py::object node_to_remove = nodes_to_remove[i];
 		if (!self_.node_to_id.contains(node_to_remove)) {
@@ -261,6 +267,7 @@ py::object Graph_add_edge(py::tuple args, py::dict kwargs) {
 	Graph& self = py::extract<Graph&>(args[0]);
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	py::object u_of_edge = args[1], v_of_edge = args[2];
 	py::dict edge_attr = kwargs;
 	_add_one_edge(self, u_of_edge, v_of_edge, edge_attr);
@@ -270,6 +277,7 @@ py::object Graph_add_edge(py::tuple args, py::dict kwargs) {
 py::object Graph_add_edges(Graph& self, py::list edges_for_adding, py::list edges_attr) {
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	if (py::len(edges_attr) != 0) {
 		if (py::len(edges_for_adding) != py::len(edges_attr)) {
 			PyErr_Format(PyExc_AssertionError, "Edges and Attributes lists must have same length.");
@@ -294,6 +302,7 @@ py::object Graph_add_edges_from(py::tuple args, py::dict attr) {
 	Graph& self = py::extract<Graph&>(args[0]);
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	py::list ebunch_to_add = py::list(args[1]);
 	for (int i = 0;i < len(ebunch_to_add);i++) {
 		py::list e = py::list(ebunch_to_add[i]);
@@ -348,26 +357,27 @@ py::object Graph_add_edges_from(py::tuple args, py::dict attr) {
 	return py::object();
 }
 
+static node_t _node_id_of_label(Graph& self, std::unordered_map<std::string, node_t>& ids, const std::string& label) {
+	auto it = ids.find(label);
+	if (it != ids.end()) {
+		return it->second;
+	}
+	py::object node(label);
+	node_t id;
+	if (self.node_to_id.contains(node)) {
+		id = py::extract<node_t>(self.node_to_id[node]);
+	}
+	else {
+		id = _add_one_node(self, node);
+	}
+	ids.emplace(label, id);
+	return id;
+}
+
 py::object Graph_add_edges_from_file(Graph& self, py::str file, py::object weighted) {
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
-	struct commactype : std::ctype<char> {
-		commactype() : std::ctype<char>(get_table()) {}
-		std::ctype_base::mask const* get_table() {
-			std::ctype_base::mask* rc = 0;
-			if (rc == 0) {
-				rc = new std::ctype_base::mask[std::ctype<char>::table_size];
-				std::fill_n(rc, std::ctype<char>::table_size, std::ctype_base::mask());
-				rc[','] = std::ctype_base::space;
-				rc[' '] = std::ctype_base::space;
-				rc['\t'] = std::ctype_base::space;
-				rc['\n'] = std::ctype_base::space;
-				rc['\r'] = std::ctype_base::space;
-			}
-			return rc;
-		}
-	};
-
+	self.version++;
 	std::ios::sync_with_stdio(0);
 	std::string file_path = py::extract<std::string>(file);
 	std::ifstream in;
@@ -376,27 +386,48 @@ py::object Graph_add_edges_from_file(Graph& self, py::str file, py::object weigh
 		PyErr_Format(PyExc_FileNotFoundError, "Please check the file and make sure the path only contains English");
 		return py::object();
 	}
-	in.imbue(std::locale(std::locale(), new commactype));
-	std::string data, key("weight");
-	std::string su, sv;
-	weight_t weight;
-	while (in >> su >> sv) {
-		py::object pu(su), pv(sv);
-		node_t u, v;
-		if (!self.node_to_id.contains(pu)) {
-			u = _add_one_node(self, pu);
-		}
-		else {
-			u = py::extract<node_t>(self.node_to_id[pu]);
-		}
-		if (!self.node_to_id.contains(pv)) {
-			v = _add_one_node(self, pv);
+	bool is_weighted = bool(weighted);
+	std::size_t n_fields = is_weighted ? 3 : 2;
+	// Labels already seen, so that Python dicts are only queried for new nodes.
+	std::unordered_map<std::string, node_t> ids;
+	std::string line, key("weight");
+	std::vector<std::string> fields;
+	long malformed = 0;
+	while (std::getline(in, line)) {
+		fields.clear();
+		std::size_t i = 0, n = line.size();
+		while (i < n && fields.size() < n_fields) {
+			while (i < n && (line[i] == ' ' || line[i] == ',' || line[i] == '\t' || line[i] == '\r')) {
+				i++;
+			}
+			std::size_t begin = i;
+			while (i < n && line[i] != ' ' && line[i] != ',' && line[i] != '\t' && line[i] != '\r') {
+				i++;
+			}
+			if (i > begin) {
+				fields.emplace_back(line, begin, i - begin);
+			}
 		}
-		else {
-			v = py::extract<node_t>(self.node_to_id[pv]);
+		if (fields.empty() || fields[0][0] == '#') {
+			continue;
+		}
+		if (fields.size() < n_fields) {
+			malformed++;
+			continue;
+		}
+		weight_t weight = 0;
+		if (is_weighted) {
+			const char* begin = fields[2].c_str();
+			char* end;
+			weight = std::strtof(begin, &end);
+			if (end == begin || *end != '\0') {
+				malformed++;
+				continue;
+			}
 		}
-		if (weighted) {
-			in >> weight;
+		node_t u = _node_id_of_label(self, ids, fields[0]);
+		node_t v = _node_id_of_label(self, ids, fields[1]);
+		if (is_weighted) {
 			self.adj[u][v][key] = self.adj[v][u][key] = weight;
 		}
 		else {
@@ -409,12 +440,13 @@ py::object Graph_add_edges_from_file(Graph& self, py::str file, py::object weigh
 		}
 	}
 	in.close();
-	return py::object();
+	return py::object(malformed);
 }
 
 py::object Graph_add_weighted_edge(Graph& self, py::object u_of_edge, py::object v_of_edge, weight_t weight) {
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	py::dict edge_attr;
 	edge_attr["weight"] = weight;
 	_add_one_edge(self, u_of_edge, v_of_edge, edge_attr);
@@ -424,6 +456,7 @@ py::object Graph_add_weighted_edge(Graph& self, py::object u_of_edge, py::object
 py::object Graph_remove_edge(Graph& self, py::object u, py::object v) {
 	self.dirty_nodes = true;
 	self.dirty_adj = true;
+	self.version++;
 	if (self.node_to_id.contains(u) && self.node_to_id.contains(v)) {
 		node_t u_id = py::extract<node_t>(self.node_to_id[u]);
 		node_t v_id = py::extract<node_t>(self.node_to_id[v]);
@@ -449,6 +482,7 @@ py::object Graph_remove_edges(py::object self, py::list edges_to_remove) {
 	}
 	self_.dirty_nodes = true;
 	self_.dirty_adj = true;
+	self_.version++;
 	return py::object();
 }
 
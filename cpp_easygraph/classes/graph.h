@@ -10,6 +10,7 @@ struct Graph
 	py::dict node_to_id, id_to_node, graph;
 	node_t id;
 	bool dirty_nodes, dirty_adj;
+	unsigned long long version;
 	py::object nodes_cache, adj_cache;
 
 	Graph();
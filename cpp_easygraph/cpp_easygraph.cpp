@@ -41,7 +41,8 @@ BOOST_PYTHON_MODULE(cpp_easygraph)
         .add_property("nodes", &Graph::get_nodes)
         .add_property("name", &Graph::get_name)
         .add_property("adj", &Graph::get_adj)
-        .add_property("edges", &Graph::get_edges);
+        .add_property("edges", &Graph::get_edges)
+        .def_readonly("version", &Graph::version);
     
     py::class_<DiGraph, py::bases<Graph>>("DiGraph", py::no_init)
         .def("__init__", py::raw_function(&DiGraph__init__))
@@ -2,6 +2,10 @@
 #include "../../classes/graph.h"
 #include "../../common/utils.h"
 
+#include <atomic>
+#include <exception>
+#include <thread>
+
 struct pair_hash
 {
 	template<class T1, class T2>
@@ -13,35 +17,112 @@ struct pair_hash
 	}
 };
 
-std::unordered_map<std::pair<node_t, node_t>, weight_t, pair_hash> sum_nmw_rec, max_nmw_rec, local_constraint_rec;
+typedef std::unordered_map<std::pair<node_t, node_t>, weight_t, pair_hash> rec_t;
+
+// The memoized values of one worker thread, so that threads never share them.
+struct nmw_cache {
+	rec_t sum_nmw_rec, max_nmw_rec, local_constraint_rec;
+};
 
 enum norm_t {
 	sum, max
 };
 
+// Releases the GIL for the lifetime of the object.
+struct gil_release {
+	PyThreadState* state;
+	gil_release() : state(PyEval_SaveThread()) {}
+	~gil_release() { PyEval_RestoreThread(state); }
+};
+
+int workers_to_threads(py::object n_workers, int n_tasks) {
+	int n_threads = 1;
+	if (n_workers != py::object()) {
+		n_threads = py::extract<int>(n_workers);
+	}
+	return std::max(1, std::min(n_threads, n_tasks));
+}
 
-weight_t mutual_weight(adj_dict_factory& G, node_t u, node_t v, std::string weight) {
+// Calls task(i, cache) for every i in [0, n_tasks) on n_threads threads, with
+// the GIL released. Threads take blocks of indices from a shared counter, so
+// that the ones finishing early pick up the remaining work.
+template<class Task>
+void parallel_for(int n_tasks, int n_threads, Task task) {
+	const int block = 64;
+	std::atomic<int> next(0);
+	std::exception_ptr error;
+	std::atomic<bool> failed(false);
+	auto run = [&]() {
+		nmw_cache cache;
+		try {
+			for (int start = next.fetch_add(block); start < n_tasks && !failed; start = next.fetch_add(block)) {
+				int stop = std::min(start + block, n_tasks);
+				for (int i = start;i < stop;i++) {
+					task(i, cache);
+				}
+			}
+		}
+		catch (...) {
+			if (!failed.exchange(true)) {
+				error = std::current_exception();
+			}
+		}
+	};
+	{
+		gil_release nogil;
+		std::vector<std::thread> threads;
+		for (int t = 1;t < n_threads;t++) {
+			threads.emplace_back(run);
+		}
+		run();
+		for (auto& thread : threads) {
+			thread.join();
+		}
+	}
+	if (error) {
+		std::rethrow_exception(error);
+	}
+}
+
+std::vector<node_t> nodes_to_ids(Graph& G_, py::list nodes_list) {
+	std::vector<node_t> ids;
+	for (int i = 0;i < py::len(nodes_list);i++) {
+		ids.push_back(py::extract<node_t>(G_.node_to_id[nodes_list[i]]));
+	}
+	return ids;
+}
+
+weight_t mutual_weight(const adj_dict_factory& G, node_t u, node_t v, const std::string& weight) {
 	weight_t a_uv = 0, a_vu = 0;
-	if (G.count(u) && G[u].count(v)) {
-		edge_attr_dict_factory& guv = G[u][v];
-		a_uv = guv.count(weight) ? guv[weight] : 1;
+	auto u_it = G.find(u);
+	if (u_it != G.end()) {
+		auto uv = u_it->second.find(v);
+		if (uv != u_it->second.end()) {
+			auto w = uv->second.find(weight);
+			a_uv = (w != uv->second.end()) ? w->second : 1;
+		}
 	}
-	if (G.count(v) && G[v].count(u)) {
-		edge_attr_dict_factory& gvu = G[v][u];
-		a_uv = gvu.count(weight) ? gvu[weight] : 1;
+	auto v_it = G.find(v);
+	if (v_it != G.end()) {
+		auto vu = v_it->second.find(u);
+		if (vu != v_it->second.end()) {
+			auto w = vu->second.find(weight);
+			a_vu = (w != vu->second.end()) ? w->second : 1;
+		}
 	}
 	return a_uv + a_vu;
 }
 
-weight_t  normalized_mutual_weight(adj_dict_factory& G, node_t u, node_t v, std::string weight, norm_t norm = sum) {
+weight_t normalized_mutual_weight(const adj_dict_factory& G, node_t u, node_t v, const std::string& weight, nmw_cache& cache, norm_t norm = sum) {
 	std::pair<node_t, node_t> edge = std::make_pair(u, v);
-	auto& nmw_rec = (norm == sum) ? sum_nmw_rec : max_nmw_rec;
-	if (nmw_rec.count(edge)) {
-		return nmw_rec[edge];
+	auto& nmw_rec = (norm == sum) ? cache.sum_nmw_rec : cache.max_nmw_rec;
+	auto found = nmw_rec.find(edge);
+	if (found != nmw_rec.end()) {
+		return found->second;
 	}
 	else {
 		weight_t scale = 0;
-		for (auto& w : G[u]) {
+		for (auto& w : G.at(u)) {
 			weight_t temp_weight = mutual_weight(G, u, w.first, weight);
 			scale = (norm == sum) ? (scale + temp_weight) : std::max(scale, temp_weight);
 		}
@@ -51,155 +132,165 @@ weight_t  normalized_mutual_weight(adj_dict_factory& G, node_t u, node_t v, std:
 	}
 }
 
-weight_t local_constraint(adj_dict_factory& G, node_t u, node_t v, std::string weight = "None") {
+weight_t local_constraint(const adj_dict_factory& G, node_t u, node_t v, const std::string& weight, nmw_cache& cache) {
 	std::pair<node_t, node_t> edge = std::make_pair(u, v);
-	if (local_constraint_rec.count(edge)) {
-		return local_constraint_rec[edge];
+	auto found = cache.local_constraint_rec.find(edge);
+	if (found != cache.local_constraint_rec.end()) {
+		return found->second;
 	}
 	else {
-		weight_t direct = normalized_mutual_weight(G, u, v, weight);
+		weight_t direct = normalized_mutual_weight(G, u, v, weight, cache);
 		weight_t indirect = 0;
-		for (auto& w : G[u]) {
-			indirect += normalized_mutual_weight(G, u, w.first, weight) * normalized_mutual_weight(G, w.first, v, weight);
+		for (auto& w : G.at(u)) {
+			indirect += normalized_mutual_weight(G, u, w.first, weight, cache) * normalized_mutual_weight(G, w.first, v, weight, cache);
 		}
 		weight_t result = pow((direct + indirect), 2);
-		local_constraint_rec[edge] = result;
+		cache.local_constraint_rec[edge] = result;
 		return result;
 	}
 }
 
-std::pair<node_t, weight_t> compute_constraint_of_v(adj_dict_factory& G, node_t v, std::string weight) {
+weight_t compute_constraint_of_v(const adj_dict_factory& G, node_t v, const std::string& weight, nmw_cache& cache) {
 	weight_t constraint_of_v = 0;
-	if (G[v].size() == 0) {
+	if (G.at(v).size() == 0) {
 		constraint_of_v = Py_NAN;
 	}
 	else {
-		for (const auto& n : G[v]) {
-			constraint_of_v += local_constraint(G, v, n.first, weight);
+		for (const auto& n : G.at(v)) {
+			constraint_of_v += local_constraint(G, v, n.first, weight, cache);
 		}
 	}
-	return std::make_pair(v, constraint_of_v);
+	return constraint_of_v;
 }
 
 py::object constraint(py::object G, py::object nodes, py::object weight, py::object n_workers) {
 	std::string weight_key = weight_to_string(weight);
-	sum_nmw_rec.clear();
-	max_nmw_rec.clear();
-	local_constraint_rec.clear();
 	if (nodes == py::object()) {
 		nodes = G.attr("nodes");
 	}
 	py::list nodes_list = py::list(nodes);
-	py::list constraint_results = py::list();
 	Graph& G_ = py::extract<Graph&>(G);
-	for (int i = 0;i < py::len(nodes_list);i++) {
-		py::object v = nodes_list[i];
-		node_t v_id = py::extract<node_t>(G_.node_to_id[v]);
-		std::pair<node_t, weight_t> constraint_pair = compute_constraint_of_v(G_.adj, v_id, weight_key);
-		py::tuple constraint_of_v = py::make_tuple(G_.id_to_node[constraint_pair.first], constraint_pair.second);
-		constraint_results.append(constraint_of_v);
+	std::vector<node_t> ids = nodes_to_ids(G_, nodes_list);
+	const adj_dict_factory& adj = G_.adj;
+	std::vector<double> results(ids.size());
+	parallel_for(ids.size(), workers_to_threads(n_workers, ids.size()), [&](int i, nmw_cache& cache) {
+		results[i] = compute_constraint_of_v(adj, ids[i], weight_key, cache);
+	});
+	py::dict constraint = py::dict();
+	for (int i = 0;i < ids.size();i++) {
+		constraint[nodes_list[i]] = results[i];
 	}
-	py::dict constraint = py::dict(constraint_results);
 	return constraint;
 }
 
-weight_t redundancy(adj_dict_factory& G, node_t u, node_t v, std::string weight = "None") {
+weight_t redundancy(const adj_dict_factory& G, node_t u, node_t v, const std::string& weight, nmw_cache& cache) {
 	weight_t r = 0;
-	for (const auto& neighbor_info : G[u]) {
+	for (const auto& neighbor_info : G.at(u)) {
 		node_t w = neighbor_info.first;
-		r += normalized_mutual_weight(G, u, w, weight) * normalized_mutual_weight(G, v, w, weight, max);
+		r += normalized_mutual_weight(G, u, w, weight, cache) * normalized_mutual_weight(G, v, w, weight, cache, max);
 	}
 	return 1 - r;
 }
 
+// The effective size of v from its ego network, for unweighted undirected graphs.
+double borgatti_effective_size(const adj_dict_factory& G, node_t v) {
+	const adj_attr_dict_factory& neighbors = G.at(v);
+	std::unordered_set<node_t> ego;
+	ego.insert(v);
+	for (const auto& neighbor_info : neighbors) {
+		ego.insert(neighbor_info.first);
+	}
+	int n = ego.size();
+	if (n <= 1) {
+		return 0;
+	}
+	// Edges between the ego nodes, self-loops included, each counted once.
+	long long size = 0;
+	for (node_t u : ego) {
+		for (const auto& neighbor_info : G.at(u)) {
+			node_t w = neighbor_info.first;
+			if (u <= w && ego.count(w)) {
+				size++;
+			}
+		}
+	}
+	return n - 1 - (2.0 * size) / (n - 1);
+}
+
 py::object effective_size(py::object G, py::object nodes, py::object weight, py::object n_workers) {
 	Graph& G_ = py::extract<Graph&>(G);
-	sum_nmw_rec.clear();
-	max_nmw_rec.clear();
-	py::dict effective_size = py::dict();
 	if (nodes == py::object()) {
 		nodes = G;
 	}
-	nodes = py::list(nodes);
-	if (!G.attr("is_directed")() && weight == py::object()) {
-		for (int i = 0;i < py::len(nodes);i++) {
-			py::object v = nodes[i];
-			if (py::len(G[v]) == 0) {
-				effective_size[v] = py::object(Py_NAN);
-				continue;
-			}
-			py::object E = G.attr("ego_subgraph")(v);
-			if (py::len(E) > 1) {
-				weight_t size = py::extract<weight_t>(E.attr("size")());
-				effective_size[v] = py::len(E) - 1 - (2.0 * size) / (py::len(E) - 1);
-			}
-			else {
-				effective_size[v] = 0;
-			}
+	py::list nodes_list = py::list(nodes);
+	std::vector<node_t> ids = nodes_to_ids(G_, nodes_list);
+	const adj_dict_factory& adj = G_.adj;
+	std::vector<double> results(ids.size());
+	bool borgatti = !G.attr("is_directed")() && weight == py::object();
+	std::string weight_key = weight_to_string(weight);
+	parallel_for(ids.size(), workers_to_threads(n_workers, ids.size()), [&](int i, nmw_cache& cache) {
+		node_t v_id = ids[i];
+		if (adj.at(v_id).size() == 0) {
+			// Effective size is not defined for isolated nodes
+			results[i] = Py_NAN;
 		}
-	}
-	else {
-		std::string weight_key = weight_to_string(weight);
-		for (int i = 0;i < py::len(nodes);i++) {
-			py::object v = nodes[i];
-			if (py::len(G[v]) == 0) {
-				effective_size[v] = py::object(Py_NAN);
-				continue;
-			}
+		else if (borgatti) {
+			results[i] = borgatti_effective_size(adj, v_id);
+		}
+		else {
 			weight_t redundancy_sum = 0;
-			node_t v_id = py::extract<node_t>(G_.node_to_id[v]);
-			for (const auto& neighbor_info : G_.adj[v_id]) {
+			for (const auto& neighbor_info : adj.at(v_id)) {
 				node_t u_id = neighbor_info.first;
-				redundancy_sum += redundancy(G_.adj, v_id, u_id, weight_key);
+				redundancy_sum += redundancy(adj, v_id, u_id, weight_key, cache);
 			}
-			effective_size[v] = redundancy_sum;
+			results[i] = redundancy_sum;
 		}
+	});
+	py::dict effective_size = py::dict();
+	for (int i = 0;i < ids.size();i++) {
+		effective_size[nodes_list[i]] = results[i];
 	}
 	return effective_size;
 }
 
+weight_t compute_hierarchy_of_v(const adj_dict_factory& G, node_t v, const std::string& weight, nmw_cache& cache) {
+	const adj_attr_dict_factory& neighbors = G.at(v);
+	// The size of the ego network of v, without v.
+	int n = neighbors.size() - neighbors.count(v);
+
+	weight_t C = 0;
+	std::map<node_t, weight_t> c;
+	for (const auto& neighbor_info : neighbors) {
+		node_t w = neighbor_info.first;
+		c[w] = local_constraint(G, v, w, weight, cache);
+		C += c[w];
+	}
+	weight_t hierarchy_sum = 0;
+	if (n > 1) {
+		for (const auto& neighbor_info : neighbors) {
+			node_t w = neighbor_info.first;
+			hierarchy_sum += c[w] / C * n * log(c[w] / C * n) / (n * log(n));
+		}
+	}
+	return hierarchy_sum;
+}
+
 py::object hierarchy(py::object G, py::object nodes, py::object weight, py::object n_workers) {
-	sum_nmw_rec.clear();
-	max_nmw_rec.clear();
-	local_constraint_rec.clear();
 	std::string weight_key = weight_to_string(weight);
 	if (nodes == py::object()) {
 		nodes = G.attr("nodes");
 	}
 	py::list nodes_list = py::list(nodes);
-
 	Graph& G_ = py::extract<Graph&>(G);
+	std::vector<node_t> ids = nodes_to_ids(G_, nodes_list);
+	const adj_dict_factory& adj = G_.adj;
+	std::vector<double> results(ids.size());
+	parallel_for(ids.size(), workers_to_threads(n_workers, ids.size()), [&](int i, nmw_cache& cache) {
+		results[i] = compute_hierarchy_of_v(adj, ids[i], weight_key, cache);
+	});
 	py::dict hierarchy = py::dict();
-
-	for (int i = 0;i < py::len(nodes_list);i++) {
-		py::object v = nodes_list[i];
-		py::object E = G.attr("ego_subgraph")(v);
-
-		int n = py::len(E) - 1;
-
-		weight_t C = 0;
-		std::map<node_t, weight_t> c;
-		py::list neighbors_of_v = py::list(G.attr("neighbors")(v));
-
-		for (int j = 0;j < py::len(neighbors_of_v);j++) {
-			py::object w = neighbors_of_v[j];
-			node_t v_id = py::extract<node_t>(G_.node_to_id[v]);
-			node_t w_id = py::extract<node_t>(G_.node_to_id[w]);
-			C += local_constraint(G_.adj, v_id, w_id, weight_key);
-			c[w_id] = local_constraint(G_.adj, v_id, w_id, weight_key);
-		}
-		if (n > 1) {
-			weight_t hierarchy_sum = 0;
-			for (int k = 0;k < py::len(neighbors_of_v);k++) {
-				py::object w = neighbors_of_v[k];
-				node_t w_id = py::extract<node_t>(G_.node_to_id[w]);
-				hierarchy_sum += c[w_id] / C * n * log(c[w_id] / C * n) / (n * log(n));
-			}
-			hierarchy[v] = hierarchy_sum;
-		}
-		if (!hierarchy.has_key(v)) {
-			hierarchy[v] = 0;
-		}
+	for (int i = 0;i < ids.size();i++) {
+		hierarchy[nodes_list[i]] = results[i];
 	}
 	return hierarchy;
-}
\ No newline at end of file
+}
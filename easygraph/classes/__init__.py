@@ -1,7 +1,12 @@
+from .columnar import *
+from .coreviews import *
+from .csr import *
 from .directed_graph import DiGraph
 from .directed_multigraph import MultiDiGraph
 from .graph import Graph
 from .graph import GraphC
 from .graphviews import *
+from .journal import *
 from .multigraph import MultiGraph
 from .operation import *
+from .reportviews import *
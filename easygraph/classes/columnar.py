@@ -0,0 +1,389 @@
+"""Graphs storing numeric node and edge attributes in typed NumPy columns."""
+
+from collections.abc import MutableMapping
+from numbers import Integral
+from numbers import Real
+
+from easygraph.classes.directed_graph import DiGraph
+from easygraph.classes.graph import Graph
+
+
+__all__ = ["ColumnarGraph", "ColumnarDiGraph"]
+
+
+class AttrStore:
+    """Typed NumPy columns holding the attributes of many edges (or nodes).
+
+    Every attribute dict handed out by :meth:`new` owns an integer id, which
+    is its row in the columns. Attributes that are not declared as columns,
+    or whose value does not fit the dtype of the column, are kept in a plain
+    dict per id. The id is recycled once its attribute dict is garbage
+    collected, i.e. once the edge (or node) is removed from the graph.
+
+    Parameters
+    ----------
+    dtypes : dict
+        Maps each attribute name stored as a column to its NumPy dtype.
+
+    capacity : int, optional (default : 1024)
+        Initial number of rows of the columns. They grow by doubling.
+
+    """
+
+    __slots__ = ("columns", "present", "extra", "size", "_free")
+
+    def __init__(self, dtypes, capacity=1024):
+        import numpy as np
+
+        self.columns = {
+            key: np.zeros(capacity, dtype=dtype) for key, dtype in dtypes.items()
+        }
+        self.present = {key: np.zeros(capacity, dtype=bool) for key in dtypes}
+        self.extra = {}
+        self.size = 0
+        self._free = []
+
+    def new(self):
+        """Returns an empty attribute dict backed by the columns."""
+        if self._free:
+            return AttrProxy(self, self._free.pop())
+        if self.columns and self.size == len(next(iter(self.present.values()))):
+            self._grow()
+        self.size += 1
+        return AttrProxy(self, self.size - 1)
+
+    def new_many(self, count):
+        """Returns `count` empty attribute dicts with consecutive ids."""
+        start = self.size
+        while self.columns and start + count > len(next(iter(self.present.values()))):
+            self._grow()
+        self.size += count
+        return [AttrProxy(self, i) for i in range(start, start + count)]
+
+    def _grow(self):
+        import numpy as np
+
+        for table in (self.columns, self.present):
+            for key, column in table.items():
+                grown = np.zeros(2 * len(column), dtype=column.dtype)
+                grown[: len(column)] = column
+                table[key] = grown
+
+    def copy(self):
+        """Returns a store with copies of the columns, and the same ids."""
+        store = AttrStore.__new__(AttrStore)
+        store.columns = {key: column.copy() for key, column in self.columns.items()}
+        store.present = {key: present.copy() for key, present in self.present.items()}
+        store.extra = {i: dict(extra) for i, extra in self.extra.items()}
+        store.size = self.size
+        store._free = list(self._free)
+        return store
+
+    def release(self, i):
+        """Frees the row `i`, so that it can be handed out again."""
+        for present in self.present.values():
+            present[i] = False
+        self.extra.pop(i, None)
+        self._free.append(i)
+
+    def accepts(self, key, value):
+        """Whether `value` can be stored in the column `key` without loss."""
+        column = self.columns.get(key)
+        if column is None:
+            return False
+        kind = column.dtype.kind
+        if kind == "b":
+            return isinstance(value, bool)
+        if kind in "iu":
+            return isinstance(value, Integral)
+        return isinstance(value, Real)
+
+    def column(self, key):
+        """Returns read-only views of the values and presence mask of `key`.
+
+        Both arrays are indexed by id and have :attr:`size` rows. They share
+        memory with the store, and are valid until the next row is added.
+        """
+        values = self.columns[key][: self.size]
+        present = self.present[key][: self.size]
+        values.flags.writeable = False
+        present.flags.writeable = False
+        return values, present
+
+    def gather(self, key, ids, default):
+        """Returns the values of `key` for the rows `ids`, `default` if absent."""
+        import numpy as np
+
+        values = self.columns[key][ids]
+        missing = ~self.present[key][ids]
+        if missing.any():
+            values[missing] = default
+            for j in np.flatnonzero(missing) if self.extra else ():
+                # Values not fitting the dtype of the column
+                extra = self.extra.get(int(ids[j]))
+                if extra is not None and key in extra:
+                    values[j] = extra[key]
+        return values
+
+
+class AttrProxy(MutableMapping):
+    """The attribute dict of one edge (or node) of a columnar graph.
+
+    It behaves like a dict, but reads and writes the row `_id` of the columns
+    of its :class:`AttrStore`.
+    """
+
+    __slots__ = ("_store", "_id")
+
+    def __init__(self, store, i):
+        self._store = store
+        self._id = i
+
+    def __getitem__(self, key):
+        store = self._store
+        present = store.present.get(key)
+        if present is not None and present[self._id]:
+            return store.columns[key][self._id].item()
+        extra = store.extra.get(self._id)
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        store = self._store
+        extra = store.extra.get(self._id)
+        if store.accepts(key, value):
+            try:
+                store.columns[key][self._id] = value
+            except OverflowError:
+                pass
+            else:
+                store.present[key][self._id] = True
+                if extra is not None:
+                    extra.pop(key, None)
+                return
+        if key in store.present:
+            store.present[key][self._id] = False
+        if extra is None:
+            extra = store.extra[self._id] = {}
+        extra[key] = value
+
+    def __delitem__(self, key):
+        store = self._store
+        present = store.present.get(key)
+        if present is not None and present[self._id]:
+            present[self._id] = False
+            return
+        extra = store.extra.get(self._id)
+        if extra is None or key not in extra:
+            raise KeyError(key)
+        del extra[key]
+
+    def __iter__(self):
+        store = self._store
+        for key, present in store.present.items():
+            if present[self._id]:
+                yield key
+        extra = store.extra.get(self._id)
+        if extra:
+            yield from list(extra)
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def copy(self):
+        """Returns a plain dict copy of the attributes."""
+        return dict(self)
+
+    __copy__ = copy
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __del__(self):
+        try:
+            self._store.release(self._id)
+        except Exception:
+            # The store may already be gone at interpreter shutdown.
+            pass
+
+
+class _ColumnarMixin:
+    def _init_stores(self, edge_columns, node_columns):
+        if edge_columns is None:
+            edge_columns = {"weight": "float64"}
+        self._edge_store = AttrStore(edge_columns)
+        self._node_store = AttrStore(node_columns or {})
+        # Instance attributes shadow the class level dict factories.
+        self.edge_attr_dict_factory = self._edge_store.new
+        self.node_attr_dict_factory = self._node_store.new
+
+    def copy(self, share_attrs=False):
+        G = super().copy(share_attrs=True)
+        if share_attrs:
+            # The shared attribute dicts keep pointing to the stores of self.
+            G._edge_store = self._edge_store
+            G._node_store = self._node_store
+        else:
+            # The columns are copied as a whole, and each attribute dict is
+            # replaced by a proxy to the same id in the copies.
+            G._edge_store = self._edge_store.copy()
+            G._node_store = self._node_store.copy()
+            nodes = G._node
+            for node, datadict in nodes.items():
+                nodes[node] = AttrProxy(G._node_store, datadict._id)
+            proxies = {}
+            tables = [G._adj, G._pred] if G.is_directed() else [G._adj]
+            for table in tables:
+                for nbrs in table.values():
+                    for v, datadict in nbrs.items():
+                        proxy = proxies.get(datadict._id)
+                        if proxy is None:
+                            proxy = AttrProxy(G._edge_store, datadict._id)
+                            proxies[datadict._id] = proxy
+                        nbrs[v] = proxy
+        G.edge_attr_dict_factory = G._edge_store.new
+        G.node_attr_dict_factory = G._node_store.new
+        return G
+
+    copy.__doc__ = Graph.copy.__doc__
+
+    def _new_edge_attr_dicts(self, columns, count):
+        store = self._edge_store
+        datadicts = store.new_many(count)
+        if not count:
+            return datadicts
+        start = datadicts[0]._id
+        rows = slice(start, start + count)
+        others = {}
+        for key, values in columns.items():
+            column = store.columns.get(key)
+            # Numeric columns are copied as a whole.
+            if (
+                column is not None
+                and values.dtype.kind in "biuf"
+                and (column.dtype.kind == "f" or values.dtype.kind == column.dtype.kind)
+            ):
+                column[rows] = values
+                store.present[key][rows] = True
+            else:
+                others[key] = values
+        if others:
+            keys = list(others)
+            rows = zip(*(values.tolist() for values in others.values()))
+            for datadict, row in zip(datadicts, rows):
+                datadict.update(zip(keys, row))
+        return datadicts
+
+    def edge_attr_column(self, key):
+        """Returns the column of the edge attribute `key`, without copying.
+
+        Parameters
+        ----------
+        key : string
+            An attribute declared in `edge_columns`.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Read-only values indexed by edge id.
+
+        present : numpy.ndarray of bool
+            Read-only mask of the edges having the attribute.
+
+        Notes
+        -----
+        The edge ids of the adjacency entries are given by
+        ``G.csr().edge_ids``, so ``values[G.csr().edge_ids]`` is aligned with
+        the CSR snapshot. The arrays are valid until the graph is modified.
+
+        """
+        return self._edge_store.column(key)
+
+    def node_attr_column(self, key, default=0):
+        """Returns the node attribute `key` as an array aligned with the node index.
+
+        Parameters
+        ----------
+        key : string
+            An attribute declared in `node_columns`.
+
+        default : scalar, optional (default : 0)
+            The value for nodes without the attribute.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            ``values[i]`` is the attribute of the node with index ``i`` in
+            ``G.csr()``.
+
+        """
+        import numpy as np
+
+        ids = np.fromiter(
+            (d._id for d in self._node.values()), np.int64, len(self._node)
+        )
+        return self._node_store.gather(key, ids, default)
+
+
+class ColumnarGraph(_ColumnarMixin, Graph):
+    """An undirected graph storing numeric attributes in typed NumPy columns.
+
+    It has the same interface as :class:`easygraph.Graph`, and ``G[u][v]``
+    still looks like a dict, but the attribute dicts are small proxies into
+    columns indexed by edge (or node) id. Declared numeric attributes cost a
+    few bytes per edge instead of a dict and a Python float, and the CSR
+    snapshot ``G.csr()`` gathers its weights from the column directly.
+
+    Parameters
+    ----------
+    incoming_graph_data : optional (default : None)
+        Data to initialize the graph with, as for :class:`easygraph.Graph`.
+
+    edge_columns : dict, optional (default : {'weight': 'float64'})
+        Maps each edge attribute stored as a column to its NumPy dtype.
+
+    node_columns : dict, optional (default : None)
+        Maps each node attribute stored as a column to its NumPy dtype.
+
+    graph_attr : keywords arguments, optional
+        Attributes to add to graph as key=value pairs.
+
+    Notes
+    -----
+    Values read from a column are converted to the dtype of the column, e.g.
+    an integer weight is reported as a float with the default columns. Values
+    not fitting the column, and undeclared attributes, are kept in a dict.
+
+    Copies of the graph keep the columns of the graph.
+
+    Examples
+    --------
+    >>> G = eg.ColumnarGraph()
+    >>> G.add_edge(1, 2, weight=2.5, color="red")
+    >>> G[1][2]["weight"]
+    2.5
+    >>> values, present = G.edge_attr_column("weight")
+    >>> values[G.csr().edge_ids]
+    array([2.5, 2.5])
+
+    """
+
+    def __init__(
+        self, incoming_graph_data=None, edge_columns=None, node_columns=None, **attr
+    ):
+        self._init_stores(edge_columns, node_columns)
+        super().__init__(incoming_graph_data, **attr)
+
+
+class ColumnarDiGraph(_ColumnarMixin, DiGraph):
+    """A directed graph storing numeric attributes in typed NumPy columns.
+
+    See :class:`ColumnarGraph` for the parameters.
+    """
+
+    def __init__(
+        self, incoming_graph_data=None, edge_columns=None, node_columns=None, **attr
+    ):
+        self._init_stores(edge_columns, node_columns)
+        super().__init__(incoming_graph_data, **attr)
@@ -0,0 +1,244 @@
+"""Read-only mappings standing in for the node and adjacency dicts of a graph."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+__all__ = [
+    "FilterAtlas",
+    "FilterAdjacency",
+    "CSRNodes",
+    "CSRAtlas",
+    "CSRAdjacency",
+    "show_nodes",
+    "no_filter",
+]
+
+
+def no_filter(*items):
+    """A filter accepting everything."""
+    return True
+
+
+class show_nodes:
+    """A node filter accepting the nodes of a given set.
+
+    Filtered mappings recognise it and iterate over the smaller of the set
+    and the filtered dict.
+    """
+
+    __slots__ = ("nodes",)
+
+    def __init__(self, nodes):
+        self.nodes = nodes if isinstance(nodes, (set, frozenset)) else set(nodes)
+
+    def __call__(self, node):
+        return node in self.nodes
+
+
+class FilterAtlas(Mapping):
+    """A read-only view of the items of dict `d` whose key passes `NODE_OK`.
+
+    It is used for the node dict of subgraph views and for the neighbor dicts
+    of :class:`FilterAdjacency`. Nothing is copied, so the view follows the
+    changes of `d`.
+    """
+
+    __slots__ = ("_atlas", "NODE_OK")
+
+    def __init__(self, d, NODE_OK):
+        self._atlas = d
+        self.NODE_OK = NODE_OK
+
+    def __len__(self):
+        return sum(1 for n in self)
+
+    def __iter__(self):
+        node_ok = self.NODE_OK
+        nodes = getattr(node_ok, "nodes", None)
+        if nodes is not None and len(nodes) < len(self._atlas):
+            return (n for n in nodes if n in self._atlas)
+        return (n for n in self._atlas if node_ok(n))
+
+    def __getitem__(self, key):
+        if key in self._atlas and self.NODE_OK(key):
+            return self._atlas[key]
+        raise KeyError(f"Key {key} not found")
+
+    def __contains__(self, key):
+        try:
+            return key in self._atlas and self.NODE_OK(key)
+        except TypeError:
+            return False
+
+    def copy(self):
+        return {n: self._atlas[n] for n in self}
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.copy())
+
+
+class FilterAdjacency(Mapping):
+    """A read-only view of an adjacency dict, filtered by nodes and edges.
+
+    ``view[u]`` is a :class:`FilterAtlas` of the neighbors `v` of `u` with
+    ``NODE_OK(v)`` and ``EDGE_OK(u, v)``.
+    """
+
+    __slots__ = ("_atlas", "NODE_OK", "EDGE_OK")
+
+    def __init__(self, d, NODE_OK, EDGE_OK):
+        self._atlas = d
+        self.NODE_OK = NODE_OK
+        self.EDGE_OK = EDGE_OK
+
+    def __len__(self):
+        return sum(1 for n in self)
+
+    def __iter__(self):
+        return FilterAtlas.__iter__(self)
+
+    def __getitem__(self, node):
+        if node in self._atlas and self.NODE_OK(node):
+            if self.EDGE_OK is no_filter:
+                return FilterAtlas(self._atlas[node], self.NODE_OK)
+
+            node_ok, edge_ok = self.NODE_OK, self.EDGE_OK
+
+            def new_node_ok(nbr):
+                return node_ok(nbr) and edge_ok(node, nbr)
+
+            return FilterAtlas(self._atlas[node], new_node_ok)
+        raise KeyError(f"Key {node} not found")
+
+    def __contains__(self, node):
+        return FilterAtlas.__contains__(self, node)
+
+    def copy(self):
+        return {u: self[u].copy() for u in self}
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.copy())
+
+
+class CSRNodes(Mapping):
+    """A read-only node dict over the nodes of a CSR snapshot.
+
+    The snapshot does not keep node attributes, so every node maps to an
+    empty attribute dict.
+    """
+
+    __slots__ = ("_csr",)
+
+    _EMPTY = MappingProxyType({})
+
+    def __init__(self, csr):
+        self._csr = csr
+
+    def __len__(self):
+        return len(self._csr.nodes)
+
+    def __iter__(self):
+        return iter(self._csr.nodes)
+
+    def __getitem__(self, node):
+        if node in self._csr.node_index:
+            return self._EMPTY
+        raise KeyError(f"Key {node} not found")
+
+    def __contains__(self, node):
+        try:
+            return node in self._csr.node_index
+        except TypeError:
+            return False
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._csr.nodes)
+
+
+class CSRAtlas(Mapping):
+    """A read-only neighbor dict of one row of a CSR snapshot.
+
+    ``atlas[v]`` is the attribute dict ``{weight: w}`` of the edge to `v`,
+    where `weight` is the weight key the snapshot was built with.
+    """
+
+    __slots__ = ("_weights", "_key")
+
+    def __init__(self, weights, key):
+        self._weights = weights
+        self._key = key
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __iter__(self):
+        return iter(self._weights)
+
+    def __getitem__(self, nbr):
+        w = self._weights[nbr]
+        return {} if self._key is None else {self._key: w}
+
+    def __contains__(self, nbr):
+        try:
+            return nbr in self._weights
+        except TypeError:
+            return False
+
+    def copy(self):
+        return {nbr: self[nbr] for nbr in self}
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.copy())
+
+
+class CSRAdjacency(Mapping):
+    """A read-only adjacency dict reading the arrays of a CSR snapshot.
+
+    Rows are decoded into :class:`CSRAtlas` objects on access, and the most
+    recently used ones are kept, so that the snapshot arrays, e.g. mapped
+    from shared memory, are never copied as a whole.
+
+    Parameters
+    ----------
+    csr : easygraph.CSRGraph
+
+    maxrows : int, optional (default : 4096)
+        The number of decoded rows kept.
+
+    """
+
+    __slots__ = ("_csr", "_rows", "_maxrows")
+
+    def __init__(self, csr, maxrows=4096):
+        self._csr = csr
+        self._rows = {}
+        self._maxrows = maxrows
+
+    def __len__(self):
+        return len(self._csr.nodes)
+
+    def __iter__(self):
+        return iter(self._csr.nodes)
+
+    def __contains__(self, node):
+        return CSRNodes.__contains__(self, node)
+
+    def __getitem__(self, node):
+        rows = self._rows
+        atlas = rows.pop(node, None)
+        if atlas is None:
+            csr = self._csr
+            i = csr.node_index[node]
+            start, stop = int(csr.indptr[i]), int(csr.indptr[i + 1])
+            nodes = csr.nodes
+            nbrs = [nodes[j] for j in csr.indices[start:stop].tolist()]
+            weights = dict(zip(nbrs, csr.weights[start:stop].tolist()))
+            atlas = CSRAtlas(weights, csr.weight)
+            if len(rows) >= self._maxrows:
+                del rows[next(iter(rows))]
+        rows[node] = atlas
+        return atlas
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._csr)
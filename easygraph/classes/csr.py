@@ -0,0 +1,431 @@
+"""Compressed sparse row (CSR) snapshots of EasyGraph graphs."""
+
+__all__ = ["CSRGraph", "SharedCSRGraph"]
+
+
+class CSRGraph:
+    """A read-only compressed sparse row (CSR) snapshot of a graph.
+
+    Nodes are numbered ``0 .. n-1`` in the iteration order of the graph.
+    The neighbors of the node with index ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]``, and the corresponding edge weights
+    are ``weights[indptr[i]:indptr[i + 1]]``. Undirected edges are stored in
+    both directions, directed edges only from the source node.
+
+    Do not build it directly, use :meth:`easygraph.Graph.csr` which caches the
+    snapshot until the graph is modified.
+
+    Attributes
+    ----------
+    indptr : numpy.ndarray of int64
+        Row pointer array of length ``n + 1``.
+
+    indices : numpy.ndarray of int32 or int64
+        Column (neighbor) indices of every stored edge.
+
+    weights : numpy.ndarray of float64
+        Weight of every stored edge. It is 1 for edges without the weight key.
+
+    nodes : list
+        The node of each index.
+
+    node_index : dict
+        The index of each node.
+
+    directed : bool
+        Whether the snapshot was taken from a directed graph.
+
+    weight : string or None
+        The weight key used to fill `weights`.
+
+    edge_ids : numpy.ndarray of int64 or None
+        For columnar graphs, the edge id of every stored edge, which indexes
+        the columns returned by ``G.edge_attr_column``. None otherwise.
+
+    """
+
+    __slots__ = (
+        "indptr",
+        "indices",
+        "weights",
+        "nodes",
+        "node_index",
+        "directed",
+        "weight",
+        "edge_ids",
+    )
+
+    def __init__(
+        self,
+        indptr,
+        indices,
+        weights,
+        nodes,
+        node_index,
+        directed=False,
+        weight=None,
+        edge_ids=None,
+    ):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.nodes = nodes
+        self.node_index = node_index
+        self.directed = directed
+        self.weight = weight
+        self.edge_ids = edge_ids
+
+    @classmethod
+    def from_graph(cls, G, weight="weight"):
+        """Builds the CSR snapshot of `G`.
+
+        Parameters
+        ----------
+        G : easygraph.Graph, easygraph.DiGraph or their multigraph variants
+
+        weight : string or None, optional (default : 'weight')
+            The edge attribute used as weight. If None, every weight is 1.
+            The weights of parallel edges in multigraphs are summed.
+
+        Returns
+        -------
+        csr : CSRGraph
+
+        """
+        import numpy as np
+
+        adj = G.adj
+        nodes = list(adj)
+        n = len(nodes)
+        node_index = dict(zip(nodes, range(n)))
+
+        degrees = np.fromiter((len(nbrs) for nbrs in adj.values()), np.int64, n)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        nnz = int(indptr[-1])
+
+        index_dtype = np.int32 if n < 2**31 else np.int64
+        indices = np.fromiter(
+            (node_index[v] for nbrs in adj.values() for v in nbrs), index_dtype, nnz
+        )
+        store = getattr(G, "_edge_store", None)
+        edge_ids = None
+        if store is not None:
+            edge_ids = np.fromiter(
+                (d._id for nbrs in adj.values() for d in nbrs.values()), np.int64, nnz
+            )
+        if weight is None:
+            weights = np.ones(nnz, dtype=np.float64)
+        elif store is not None and weight in store.columns:
+            weights = _column_weights(store, weight, edge_ids)
+        elif G.is_multigraph():
+            weights = np.fromiter(
+                (
+                    sum(d.get(weight, 1) for d in keydict.values())
+                    for nbrs in adj.values()
+                    for keydict in nbrs.values()
+                ),
+                np.float64,
+                nnz,
+            )
+        else:
+            weights = np.fromiter(
+                (d.get(weight, 1) for nbrs in adj.values() for d in nbrs.values()),
+                np.float64,
+                nnz,
+            )
+
+        # The snapshot is shared by every caller until the graph changes.
+        for array in (indptr, indices, weights, edge_ids):
+            if array is not None:
+                array.flags.writeable = False
+        return cls(
+            indptr,
+            indices,
+            weights,
+            nodes,
+            node_index,
+            directed=G.is_directed(),
+            weight=weight,
+            edge_ids=edge_ids,
+        )
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def nnz(self):
+        """The number of stored (directed) edge entries."""
+        return len(self.indices)
+
+    def neighbors(self, index):
+        """Returns the neighbor indices of the node with index `index`."""
+        return self.indices[self.indptr[index] : self.indptr[index + 1]]
+
+    def neighbor_weights(self, index):
+        """Returns the edge weights to the neighbors of the node with index `index`."""
+        return self.weights[self.indptr[index] : self.indptr[index + 1]]
+
+    def to_scipy(self):
+        """Returns the weighted adjacency matrix as a SciPy CSR matrix.
+
+        Entry ``(i, j)`` is the weight of the edge from the node with index
+        `i` to the node with index `j`. The matrix shares the read-only
+        arrays of the snapshot.
+        """
+        from scipy.sparse import csr_matrix
+
+        n = len(self.nodes)
+        return csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n))
+
+    def transpose(self):
+        """Returns the snapshot of the reversed graph.
+
+        For directed graphs, row ``i`` of the result lists the predecessors of
+        the node with index ``i``. Undirected snapshots are returned as is.
+        """
+        import numpy as np
+
+        if not self.directed:
+            return self
+        n = len(self.nodes)
+        rows = np.repeat(np.arange(n, dtype=self.indices.dtype), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=n), out=indptr[1:])
+        arrays = [indptr, rows[order], self.weights[order]]
+        if self.edge_ids is not None:
+            arrays.append(self.edge_ids[order])
+        else:
+            arrays.append(None)
+        for array in arrays:
+            if array is not None:
+                array.flags.writeable = False
+        return self.__class__(
+            arrays[0],
+            arrays[1],
+            arrays[2],
+            self.nodes,
+            self.node_index,
+            directed=True,
+            weight=self.weight,
+            edge_ids=arrays[3],
+        )
+
+    def share(self):
+        """Copies the arrays of the snapshot into shared memory.
+
+        Returns
+        -------
+        shared : SharedCSRGraph
+            The owner of the shared memory blocks. Its picklable `handle`
+            lets other processes attach to the arrays without copying them.
+
+        See Also
+        --------
+        SharedCSRGraph
+
+        """
+        return SharedCSRGraph(self)
+
+    def __repr__(self):
+        return "{}(nodes={}, nnz={}, directed={}, weight={!r})".format(
+            self.__class__.__name__, len(self), self.nnz, self.directed, self.weight
+        )
+
+
+class SharedCSRGraph:
+    """A CSR snapshot whose arrays live in shared memory blocks.
+
+    Worker processes receive the small picklable :attr:`handle` and call
+    ``handle.attach()``, which maps the blocks into NumPy arrays without
+    copying them, so that the graph is stored once however many workers read
+    it. The node list is pickled into a block as well, and unpickled once per
+    attaching process.
+
+    The process creating it owns the blocks, and releases them with
+    :meth:`close`, or when leaving the ``with`` block.
+
+    Parameters
+    ----------
+    csr : CSRGraph
+        The snapshot to share. For directed graphs, the transposed snapshot
+        is shared as well, so that workers can walk the predecessors.
+
+    Examples
+    --------
+    >>> with G.csr().share() as shared:
+    ...     handle = shared.handle  # Send it to the workers
+    ...     csr, pred = handle.attach()
+
+    """
+
+    _ARRAYS = ("indptr", "indices", "weights")
+
+    def __init__(self, csr):
+        import pickle
+
+        from multiprocessing import shared_memory
+
+        import numpy as np
+
+        self._blocks = []
+        specs = []
+        try:
+            for snapshot in (csr, csr.transpose()) if csr.directed else (csr,):
+                spec = {}
+                for name in self._ARRAYS:
+                    array = getattr(snapshot, name)
+                    block = shared_memory.SharedMemory(
+                        create=True, size=max(array.nbytes, 1)
+                    )
+                    self._blocks.append(block)
+                    np.ndarray(array.shape, array.dtype, buffer=block.buf)[:] = array
+                    spec[name] = (block.name, array.shape, array.dtype.str)
+                specs.append(spec)
+            nodes = pickle.dumps(csr.nodes, protocol=pickle.HIGHEST_PROTOCOL)
+            self._blocks.append(_share_bytes(nodes))
+        except BaseException:
+            self.close()
+            raise
+        self.handle = SharedCSRHandle(
+            specs, (self._blocks[-1].name, len(nodes)), csr.directed, csr.weight
+        )
+
+    def close(self):
+        """Releases the shared memory blocks."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, "_blocks"):
+            self.close()
+
+
+class SharedCSRHandle:
+    """The picklable reference to a :class:`SharedCSRGraph`."""
+
+    __slots__ = ("specs", "nodes", "directed", "weight", "_attached")
+
+    def __init__(self, specs, nodes, directed, weight):
+        self.specs = specs
+        self.nodes = nodes
+        self.directed = directed
+        self.weight = weight
+        self._attached = None
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.specs, self.nodes, self.directed, self.weight),
+        )
+
+    def attach(self):
+        """Maps the shared arrays into read-only CSR snapshots.
+
+        Returns
+        -------
+        csr : CSRGraph
+            The shared snapshot.
+
+        pred : CSRGraph or None
+            The transposed snapshot for directed graphs, None otherwise.
+
+        """
+        import pickle
+
+        from multiprocessing import shared_memory
+
+        import numpy as np
+
+        if self._attached is not None:
+            return self._attached[1:]
+        nodes = pickle.loads(_load_bytes(*self.nodes))
+        node_index = dict(zip(nodes, range(len(nodes))))
+        blocks = []
+        snapshots = []
+        for spec in self.specs:
+            arrays = []
+            for name in SharedCSRGraph._ARRAYS:
+                block_name, shape, dtype = spec[name]
+                block = shared_memory.SharedMemory(name=block_name)
+                blocks.append(block)
+                array = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+                array.flags.writeable = False
+                arrays.append(array)
+            snapshots.append(
+                CSRGraph(
+                    *arrays,
+                    nodes,
+                    node_index,
+                    directed=self.directed,
+                    weight=self.weight,
+                )
+            )
+        # The blocks must outlive the arrays mapping them.
+        self._attached = (blocks, snapshots[0], snapshots[1] if self.directed else None)
+        return self._attached[1:]
+
+    def detach(self):
+        """Unmaps the shared arrays, which must no longer be referenced."""
+        if self._attached is None:
+            return
+        blocks = self._attached[0]
+        self._attached = None
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                # Still mapped by an array, released with it.
+                pass
+
+
+def _column_weights(store, weight, edge_ids):
+    """The weights of the entries `edge_ids`, read from a column of `store`.
+
+    If the entries are consecutive rows of a float64 column, which all have
+    the weight, e.g. for directed edges added in order of their source, the
+    weights are a view of the column. Otherwise they are gathered from it,
+    without Python floats.
+    """
+    import numpy as np
+
+    values, present = store.column(weight)
+    if len(edge_ids) and values.dtype == np.float64:
+        start = int(edge_ids[0])
+        stop = start + len(edge_ids)
+        if (
+            int(edge_ids[-1]) == stop - 1
+            and (np.diff(edge_ids) == 1).all()
+            and present[start:stop].all()
+        ):
+            return values[start:stop]
+    return store.gather(weight, edge_ids, 1).astype(np.float64, copy=False)
+
+
+def _share_bytes(data):
+    """Copies `data` into a new shared memory block, owned by the caller."""
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    block.buf[: len(data)] = data
+    return block
+
+
+def _load_bytes(name, size):
+    """Returns a copy of the first `size` bytes of the shared memory block `name`."""
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(block.buf[:size])
+    finally:
+        block.close()
@@ -4,8 +4,18 @@ from typing import List
 
 import easygraph.convert as convert
 
+from easygraph.classes.coreviews import show_nodes
 from easygraph.classes.graph import Graph
+from easygraph.classes.graph import _attr_dict_copier
+from easygraph.classes.graph import _fill_adjacency
+from easygraph.classes.graph import _object_array
+from easygraph.classes.graph import _prepare_edge_arrays
+from easygraph.classes.graph import _record_new_edges
+from easygraph.classes.graphviews import subgraph_view
+from easygraph.classes.reportviews import DegreeView
+from easygraph.classes.reportviews import OutEdgeView
 from easygraph.utils.exception import EasyGraphError
+from easygraph.utils.misc import gc_paused
 
 
 class DiGraph(Graph):
@@ -66,6 +76,9 @@ class DiGraph(Graph):
         self._node = self.node_dict_factory()
         self._adj = self.adjlist_outer_dict_factory()
         self._pred = self.adjlist_outer_dict_factory()
+        self._cache = {}
+        self._version = 0
+        self._journal = None
         self.cflag = 0
         if incoming_graph_data is not None:
             convert.to_easygraph_graph(incoming_graph_data, create_using=self)
@@ -98,11 +111,13 @@ class DiGraph(Graph):
 
     @property
     def edges(self):
-        edges = list()
-        for u in self._adj:
-            for v in self._adj[u]:
-                edges.append((u, v, self._adj[u][v]))
-        return edges
+        """A lazy view of the edges, reporting ``(u, v, data)`` for each edge.
+
+        See Also
+        --------
+        easygraph.classes.reportviews.OutEdgeView
+        """
+        return OutEdgeView(self)
 
     @property
     def name(self):
@@ -123,18 +138,25 @@ class DiGraph(Graph):
 
         Parameters
         ----------
-        weight : string, optional (default : 'weight')
+        weight : string or None, optional (default : 'weight')
             Weight key of the original weighted graph.
+            If None, the number of edges is returned.
 
         Returns
         -------
-        out_degree : dict
-            Each node's (key) weighted out degree (value).
+        out_degree : DegreeView
+            Read-only mapping of each node's (key) weighted out degree (value).
 
         Notes
         -----
         If the graph is not weighted, all the weights will be regarded as 1.
 
+        The degrees are cached per weight key, and dropped by every method
+        that modifies the graph and by `set_edge_attributes`. Weights written
+        into ``G[u][v]`` directly are not detected. The returned view shares
+        the cache, so it is read-only: assigning to it raises TypeError, use
+        ``dict(...)`` for a mutable copy.
+
         See Also
         --------
         in_degree
@@ -146,37 +168,41 @@ class DiGraph(Graph):
         >>> G.out_degree(weight='weight')
 
         """
-        degree = dict()
-        for u, v, d in self.edges:
-            if u in degree:
-                degree[u] += d.get(weight, 1)
-            else:
-                degree[u] = d.get(weight, 1)
-
-        # For isolated nodes
-        for node in self.nodes:
-            if node not in degree:
-                degree[node] = 0
-
-        return degree
+        key = ("out_degree", weight)
+        if key not in self._cache:
+            degree = dict()
+            for u, nbrs in self._adj.items():
+                if weight is None:
+                    degree[u] = len(nbrs)
+                else:
+                    degree[u] = sum(d.get(weight, 1) for d in nbrs.values())
+            self._cache[key] = degree
+        return DegreeView(self._cache[key])
 
     def in_degree(self, weight="weight"):
         """Returns the weighted in degree of each node.
 
         Parameters
         ----------
-        weight : string, optional (default : 'weight')
+        weight : string or None, optional (default : 'weight')
             Weight key of the original weighted graph.
+            If None, the number of edges is returned.
 
         Returns
         -------
-        in_degree : dict
-            Each node's (key) weighted in degree (value).
+        in_degree : DegreeView
+            Read-only mapping of each node's (key) weighted in degree (value).
 
         Notes
         -----
         If the graph is not weighted, all the weights will be regarded as 1.
 
+        The degrees are cached per weight key, and dropped by every method
+        that modifies the graph and by `set_edge_attributes`. Weights written
+        into ``G[u][v]`` directly are not detected. The returned view shares
+        the cache, so it is read-only: assigning to it raises TypeError, use
+        ``dict(...)`` for a mutable copy.
+
         See Also
         --------
         out_degree
@@ -188,38 +214,42 @@ class DiGraph(Graph):
         >>> G.in_degree(weight='weight')
 
         """
-        degree = dict()
-        for u, v, d in self.edges:
-            if v in degree:
-                degree[v] += d.get(weight, 1)
-            else:
-                degree[v] = d.get(weight, 1)
-
-        # For isolated nodes
-        for node in self.nodes:
-            if node not in degree:
-                degree[node] = 0
-
-        return degree
+        key = ("in_degree", weight)
+        if key not in self._cache:
+            degree = dict()
+            for v, preds in self._pred.items():
+                if weight is None:
+                    degree[v] = len(preds)
+                else:
+                    degree[v] = sum(d.get(weight, 1) for d in preds.values())
+            self._cache[key] = degree
+        return DegreeView(self._cache[key])
 
     def degree(self, weight="weight"):
         """Returns the weighted degree of each node, i.e. sum of out/in degree.
 
         Parameters
         ----------
-        weight : string, optional (default : 'weight')
+        weight : string or None, optional (default : 'weight')
             Weight key of the original weighted graph.
+            If None, the number of edges is returned.
 
         Returns
         -------
-        degree : dict
-            Each node's (key) weighted in degree (value).
+        degree : DegreeView
+            Read-only mapping of each node's (key) weighted degree (value).
             For directed graph, it returns the sum of out degree and in degree.
 
         Notes
         -----
         If the graph is not weighted, all the weights will be regarded as 1.
 
+        The degrees are cached per weight key, and dropped by every method
+        that modifies the graph and by `set_edge_attributes`. Weights written
+        into ``G[u][v]`` directly are not detected. The returned view shares
+        the cache, so it is read-only: assigning to it raises TypeError, use
+        ``dict(...)`` for a mutable copy.
+
         See also
         --------
         out_degree
@@ -236,12 +266,12 @@ class DiGraph(Graph):
         >>> G.degree(weight='weight_1')
 
         """
-        degree = dict()
-        outdegree = self.out_degree(weight=weight)
-        indegree = self.in_degree(weight=weight)
-        for u in outdegree:
-            degree[u] = outdegree[u] + indegree[u]
-        return degree
+        key = ("degree", weight)
+        if key not in self._cache:
+            outdegree = self.out_degree(weight=weight)
+            indegree = self.in_degree(weight=weight)
+            self._cache[key] = {u: outdegree[u] + indegree[u] for u in outdegree}
+        return DegreeView(self._cache[key])
 
     def size(self, weight=None):
         """Returns the number of edges or total of all edge weights.
@@ -269,8 +299,9 @@ class DiGraph(Graph):
         >>> G.size(weight='weight')
 
         """
-        s = sum(d for v, d in self.out_degree(weight=weight).items())
-        return int(s) if weight is None else s
+        if weight is None:
+            return len(self.edges)
+        return sum(self.out_degree(weight=weight).values())
 
     def number_of_edges(self, u=None, v=None):
         """Returns the number of edges between two nodes.
@@ -609,6 +640,8 @@ class DiGraph(Graph):
         11
 
         """
+        self._clear_cache()
+        journal = self._journal
         for n in nodes_for_adding:
             try:
                 newnode = n not in self._node
@@ -624,9 +657,12 @@ class DiGraph(Graph):
                 self._adj[n] = self.adjlist_inner_dict_factory()
                 self._pred[n] = self.adjlist_inner_dict_factory()
                 self._node[n] = self.node_attr_dict_factory()
+                if journal is not None:
+                    journal.record(self._version, "add_node", n)
             self._node[n].update(newdict)
 
     def _add_one_node(self, one_node_for_adding, node_attr: dict = {}):
+        self._clear_cache()
         node = one_node_for_adding
         if node not in self._node:
             self._adj[node] = self.adjlist_inner_dict_factory()
@@ -634,6 +670,7 @@ class DiGraph(Graph):
 
             attr_dict = self._node[node] = self.node_attr_dict_factory()
             attr_dict.update(node_attr)
+            self._record("add_node", node)
         else:  # If already exists, there is no complain and still updating the node attribute
             self._node[node].update(node_attr)
 
@@ -767,6 +804,8 @@ class DiGraph(Graph):
         >>> G.add_edges_from([(1, 2), (2, 3)], weight=3)
         >>> G.add_edges_from([(3, 4), (1, 4)], label="WN2898")
         """
+        self._clear_cache()
+        journal = self._journal
         for e in ebunch_to_add:
             ne = len(e)
             if ne == 3:
@@ -782,19 +821,77 @@ class DiGraph(Graph):
                 self._adj[u] = self.adjlist_inner_dict_factory()
                 self._pred[u] = self.adjlist_inner_dict_factory()
                 self._node[u] = self.node_attr_dict_factory()
+                if journal is not None:
+                    journal.record(self._version, "add_node", u)
             if v not in self._adj:
                 if v is None:
                     raise ValueError("None cannot be a node")
                 self._adj[v] = self.adjlist_inner_dict_factory()
                 self._pred[v] = self.adjlist_inner_dict_factory()
                 self._node[v] = self.node_attr_dict_factory()
+                if journal is not None:
+                    journal.record(self._version, "add_node", v)
+            if journal is not None and v not in self._adj[u]:
+                journal.record(self._version, "add_edge", u, v)
             datadict = self._adj[u].get(v, self.edge_attr_dict_factory())
             datadict.update(attr)
             datadict.update(dd)
             self._adj[u][v] = datadict
             self._pred[v][u] = datadict
 
-    def add_edges_from_file(self, file, weighted=False):
+    def add_edges_from_arrays(self, src, dst, weights=None, weight="weight", **attr):
+        """Add the edges given as arrays of endpoints, in a vectorized pass.
+
+        It is equivalent to adding ``(src[i], dst[i])`` for each `i`, with the
+        attributes in row `i` of the columns, but the endpoints are encoded,
+        deduplicated and grouped by node with NumPy, and each adjacency dict is
+        filled in one call. Use it to load large edge lists.
+
+        Parameters
+        ----------
+        src, dst : array_like
+            The source and target of each edge. NumPy int, string or object
+            arrays, or lists.
+
+        weights : array_like, optional (default : None)
+            The weight of each edge, stored under the key `weight`.
+
+        weight : string, optional (default : 'weight')
+            The key of `weights`.
+
+        attr : keyword arguments of array_like, optional
+            Other attribute columns, one value per edge.
+
+        Notes
+        -----
+        For duplicated edges, the attributes of the last occurrence are kept.
+
+        See Also
+        --------
+        add_edges
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = eg.DiGraph()
+        >>> G.add_edges_from_arrays(np.array([0, 1, 2]), np.array([1, 2, 0]),
+        ...                         weights=np.array([0.5, 1.5, 2.0]))
+        >>> G[2][0]
+        {'weight': 2.0}
+
+        """
+        self._clear_cache()
+        with gc_paused():
+            nodes, u, v, datadicts = _prepare_edge_arrays(
+                self, src, dst, weights, weight, attr
+            )
+            _record_new_edges(self, nodes, u, v)
+            nodes = _object_array(nodes)
+            datadicts = _object_array(datadicts)
+            _fill_adjacency(self._adj, nodes, u, v, datadicts)
+            _fill_adjacency(self._pred, nodes, v, u, datadicts)
+
+    def add_edges_from_file(self, file, weighted=False, chunk_size=1 << 24):
         """Added edges from file
         For example, txt files,
 
@@ -805,12 +902,24 @@ class DiGraph(Graph):
         Parameters
         ----------
         file : string
-            The file path.
+            The file path. Files ending in ``.gz``, ``.gzip``, ``.bz2`` and ``.xz``
+            are decompressed on the fly.
 
         weighted : boolean, optional (default : False)
             If the file consists of weight information, set `True`.
             The weight key will be set as 'weight'.
 
+        chunk_size : int, optional (default : 16M)
+            Approximate number of characters parsed and added at a time,
+            which bounds the memory used by the reader.
+
+        Returns
+        -------
+        malformed : int
+            The number of skipped lines, which have too few fields or a weight
+            which is not a number. Blank lines and lines starting with '#' are
+            ignored.
+
         Examples
         --------
 
@@ -825,31 +934,31 @@ class DiGraph(Graph):
         Then add them to *G*
 
         >>> G.add_edges_from_file(file='./club_network.txt', weighted=True)
+        0
 
+        See Also
+        --------
+        easygraph.read_edgelist_chunks
 
         """
-        import re
-
-        with open(file, "r") as fp:
-            edges = fp.readlines()
-        if weighted:
-            for edge in edges:
-                edge = re.sub(",", " ", edge)
-                edge = edge.split()
-                try:
-                    self.add_edge(edge[0], edge[1], weight=float(edge[2]))
-                except:
-                    pass
-        else:
-            for edge in edges:
-                edge = re.sub(",", " ", edge)
-                edge = edge.split()
-                try:
-                    self.add_edge(edge[0], edge[1])
-                except:
-                    pass
+        import warnings
+
+        from easygraph.readwrite.edgelist import read_edgelist_chunks
+
+        malformed = 0
+        for src, dst, weights, bad in read_edgelist_chunks(
+            file, weighted=weighted, chunk_size=chunk_size
+        ):
+            self.add_edges_from_arrays(src, dst, weights=weights)
+            malformed += bad
+        if malformed:
+            warnings.warn(
+                "{} malformed lines in {} were skipped.".format(malformed, file)
+            )
+        return malformed
 
     def _add_one_edge(self, u_of_edge, v_of_edge, edge_attr: dict = {}):
+        self._clear_cache()
         u, v = u_of_edge, v_of_edge
         # add nodes
         if u not in self._node:
@@ -857,6 +966,8 @@ class DiGraph(Graph):
         if v not in self._node:
             self._add_one_node(v)
         # add the edge
+        if v not in self._adj[u]:
+            self._record("add_edge", u, v)
         datadict = self._adj[u].get(v, self.edge_attr_dict_factory())
         datadict.update(edge_attr)
         self._adj[u][v] = datadict
@@ -881,6 +992,7 @@ class DiGraph(Graph):
         >>> G.remove_node('Jack')
 
         """
+        self._clear_cache()
         try:
             succs = list(self._adj[node_to_remove])
             preds = list(self._pred[node_to_remove])
@@ -888,13 +1000,17 @@ class DiGraph(Graph):
         except KeyError:  # Node not exists in self
             raise KeyError("No node {} in graph.".format(node_to_remove))
         for succ in succs:  # Remove edges start with node_to_remove
+            self._record_edges("remove_edge", node_to_remove, succ)
             del self._pred[succ][node_to_remove]
         for pred in preds:  # Remove edges end with node_to_remove
+            if pred != node_to_remove:
+                self._record_edges("remove_edge", pred, node_to_remove)
             del self._adj[pred][node_to_remove]
 
         # Remove this node
         del self._adj[node_to_remove]
         del self._pred[node_to_remove]
+        self._record("remove_node", node_to_remove)
 
     def remove_nodes(self, nodes_to_remove: list):
         """Remove nodes from your graph.
@@ -946,11 +1062,13 @@ class DiGraph(Graph):
         >>> G.remove_edge(1,2)
 
         """
+        self._clear_cache()
         try:
             del self._adj[u][v]
             del self._pred[v][u]
         except KeyError:
             raise KeyError("No edge {}-{} in graph.".format(u, v))
+        self._record("remove_edge", u, v)
 
     def remove_edges(self, edges_to_remove: [tuple]):
         """Remove a list of edges from your graph.
@@ -976,7 +1094,8 @@ class DiGraph(Graph):
         ... ])
 
         """
-        for edge in edges_to_remove:
+        # Materialize first, edges_to_remove may be a view of G.edges
+        for edge in list(edges_to_remove):
             u, v = edge[:2]
             self.remove_edge(u, v)
 
@@ -1006,11 +1125,15 @@ class DiGraph(Graph):
         >>> ebunch = [(1, 2), (2, 3)]
         >>> G.remove_edges_from(ebunch)
         """
+        # Materialize first, ebunch may be a view of G.edges
+        ebunch = list(ebunch)
+        self._clear_cache()
         for e in ebunch:
             u, v = e[:2]  # ignore edge data
             if u in self._adj and v in self._adj[u]:
                 del self._adj[u][v]
                 del self._pred[v][u]
+                self._record("remove_edge", u, v)
 
     def has_node(self, node):
         return node in self._node
@@ -1038,9 +1161,22 @@ class DiGraph(Graph):
         """Returns True if graph is a multigraph, False otherwise."""
         return False
 
-    def copy(self):
+    def copy(self, share_attrs=False):
         """Return a deep copy of the graph.
 
+        The dicts are cloned level by level, without going through the
+        insertion logic of ``add_node`` and ``add_edge``.
+
+        Parameters
+        ----------
+        share_attrs : bool, optional (default : False)
+            If True, only the adjacency structure is copied, and the node and
+            edge attribute dicts are shared with the original graph. Adding or
+            removing nodes and edges on one graph does not affect the other,
+            but changing an attribute does. It is several times faster and
+            uses less memory, which suits algorithms that repeatedly copy a
+            graph to remove parts of it.
+
         Returns
         -------
         copy : easygraph.DiGraph
@@ -1052,15 +1188,31 @@ class DiGraph(Graph):
 
         >>> G2 = G1.copy()
 
+        *G3* shares the attributes of *G1*
+
+        >>> G3 = G1.copy(share_attrs=True)
+
         """
         G = self.__class__()
         G.graph.update(self.graph)
-        for node, node_attr in self._node.items():
-            G.add_node(node, **node_attr)
-        for u, nbrs in self._adj.items():
-            for v, edge_data in nbrs.items():
-                G.add_edge(u, v, **edge_data)
-
+        with gc_paused():
+            if share_attrs:
+                G._node.update(self._node)
+                G._adj.update((u, nbrs.copy()) for u, nbrs in self._adj.items())
+                G._pred.update((v, preds.copy()) for v, preds in self._pred.items())
+                return G
+
+            copy_node_attr = _attr_dict_copier(G.node_attr_dict_factory)
+            copy_edge_attr = _attr_dict_copier(G.edge_attr_dict_factory)
+            G._node.update((n, copy_node_attr(d)) for n, d in self._node.items())
+            succ = G._adj
+            succ.update(
+                (u, {v: copy_edge_attr(d) for v, d in nbrs.items()})
+                for u, nbrs in self._adj.items()
+            )
+            G._pred.update(
+                (v, {u: succ[u][v] for u in preds}) for v, preds in self._pred.items()
+            )
         return G
 
     def nodes_subgraph(self, from_nodes: list):
@@ -1086,6 +1238,7 @@ class DiGraph(Graph):
         """
         G = self.__class__()
         G.graph.update(self.graph)
+        nodes = set(from_nodes)
         for node in from_nodes:
             try:
                 G.add_node(node, **self._node[node])
@@ -1093,13 +1246,46 @@ class DiGraph(Graph):
                 pass
 
             # Edge
-            from_nodes = set(from_nodes)
             for v, edge_data in self._adj[node].items():
-                if v in from_nodes:
+                if v in nodes:
                     G.add_edge(node, v, **edge_data)
         return G
 
-    def ego_subgraph(self, center):
+    def subgraph(self, nodes):
+        """Returns a read-only view of the subgraph induced on `nodes`.
+
+        Unlike :meth:`nodes_subgraph`, nothing is copied: the view filters
+        the adjacency of the graph while it is read, and reflects later
+        changes of the graph. It can be passed to any algorithm, but it
+        cannot be modified; use ``G.subgraph(nodes).copy()`` for an
+        independent graph.
+
+        Parameters
+        ----------
+        nodes : container or iterable of nodes
+            The nodes of the subgraph. Nodes not in the graph are ignored.
+
+        Returns
+        -------
+        subgraph : easygraph.DiGraph
+            The read-only subgraph view.
+
+        See Also
+        --------
+        easygraph.subgraph_view
+
+        Examples
+        --------
+        >>> G = eg.DiGraph()
+        >>> G.add_edges([(1,2), (2,3), (2,4), (4,5)])
+        >>> H = G.subgraph([1, 2, 3])
+        >>> list(H.edges(data=False))
+        [(1, 2), (2, 3)]
+
+        """
+        return subgraph_view(self, filter_node=show_nodes(self.nbunch_iter(nodes)))
+
+    def ego_subgraph(self, center, as_view=False):
         """Returns an ego network graph of a node.
 
         Parameters
@@ -1107,9 +1293,14 @@ class DiGraph(Graph):
         center : object
             The center node of the ego network graph
 
+        as_view : bool, optional (default : False)
+            If True, return a read-only view instead of a copy, see
+            :meth:`subgraph`. Ego analyses running over every node should
+            use it, since nothing is allocated per edge.
+
         Returns
         -------
-        ego_subgraph : easygraph.Graph
+        ego_subgraph : easygraph.DiGraph
             The ego network graph of *center*.
 
 
@@ -1123,6 +1314,10 @@ class DiGraph(Graph):
         ... ])
         >>> G.ego_subgraph(center='Jack')
         """
+        if as_view:
+            nodes = set(self.all_neighbors(center))
+            nodes.add(center)
+            return subgraph_view(self, filter_node=show_nodes(nodes))
         neighbors_of_center = list(self.all_neighbors(center))
         neighbors_of_center.append(center)
         return self.nodes_subgraph(from_nodes=neighbors_of_center)
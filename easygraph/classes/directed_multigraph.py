@@ -145,6 +145,7 @@ class MultiDiGraph(MultiGraph, DiGraph):
         >>> G[1][2][0].update({0: 5})
         >>> G.edges[1, 2, 0].update({0: 5})
         """
+        self._clear_cache()
         u, v = u_for_edge, v_for_edge
         # add nodes
         if u not in self._adj:
@@ -153,14 +154,18 @@ class MultiDiGraph(MultiGraph, DiGraph):
             self._adj[u] = self.adjlist_inner_dict_factory()
             self._pred[u] = self.adjlist_inner_dict_factory()
             self._node[u] = self.node_attr_dict_factory()
+            self._record("add_node", u)
         if v not in self._adj:
             if v is None:
                 raise ValueError("None cannot be a node")
             self._adj[v] = self.adjlist_inner_dict_factory()
             self._pred[v] = self.adjlist_inner_dict_factory()
             self._node[v] = self.node_attr_dict_factory()
+            self._record("add_node", v)
         if key is None:
             key = self.new_edge_key(u, v)
+        if v not in self._adj[u] or key not in self._adj[u][v]:
+            self._record("add_edge", u, v, key)
         if v in self._adj[u]:
             keydict = self._adj[u][v]
             datadict = keydict.get(key, self.edge_key_dict_factory())
@@ -214,19 +219,21 @@ class MultiDiGraph(MultiGraph, DiGraph):
         >>> G.remove_edge(1, 2, key="second")
 
         """
+        self._clear_cache()
         try:
             d = self._adj[u][v]
         except KeyError as err:
             raise EasyGraphError(f"The edge {u}-{v} is not in the graph.") from err
         # remove the edge with specified data
         if key is None:
-            d.popitem()
+            key = d.popitem()[0]
         else:
             try:
                 del d[key]
             except KeyError as err:
                 msg = f"The edge {u}-{v} with key {key} is not in the graph."
                 raise EasyGraphError(msg) from err
+        self._record("remove_edge", u, v, key)
         if len(d) == 0:
             # remove the key entries if last edge
             del self._adj[u][v]
@@ -5,7 +5,14 @@ from typing import List
 import easygraph as eg
 import easygraph.convert as convert
 
+from easygraph.classes.coreviews import show_nodes
+from easygraph.classes.csr import CSRGraph
+from easygraph.classes.graphviews import subgraph_view
+from easygraph.classes.journal import ChangeJournal
+from easygraph.classes.reportviews import DegreeView
+from easygraph.classes.reportviews import EdgeView
 from easygraph.utils.exception import EasyGraphError
+from easygraph.utils.misc import gc_paused
 
 
 class Graph:
@@ -65,6 +72,9 @@ class Graph:
         self.graph = self.graph_attr_dict_factory()
         self._node = self.node_dict_factory()
         self._adj = self.adjlist_outer_dict_factory()
+        self._cache = {}
+        self._version = 0
+        self._journal = None
         self.cflag = 0
         if incoming_graph_data is not None:
             convert.to_easygraph_graph(incoming_graph_data, create_using=self)
@@ -97,16 +107,13 @@ class Graph:
 
     @property
     def edges(self):
-        edges = list()
-        seen = set()
-        for u in self._adj:
-            for v in self._adj[u]:
-                if (u, v) not in seen:
-                    seen.add((u, v))
-                    seen.add((v, u))
-                    edges.append((u, v, self._adj[u][v]))
-        del seen
-        return edges
+        """A lazy view of the edges, reporting ``(u, v, data)`` for each edge.
+
+        See Also
+        --------
+        easygraph.classes.reportviews.EdgeView
+        """
+        return EdgeView(self)
 
     @property
     def name(self):
@@ -127,18 +134,25 @@ class Graph:
 
         Parameters
         ----------
-        weight : string, optional (default: 'weight')
+        weight : string or None, optional (default: 'weight')
             Weight key of the original weighted graph.
+            If None, the number of incident edges is returned.
 
         Returns
         -------
-        degree : dict
-            Each node's (key) weighted degree (value).
+        degree : DegreeView
+            Read-only mapping of each node's (key) weighted degree (value).
 
         Notes
         -----
         If the graph is not weighted, all the weights will be regarded as 1.
 
+        The degrees are cached per weight key, and dropped by every method
+        that modifies the graph and by `set_edge_attributes`. Weights written
+        into ``G[u][v]`` directly are not detected. The returned view shares
+        the cache, so it is read-only: assigning to it raises TypeError, use
+        ``dict(...)`` for a mutable copy.
+
         Examples
         --------
         You can call with no attributes, if 'weight' is the weight key:
@@ -150,23 +164,20 @@ class Graph:
         >>> G.degree(weight='weight_1')
 
         """
-        degree = dict()
-        for u, v, d in self.edges:
-            if u in degree:
-                degree[u] += d.get(weight, 1)
-            else:
-                degree[u] = d.get(weight, 1)
-            if v in degree:
-                degree[v] += d.get(weight, 1)
-            else:
-                degree[v] = d.get(weight, 1)
-
-        # For isolated nodes
-        for node in self.nodes:
-            if node not in degree:
-                degree[node] = 0
-
-        return degree
+        key = ("degree", weight)
+        if key not in self._cache:
+            degree = dict()
+            for u, nbrs in self._adj.items():
+                if weight is None:
+                    deg = len(nbrs)
+                else:
+                    deg = sum(d.get(weight, 1) for d in nbrs.values())
+                # A self-loop adds two to the degree of its node.
+                if u in nbrs:
+                    deg += 1 if weight is None else nbrs[u].get(weight, 1)
+                degree[u] = deg
+            self._cache[key] = degree
+        return DegreeView(self._cache[key])
 
     def order(self):
         """Returns the number of nodes in the graph.
@@ -215,8 +226,10 @@ class Graph:
         >>> G.size(weight='weight')
 
         """
-        s = sum(d for v, d in self.degree(weight=weight).items())
-        return s // 2 if weight is None else s / 2
+        if weight is None:
+            return len(self.edges)
+        s = sum(self.degree(weight=weight).values())
+        return s / 2
 
     def number_of_edges(self, u=None, v=None):
         """Returns the number of edges between two nodes.
@@ -496,6 +509,8 @@ class Graph:
         11
 
         """
+        self._clear_cache()
+        journal = self._journal
         for n in nodes_for_adding:
             try:
                 newnode = n not in self._node
@@ -510,14 +525,18 @@ class Graph:
                     raise ValueError("None cannot be a node")
                 self._adj[n] = self.adjlist_inner_dict_factory()
                 self._node[n] = self.node_attr_dict_factory()
+                if journal is not None:
+                    journal.record(self._version, "add_node", n)
             self._node[n].update(newdict)
 
     def _add_one_node(self, one_node_for_adding, node_attr: dict = {}):
+        self._clear_cache()
         node = one_node_for_adding
         if node not in self._node:
             self._adj[node] = self.adjlist_inner_dict_factory()
             attr_dict = self._node[node] = self.node_attr_dict_factory()
             attr_dict.update(node_attr)
+            self._record("add_node", node)
         else:  # If already exists, there is no complain and still updating the node attribute
             self._node[node].update(node_attr)
 
@@ -651,6 +670,8 @@ class Graph:
         >>> G.add_edges_from([(1, 2), (2, 3)], weight=3)
         >>> G.add_edges_from([(3, 4), (1, 4)], label="WN2898")
         """
+        self._clear_cache()
+        journal = self._journal
         for e in ebunch_to_add:
             ne = len(e)
             if ne == 3:
@@ -665,18 +686,77 @@ class Graph:
                     raise ValueError("None cannot be a node")
                 self._adj[u] = self.adjlist_inner_dict_factory()
                 self._node[u] = self.node_attr_dict_factory()
+                if journal is not None:
+                    journal.record(self._version, "add_node", u)
             if v not in self._node:
                 if v is None:
                     raise ValueError("None cannot be a node")
                 self._adj[v] = self.adjlist_inner_dict_factory()
                 self._node[v] = self.node_attr_dict_factory()
+                if journal is not None:
+                    journal.record(self._version, "add_node", v)
+            if journal is not None and v not in self._adj[u]:
+                journal.record(self._version, "add_edge", u, v)
             datadict = self._adj[u].get(v, self.edge_attr_dict_factory())
             datadict.update(attr)
             datadict.update(dd)
             self._adj[u][v] = datadict
             self._adj[v][u] = datadict
 
-    def add_edges_from_file(self, file, weighted=False):
+    def add_edges_from_arrays(self, src, dst, weights=None, weight="weight", **attr):
+        """Add the edges given as arrays of endpoints, in a vectorized pass.
+
+        It is equivalent to adding ``(src[i], dst[i])`` for each `i`, with the
+        attributes in row `i` of the columns, but the endpoints are encoded,
+        deduplicated and grouped by node with NumPy, and each adjacency dict is
+        filled in one call. Use it to load large edge lists.
+
+        Parameters
+        ----------
+        src, dst : array_like
+            The two ends of each edge. NumPy int, string or object arrays,
+            or lists.
+
+        weights : array_like, optional (default : None)
+            The weight of each edge, stored under the key `weight`.
+
+        weight : string, optional (default : 'weight')
+            The key of `weights`.
+
+        attr : keyword arguments of array_like, optional
+            Other attribute columns, one value per edge.
+
+        Notes
+        -----
+        For duplicated edges, the attributes of the last occurrence are kept.
+
+        See Also
+        --------
+        add_edges
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = eg.Graph()
+        >>> G.add_edges_from_arrays(np.array([0, 1, 2]), np.array([1, 2, 0]),
+        ...                         weights=np.array([0.5, 1.5, 2.0]))
+        >>> G[2][0]
+        {'weight': 2.0}
+
+        """
+        self._clear_cache()
+        with gc_paused():
+            nodes, u, v, datadicts = _prepare_edge_arrays(
+                self, src, dst, weights, weight, attr
+            )
+            _record_new_edges(self, nodes, u, v)
+            # Both directions, interleaved to keep the order of the input.
+            nonloop = u != v
+            src, dst = _edge_entries(u, v, nonloop)
+            data = _object_array(datadicts)[_entry_edge_ids(len(u), nonloop)]
+            _fill_adjacency(self._adj, _object_array(nodes), src, dst, data)
+
+    def add_edges_from_file(self, file, weighted=False, chunk_size=1 << 24):
         """Added edges from file
         For example, txt files,
 
@@ -687,12 +767,24 @@ class Graph:
         Parameters
         ----------
         file : string
-            The file path.
+            The file path. Files ending in ``.gz``, ``.gzip``, ``.bz2`` and ``.xz``
+            are decompressed on the fly.
 
         weighted : boolean, optional (default : False)
             If the file consists of weight information, set `True`.
             The weight key will be set as 'weight'.
 
+        chunk_size : int, optional (default : 16M)
+            Approximate number of characters parsed and added at a time,
+            which bounds the memory used by the reader.
+
+        Returns
+        -------
+        malformed : int
+            The number of skipped lines, which have too few fields or a weight
+            which is not a number. Blank lines and lines starting with '#' are
+            ignored.
+
         Examples
         --------
 
@@ -707,31 +799,49 @@ class Graph:
         Then add them to *G*
 
         >>> G.add_edges_from_file(file='./club_network.txt', weighted=True)
+        0
 
+        See Also
+        --------
+        easygraph.read_edgelist_chunks
 
         """
-        import re
-
-        with open(file, "r") as fp:
-            edges = fp.readlines()
-        if weighted:
-            for edge in edges:
-                edge = re.sub(",", " ", edge)
-                edge = edge.split()
-                try:
-                    self.add_edge(edge[0], edge[1], weight=float(edge[2]))
-                except:
-                    pass
-        else:
-            for edge in edges:
-                edge = re.sub(",", " ", edge)
-                edge = edge.split()
-                try:
-                    self.add_edge(edge[0], edge[1])
-                except:
-                    pass
+        import warnings
+
+        from easygraph.readwrite.edgelist import read_edgelist_chunks
+
+        malformed = 0
+        for src, dst, weights, bad in read_edgelist_chunks(
+            file, weighted=weighted, chunk_size=chunk_size
+        ):
+            self.add_edges_from_arrays(src, dst, weights=weights)
+            malformed += bad
+        if malformed:
+            warnings.warn(
+                "{} malformed lines in {} were skipped.".format(malformed, file)
+            )
+        return malformed
+
+    def _new_edge_attr_dicts(self, columns, count):
+        """Returns `count` new edge attribute dicts filled from the columns."""
+        keys = list(columns)
+        if not keys:
+            return [self.edge_attr_dict_factory() for i in range(count)]
+        if self.edge_attr_dict_factory is dict and len(keys) == 1:
+            key = keys[0]
+            return [{key: value} for value in columns[key].tolist()]
+        rows = zip(*(column.tolist() for column in columns.values()))
+        if self.edge_attr_dict_factory is dict:
+            return [dict(zip(keys, row)) for row in rows]
+        datadicts = []
+        for row in rows:
+            datadict = self.edge_attr_dict_factory()
+            datadict.update(zip(keys, row))
+            datadicts.append(datadict)
+        return datadicts
 
     def _add_one_edge(self, u_of_edge, v_of_edge, edge_attr: dict = {}):
+        self._clear_cache()
         u, v = u_of_edge, v_of_edge
         # add nodes
         if u not in self._node:
@@ -739,6 +849,8 @@ class Graph:
         if v not in self._node:
             self._add_one_node(v)
         # add the edge
+        if v not in self._adj[u]:
+            self._record("add_edge", u, v)
         datadict = self._adj[u].get(v, self.edge_attr_dict_factory())
         datadict.update(edge_attr)
         self._adj[u][v] = datadict
@@ -763,14 +875,17 @@ class Graph:
         >>> G.remove_node('Jack')
 
         """
+        self._clear_cache()
         try:
             neighbors = list(self._adj[node_to_remove])
             del self._node[node_to_remove]
         except KeyError:  # Node not exists in self
             raise EasyGraphError("No node {} in graph.".format(node_to_remove))
         for neighbor in neighbors:  # Remove edges with other nodes
+            self._record_edges("remove_edge", node_to_remove, neighbor)
             del self._adj[neighbor][node_to_remove]
         del self._adj[node_to_remove]  # Remove this node
+        self._record("remove_node", node_to_remove)
 
     def remove_nodes(self, nodes_to_remove: list):
         """Remove nodes from your graph.
@@ -822,12 +937,14 @@ class Graph:
         >>> G.remove_edge(1,2)
 
         """
+        self._clear_cache()
         try:
             del self._adj[u][v]
             if u != v:  # self-loop needs only one entry removed
                 del self._adj[v][u]
         except KeyError:
             raise KeyError("No edge {}-{} in graph.".format(u, v))
+        self._record("remove_edge", u, v)
 
     def remove_edges(self, edges_to_remove: [tuple]):
         """Remove a list of edges from your graph.
@@ -852,7 +969,8 @@ class Graph:
         ... ])
 
         """
-        for edge in edges_to_remove:
+        # Materialize first, edges_to_remove may be a view of G.edges
+        for edge in list(edges_to_remove):
             u, v = edge[:2]
             self.remove_edge(u, v)
 
@@ -882,9 +1000,22 @@ class Graph:
         """Returns True if graph is a multigraph, False otherwise."""
         return False
 
-    def copy(self):
+    def copy(self, share_attrs=False):
         """Return a deep copy of the graph.
 
+        The dicts are cloned level by level, without going through the
+        insertion logic of ``add_node`` and ``add_edge``.
+
+        Parameters
+        ----------
+        share_attrs : bool, optional (default : False)
+            If True, only the adjacency structure is copied, and the node and
+            edge attribute dicts are shared with the original graph. Adding or
+            removing nodes and edges on one graph does not affect the other,
+            but changing an attribute does. It is several times faster and
+            uses less memory, which suits algorithms that repeatedly copy a
+            graph to remove parts of it.
+
         Returns
         -------
         copy : easygraph.Graph
@@ -896,15 +1027,29 @@ class Graph:
 
         >>> G2 = G1.copy()
 
+        *G3* shares the attributes of *G1*
+
+        >>> G3 = G1.copy(share_attrs=True)
+
         """
         G = self.__class__()
         G.graph.update(self.graph)
-        for node, node_attr in self._node.items():
-            G.add_node(node, **node_attr)
-        for u, nbrs in self._adj.items():
-            for v, edge_data in nbrs.items():
-                G.add_edge(u, v, **edge_data)
-
+        with gc_paused():
+            if share_attrs:
+                G._node.update(self._node)
+                G._adj.update((u, nbrs.copy()) for u, nbrs in self._adj.items())
+                return G
+
+            copy_node_attr = _attr_dict_copier(G.node_attr_dict_factory)
+            copy_edge_attr = _attr_dict_copier(G.edge_attr_dict_factory)
+            G._node.update((n, copy_node_attr(d)) for n, d in self._node.items())
+            adj = G._adj
+            for u, nbrs in self._adj.items():
+                # Reuse the copy made from the other end of undirected edges.
+                adj[u] = {
+                    v: adj[v][u] if v in adj else copy_edge_attr(d)
+                    for v, d in nbrs.items()
+                }
         return G
 
     def nodes_subgraph(self, from_nodes: list):
@@ -930,6 +1075,7 @@ class Graph:
         """
         G = self.__class__()
         G.graph.update(self.graph)
+        nodes = set(from_nodes)
         for node in from_nodes:
             try:
                 G.add_node(node, **self._node[node])
@@ -937,13 +1083,46 @@ class Graph:
                 pass
 
             # Edge
-            from_nodes = set(from_nodes)
             for v, edge_data in self._adj[node].items():
-                if v in from_nodes:
+                if v in nodes:
                     G.add_edge(node, v, **edge_data)
         return G
 
-    def ego_subgraph(self, center):
+    def subgraph(self, nodes):
+        """Returns a read-only view of the subgraph induced on `nodes`.
+
+        Unlike :meth:`nodes_subgraph`, nothing is copied: the view filters
+        the adjacency of the graph while it is read, and reflects later
+        changes of the graph. It can be passed to any algorithm, but it
+        cannot be modified; use ``G.subgraph(nodes).copy()`` for an
+        independent graph.
+
+        Parameters
+        ----------
+        nodes : container or iterable of nodes
+            The nodes of the subgraph. Nodes not in the graph are ignored.
+
+        Returns
+        -------
+        subgraph : easygraph.Graph
+            The read-only subgraph view.
+
+        See Also
+        --------
+        easygraph.subgraph_view
+
+        Examples
+        --------
+        >>> G = eg.Graph()
+        >>> G.add_edges([(1,2), (2,3), (2,4), (4,5)])
+        >>> H = G.subgraph([1, 2, 3])
+        >>> list(H.edges(data=False))
+        [(1, 2), (2, 3)]
+
+        """
+        return subgraph_view(self, filter_node=show_nodes(self.nbunch_iter(nodes)))
+
+    def ego_subgraph(self, center, as_view=False):
         """Returns an ego network graph of a node.
 
         Parameters
@@ -951,6 +1130,11 @@ class Graph:
         center : object
             The center node of the ego network graph
 
+        as_view : bool, optional (default : False)
+            If True, return a read-only view instead of a copy, see
+            :meth:`subgraph`. Ego analyses running over every node should
+            use it, since nothing is allocated per edge.
+
         Returns
         -------
         ego_subgraph : easygraph.Graph
@@ -967,6 +1151,10 @@ class Graph:
         ... ])
         >>> G.ego_subgraph(center='Jack')
         """
+        if as_view:
+            nodes = set(self.all_neighbors(center))
+            nodes.add(center)
+            return subgraph_view(self, filter_node=show_nodes(nodes))
         neighbors_of_center = list(self.all_neighbors(center))
         neighbors_of_center.append(center)
         return self.nodes_subgraph(from_nodes=neighbors_of_center)
@@ -1021,6 +1209,305 @@ class Graph:
 
         return G, index_of_node, node_of_index
 
+    def csr(self, weight="weight"):
+        """Returns a compressed sparse row (CSR) snapshot of the graph.
+
+        The snapshot holds `indptr`/`indices`/`weights` NumPy arrays together
+        with the node-to-index mapping, so that algorithms can work on
+        contiguous memory instead of the dict-of-dicts adjacency.
+
+        Parameters
+        ----------
+        weight : string or None, optional (default : 'weight')
+            The edge attribute used as weight. If None, every weight is 1.
+
+        Returns
+        -------
+        csr : easygraph.CSRGraph
+            The read-only CSR snapshot of the graph.
+
+        Notes
+        -----
+        The snapshot is cached per weight key and dropped automatically by
+        every method that modifies the graph, e.g. `add_edge` or `remove_node`.
+        Changes made by writing into ``G.adj`` or ``G[u][v]`` directly are not
+        detected.
+
+        Examples
+        --------
+        >>> G = eg.Graph()
+        >>> G.add_edges([(1, 2), (2, 3)], edges_attr=[{'weight': 3}, {'weight': 4}])
+        >>> csr = G.csr()
+        >>> csr.indptr, csr.indices, csr.weights
+        (array([0, 1, 3, 4]), array([1, 0, 2, 1], dtype=int32), array([3., 3., 4., 4.]))
+
+        """
+        key = ("csr", weight)
+        if key not in self._cache:
+            self._cache[key] = CSRGraph.from_graph(self, weight=weight)
+        return self._cache[key]
+
+    @property
+    def version(self):
+        """A counter increased by every method that modifies the graph.
+
+        Caches derived from the graph can store the version they were built
+        at, and compare it with the current one to detect that they are
+        stale. Changes made by writing into ``G.adj`` or ``G[u][v]`` directly
+        are not counted. Views, such as ``G.subgraph(nodes)``, report the
+        version of the graph they show.
+
+        See Also
+        --------
+        enable_journal
+
+        Examples
+        --------
+        >>> G = eg.Graph()
+        >>> v = G.version
+        >>> G.add_edge(1, 2)
+        >>> G.version > v
+        True
+
+        """
+        base = getattr(self, "_graph", None)
+        if base is not None:
+            return base.version
+        return self._version
+
+    def enable_journal(self, maxlen=100000):
+        """Starts recording the nodes and edges added and removed.
+
+        The changes are kept in a bounded :class:`easygraph.ChangeJournal`,
+        so that incremental algorithms can replay the changes made since
+        the version they last saw with :meth:`changes_since`.
+
+        Parameters
+        ----------
+        maxlen : int, optional (default : 100000)
+            The number of changes kept. Older changes are dropped.
+
+        Returns
+        -------
+        journal : easygraph.ChangeJournal
+            The journal, also available as ``G.journal``.
+
+        """
+        if self._journal is None or self._journal.maxlen != maxlen:
+            self._journal = ChangeJournal(maxlen, self._version)
+        return self._journal
+
+    def disable_journal(self):
+        """Stops recording the changes and drops the journal."""
+        self._journal = None
+
+    @property
+    def journal(self):
+        """The :class:`easygraph.ChangeJournal` of the graph, or None."""
+        return self._journal
+
+    def changes_since(self, version):
+        """Returns the nodes and edges added and removed after `version`.
+
+        Parameters
+        ----------
+        version : int
+            A value of :attr:`version` seen earlier.
+
+        Returns
+        -------
+        changes : list of tuple or None
+            The ``(version, op, *args)`` entries of the journal, oldest first,
+            see :class:`easygraph.ChangeJournal`. None if the journal is
+            disabled, or if it no longer holds all the changes, in which case
+            the caller has to start over from the current graph.
+
+        Examples
+        --------
+        >>> G = eg.Graph([(1, 2)])
+        >>> journal = G.enable_journal()
+        >>> v = G.version
+        >>> G.add_edge(2, 3)
+        >>> [change[1:] for change in G.changes_since(v)]
+        [('add_node', 3), ('add_edge', 2, 3)]
+
+        """
+        if self._journal is None:
+            return None
+        return self._journal.since(version)
+
+    def _record(self, op, *args):
+        if self._journal is not None:
+            self._journal.record(self._version, op, *args)
+
+    def _record_edges(self, op, u, v):
+        # Records every edge between u and v, i.e. every key for multigraphs.
+        self._record(op, u, v)
+
+    def _clear_cache(self):
+        """Drops the structures derived from the graph, such as CSR snapshots.
+
+        It is called by every method that modifies the graph, and increases
+        its version.
+        """
+        self._version += 1
+        self._cache.clear()
+
+
+def _attr_dict_copier(factory):
+    """Returns a function copying attribute dicts into new `factory` dicts."""
+    if factory is dict:
+        return dict
+
+    def copy(d):
+        new = factory()
+        new.update(d)
+        return new
+
+    return copy
+
+
+def _prepare_edge_arrays(G, src, dst, weights, weight, attr):
+    """Encodes, deduplicates and adds the nodes of the edge arrays to `G`.
+
+    Returns the node of each code, the codes of the new edges and their
+    attribute dicts. Edges already in `G` get their attributes updated.
+    """
+    import numpy as np
+
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    if src.ndim != 1 or src.shape != dst.shape:
+        raise EasyGraphError("src and dst must be 1-D arrays of the same length.")
+    if src.dtype != dst.dtype:
+        src = src.astype(object)
+        dst = dst.astype(object)
+    m = len(src)
+
+    columns = {} if weights is None else {weight: weights}
+    columns.update(attr)
+    columns = {key: np.asarray(column) for key, column in columns.items()}
+    for key, column in columns.items():
+        if column.shape != (m,):
+            raise EasyGraphError(
+                "The attribute column {!r} must have one value per edge.".format(key)
+            )
+    if m == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return [], empty, empty, []
+
+    # Node codes, in order of first appearance.
+    ends = np.concatenate([src, dst])
+    try:
+        unique, first, codes = np.unique(ends, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        codes = rank[codes.ravel()]
+        nodes = unique[order].tolist()
+    except TypeError:
+        # Endpoints which cannot be sorted
+        index = {}
+        codes = np.fromiter(
+            (index.setdefault(x, len(index)) for x in ends.tolist()), np.int64, 2 * m
+        )
+        nodes = list(index)
+    u, v = codes[:m], codes[m:]
+
+    # Deduplicate: keep the first occurrence for the order of the adjacency,
+    # and the attributes of the last one.
+    n = len(nodes)
+    if G.is_directed():
+        key = u * n + v
+    else:
+        key = np.minimum(u, v) * n + np.maximum(u, v)
+    perm = np.argsort(key, kind="stable")
+    key = key[perm]
+    starts = np.flatnonzero(np.concatenate([[True], key[1:] != key[:-1]]))
+    first = perm[starts]
+    last = perm[np.append(starts[1:], m) - 1]
+    order = np.argsort(first)
+    first = first[order]
+    last = last[order]
+    u, v = u[first], v[first]
+    datadicts = G._new_edge_attr_dicts(
+        {key: column[last] for key, column in columns.items()}, len(first)
+    )
+
+    existing = False
+    for node in nodes:
+        if node is None:
+            raise ValueError("None cannot be a node")
+        if node in G._node:
+            existing = True
+        else:
+            G._add_one_node(node)
+    if existing:
+        adj = G._adj
+        new = np.ones(len(u), dtype=bool)
+        for i, (a, b) in enumerate(zip(u.tolist(), v.tolist())):
+            datadict = adj[nodes[a]].get(nodes[b])
+            if datadict is not None:
+                datadict.update(datadicts[i])
+                new[i] = False
+        u, v = u[new], v[new]
+        datadicts = [d for d, is_new in zip(datadicts, new.tolist()) if is_new]
+    return nodes, u, v, datadicts
+
+
+def _record_new_edges(G, nodes, u, v):
+    """Records the edges added by :func:`_prepare_edge_arrays` in the journal."""
+    journal = G._journal
+    if journal is not None:
+        for a, b in zip(u.tolist(), v.tolist()):
+            journal.record(G._version, "add_edge", nodes[a], nodes[b])
+
+
+def _edge_entries(u, v, both):
+    """Interleaves ``(u, v)`` with ``(v, u)`` where `both` is True."""
+    import numpy as np
+
+    src = np.stack([u, v], axis=1).ravel()
+    dst = np.stack([v, u], axis=1).ravel()
+    keep = np.stack([np.ones_like(both), both], axis=1).ravel()
+    return src[keep], dst[keep]
+
+
+def _entry_edge_ids(m, both):
+    """The edge of each entry returned by :func:`_edge_entries`."""
+    import numpy as np
+
+    ids = np.repeat(np.arange(m), 2)
+    keep = np.stack([np.ones_like(both), both], axis=1).ravel()
+    return ids[keep]
+
+
+def _fill_adjacency(adj, nodes, src, dst, data):
+    """Adds ``adj[src][dst] = data`` for every entry, one update per node.
+
+    `nodes` and `data` are object arrays, indexed by the codes in `src` and
+    `dst` and by entry respectively.
+    """
+    import numpy as np
+
+    if len(src) == 0:
+        return
+    order = np.argsort(src, kind="stable")
+    src = src[order]
+    dst = nodes[dst[order]].tolist()
+    data = data[order].tolist()
+    bounds = np.flatnonzero(src[1:] != src[:-1]) + 1
+    starts = [0] + bounds.tolist()
+    ends = bounds.tolist() + [len(src)]
+    for start, end, node in zip(starts, ends, nodes[src[starts]].tolist()):
+        adj[node].update(zip(dst[start:end], data[start:end]))
+
+
+def _object_array(items):
+    import numpy as np
+
+    return np.fromiter(items, dtype=object, count=len(items))
+
 
 try:
     import cpp_easygraph
@@ -1028,6 +1515,79 @@ try:
     class GraphC(cpp_easygraph.Graph):
         cflag = 1
 
+        def add_edges_from_file(self, file, weighted=False, chunk_size=1 << 24):
+            """Added edges from file, see :meth:`Graph.add_edges_from_file`.
+
+            Plain files are parsed by the C++ reader. Compressed files are
+            decompressed and parsed chunk by chunk in Python.
+            """
+            import warnings
+
+            from os.path import splitext
+
+            from easygraph.readwrite.edgelist import read_edgelist_chunks
+            from easygraph.utils.decorators import fopeners
+
+            if splitext(str(file))[1] not in fopeners:
+                malformed = super().add_edges_from_file(str(file), weighted)
+            else:
+                malformed = 0
+                for src, dst, weights, bad in read_edgelist_chunks(
+                    file, weighted=weighted, chunk_size=chunk_size
+                ):
+                    self.add_edges_from_arrays(src, dst, weights=weights)
+                    malformed += bad
+            if malformed:
+                warnings.warn(
+                    "{} malformed lines in {} were skipped.".format(malformed, file)
+                )
+            return malformed
+
+        def add_edges_from_arrays(
+            self, src, dst, weights=None, weight="weight", **attr
+        ):
+            """Add the edges given as arrays of endpoints.
+
+            The edges are deduplicated with NumPy and passed to the C++ graph
+            in one call. Attribute values must be numbers.
+
+            See Also
+            --------
+            Graph.add_edges_from_arrays
+            """
+            import numpy as np
+
+            src = np.asarray(src)
+            dst = np.asarray(dst)
+            if src.ndim != 1 or src.shape != dst.shape:
+                raise EasyGraphError(
+                    "src and dst must be 1-D arrays of the same length."
+                )
+            columns = {} if weights is None else {weight: weights}
+            columns.update(attr)
+            columns = {key: np.asarray(column) for key, column in columns.items()}
+
+            # Keep the last occurrence of each edge
+            pairs = np.stack([src, dst], axis=1)
+            if pairs.dtype != object:
+                ends = np.sort(pairs, axis=1)
+                _, last = np.unique(ends[::-1], axis=0, return_index=True)
+                last = np.sort(len(src) - 1 - last)
+            else:
+                seen = {}
+                for i, (u, v) in enumerate(pairs.tolist()):
+                    seen[frozenset((u, v))] = i
+                last = np.array(sorted(seen.values()), dtype=np.int64)
+
+            edges = list(map(tuple, pairs[last].tolist()))
+            if columns:
+                keys = list(columns)
+                rows = zip(*(column[last].tolist() for column in columns.values()))
+                edges_attr = [dict(zip(keys, row)) for row in rows]
+            else:
+                edges_attr = []
+            self.add_edges(edges, edges_attr)
+
 except ImportError:
 
     class GraphC:
@@ -1,7 +1,18 @@
+from functools import lru_cache
+
+from easygraph.classes.coreviews import CSRAdjacency
+from easygraph.classes.coreviews import CSRNodes
+from easygraph.classes.coreviews import FilterAdjacency
+from easygraph.classes.coreviews import FilterAtlas
+from easygraph.classes.coreviews import no_filter
 from easygraph.utils import only_implemented_for_Directed_graph
+from easygraph.utils.exception import EasyGraphError
+
 
+__all__ = ["reverse_view", "subgraph_view", "csr_view"]
 
-__all__ = ["reverse_view"]
+# The methods modifying a graph, blocked on read-only views
+_MUTATOR_PREFIXES = ("add_", "remove_", "_add_one_")
 
 
 @only_implemented_for_Directed_graph
@@ -13,3 +24,147 @@ def reverse_view(G):
     newG._succ, newG._pred = G._pred, G._succ
     newG._adj = newG._succ
     return newG
+
+
+def subgraph_view(G, filter_node=no_filter, filter_edge=no_filter):
+    """Returns a read-only view of `G` showing only some nodes and edges.
+
+    Nothing is copied: the node and adjacency dicts of the view filter those
+    of `G` while they are read. The view is a graph of the same class as `G`,
+    so it can be passed to any algorithm, and it reflects later changes of
+    `G`. Methods modifying the view raise :class:`EasyGraphError`; use
+    ``view.copy()`` to get an independent graph.
+
+    Parameters
+    ----------
+    G : easygraph.Graph or easygraph.DiGraph
+
+    filter_node : callable, optional (default : no_filter)
+        ``filter_node(n)`` returns True if node `n` is shown. Passing
+        ``show_nodes(nodes)`` lets the view iterate over the smaller of
+        `nodes` and the adjacency of each node.
+
+    filter_edge : callable, optional (default : no_filter)
+        ``filter_edge(u, v)`` returns True if the edge from `u` to `v` is
+        shown. For undirected graphs it should be symmetric.
+
+    Returns
+    -------
+    view : easygraph.Graph or easygraph.DiGraph
+        The read-only subgraph view.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2), (2, 3), (3, 4)])
+    >>> view = eg.subgraph_view(G, filter_node=eg.show_nodes([1, 2, 3]))
+    >>> list(view.edges(data=False))
+    [(1, 2), (2, 3)]
+
+    """
+    newG = G.__class__()
+    newG._graph = G
+    newG.graph = G.graph
+    newG._node = FilterAtlas(G._node, filter_node)
+    newG._adj = FilterAdjacency(G._adj, filter_node, filter_edge)
+    if G.is_directed():
+        newG._pred = FilterAdjacency(
+            G._pred, filter_node, _reversed_edge_filter(filter_edge)
+        )
+    newG._cache = _ViewCache(G._cache)
+    _freeze(newG)
+    return newG
+
+
+def csr_view(csr, pred=None):
+    """Returns a read-only graph reading its adjacency from a CSR snapshot.
+
+    The view is an :class:`easygraph.Graph`, or an :class:`easygraph.DiGraph`
+    for directed snapshots, so it can be passed to any algorithm. Rows are
+    decoded on access, which makes it suitable for snapshots mapped from
+    shared memory by worker processes. Edges only carry the weight the
+    snapshot was built with, and nodes have no attributes.
+
+    Parameters
+    ----------
+    csr : easygraph.CSRGraph
+
+    pred : easygraph.CSRGraph, optional (default : None)
+        The transposed snapshot, listing the predecessors of directed graphs.
+        If None, it is computed by ``csr.transpose()``.
+
+    Returns
+    -------
+    view : easygraph.Graph or easygraph.DiGraph
+        The read-only view.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2, {"weight": 3}), (2, 3)])
+    >>> H = eg.csr_view(G.csr())
+    >>> H[1][2]
+    {'weight': 3.0}
+
+    """
+    from easygraph.classes.directed_graph import DiGraph
+    from easygraph.classes.graph import Graph
+
+    newG = DiGraph() if csr.directed else Graph()
+    newG._node = CSRNodes(csr)
+    newG._adj = CSRAdjacency(csr)
+    if csr.directed:
+        newG._pred = CSRAdjacency(pred if pred is not None else csr.transpose())
+    newG._cache[("csr", csr.weight)] = csr
+    _freeze(newG)
+    return newG
+
+
+def _freeze(G):
+    for name in _mutators(G.__class__):
+        setattr(G, name, _frozen)
+
+
+@lru_cache(maxsize=None)
+def _mutators(cls):
+    return tuple(name for name in dir(cls) if name.startswith(_MUTATOR_PREFIXES))
+
+
+def _frozen(*args, **kwargs):
+    raise EasyGraphError("Subgraph views are read-only, use view.copy() instead.")
+
+
+class _reversed_edge_filter:
+    """Checks the edges of the predecessor dict, keyed by (target, source)."""
+
+    __slots__ = ("filter_edge",)
+
+    def __new__(cls, filter_edge):
+        if filter_edge is no_filter:
+            return no_filter
+        return super().__new__(cls)
+
+    def __init__(self, filter_edge):
+        self.filter_edge = filter_edge
+
+    def __call__(self, v, u):
+        return self.filter_edge(u, v)
+
+
+class _ViewCache(dict):
+    """The cache of a subgraph view, emptied whenever the base graph changes.
+
+    It stores a token in the cache of the base graph, and clears itself once
+    the token is gone, i.e. once the base graph has cleared its own cache.
+    """
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base):
+        super().__init__()
+        self._base = base
+
+    def __contains__(self, key):
+        token = ("view", id(self))
+        if token not in self._base:
+            self.clear()
+            self._base[token] = None
+        return super().__contains__(key)
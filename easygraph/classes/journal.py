@@ -0,0 +1,88 @@
+"""Bounded journals of the structural changes of a graph."""
+
+from collections import deque
+
+
+__all__ = ["ChangeJournal"]
+
+
+class ChangeJournal:
+    """A bounded log of the nodes and edges added to or removed from a graph.
+
+    Every entry is a tuple ``(version, op, *args)``, where `version` is the
+    value of ``G.version`` after the change, and `op` is one of
+
+    - ``"add_node"``, ``"remove_node"`` with args ``(n,)``,
+    - ``"add_edge"``, ``"remove_edge"`` with args ``(u, v)``, or
+      ``(u, v, key)`` for multigraphs.
+
+    Only structural changes are recorded: updating the attributes of an
+    existing node or edge increases the version without an entry. Removing a
+    node records the removal of its edges first.
+
+    Do not build it directly, use :meth:`easygraph.Graph.enable_journal`.
+
+    Parameters
+    ----------
+    maxlen : int
+        The number of entries kept. Older entries are dropped.
+
+    version : int
+        The version of the graph when the journal starts.
+
+    Attributes
+    ----------
+    entries : collections.deque
+        The kept entries, oldest first.
+
+    start : int
+        The oldest version from which the changes can be replayed.
+
+    """
+
+    __slots__ = ("entries", "start")
+
+    def __init__(self, maxlen, version):
+        self.entries = deque(maxlen=maxlen)
+        self.start = version
+
+    @property
+    def maxlen(self):
+        return self.entries.maxlen
+
+    def record(self, version, op, *args):
+        """Appends an entry, dropping the oldest one if the journal is full."""
+        entries = self.entries
+        if len(entries) == entries.maxlen:
+            if not entries.maxlen:
+                self.start = version
+                return
+            # Changes before the dropped one can no longer be replayed.
+            self.start = entries[0][0]
+        entries.append((version, op) + args)
+
+    def since(self, version):
+        """Returns the entries recorded after `version`, oldest first.
+
+        Returns None if some of these changes were already dropped.
+        """
+        if version < self.start:
+            return None
+        entries = self.entries
+        # Entries are sorted by version, look for the first newer one from
+        # the end, since callers usually lag a few changes behind.
+        i = len(entries)
+        while i and entries[i - 1][0] > version:
+            i -= 1
+        return [entries[j] for j in range(i, len(entries))]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __repr__(self):
+        return "{}(maxlen={}, start={}, entries={})".format(
+            self.__class__.__name__, self.maxlen, self.start, len(self.entries)
+        )
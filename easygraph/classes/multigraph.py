@@ -1,4 +1,5 @@
 """Base class for MultiGraph."""
+
 from copy import deepcopy
 from typing import Dict
 from typing import List
@@ -173,6 +174,7 @@ class MultiGraph(Graph):
         >>> G[1][2][0].update({0: 5})
         >>> G.edges[1, 2, 0].update({0: 5})
         """
+        self._clear_cache()
         u, v = u_for_edge, v_for_edge
         # add nodes
         if u not in self._adj:
@@ -180,13 +182,17 @@ class MultiGraph(Graph):
                 raise ValueError("None cannot be a node")
             self._adj[u] = self.adjlist_inner_dict_factory()
             self._node[u] = self.node_attr_dict_factory()
+            self._record("add_node", u)
         if v not in self._adj:
             if v is None:
                 raise ValueError("None cannot be a node")
             self._adj[v] = self.adjlist_inner_dict_factory()
             self._node[v] = self.node_attr_dict_factory()
+            self._record("add_node", v)
         if key is None:
             key = self.new_edge_key(u, v)
+        if v not in self._adj[u] or key not in self._adj[u][v]:
+            self._record("add_edge", u, v, key)
         if v in self._adj[u]:
             keydict = self._adj[u][v]
             datadict = keydict.get(key, self.edge_attr_dict_factory())
@@ -321,19 +327,21 @@ class MultiGraph(Graph):
         >>> G.remove_edge(1, 2, key="second")
 
         """
+        self._clear_cache()
         try:
             d = self._adj[u][v]
         except KeyError as err:
             raise EasyGraphError(f"The edge {u}-{v} is not in the graph.") from err
         # remove the edge with specified data
         if key is None:
-            d.popitem()
+            key = d.popitem()[0]
         else:
             try:
                 del d[key]
             except KeyError as err:
                 msg = f"The edge {u}-{v} with key {key} is not in the graph."
                 raise EasyGraphError(msg) from err
+        self._record("remove_edge", u, v, key)
         if len(d) == 0:
             # remove the key entries if last edge
             del self._adj[u][v]
@@ -533,6 +541,11 @@ class MultiGraph(Graph):
                     deg += sum(d.get(weight, 1) for d in nbrs[n].values())
                 degree[n] = deg
 
+    def _record_edges(self, op, u, v):
+        if self._journal is not None:
+            for key in self._adj[u][v]:
+                self._record(op, u, v, key)
+
     def is_multigraph(self):
         """Returns True if graph is a multigraph, False otherwise."""
         return True
@@ -541,7 +554,7 @@ class MultiGraph(Graph):
         """Returns True if graph is directed, False otherwise."""
         return False
 
-    def copy(self):
+    def copy(self, share_attrs=False):
         """Returns a copy of the graph.
 
         The copy method by default returns an independent shallow copy
@@ -549,6 +562,13 @@ class MultiGraph(Graph):
         container, that container is shared by the original an the copy.
         Use Python's `copy.deepcopy` for new containers.
 
+        Parameters
+        ----------
+        share_attrs : bool, optional (default : False)
+            If True, only the adjacency structure, down to the dicts of edge
+            keys, is copied, and the node and edge attribute dicts are shared
+            with the original graph, as in :meth:`Graph.copy`.
+
         Notes
         -----
         All copies reproduce the graph structure, but data attributes
@@ -607,6 +627,26 @@ class MultiGraph(Graph):
         """
         G = self.__class__()
         G.graph.update(self.graph)
+        if share_attrs:
+            G._node.update(self._node)
+            adj = G._adj
+            if self.is_directed():
+                adj.update(
+                    (u, {v: keydict.copy() for v, keydict in nbrs.items()})
+                    for u, nbrs in self._adj.items()
+                )
+                G._pred.update(
+                    (v, {u: adj[u][v] for u in preds})
+                    for v, preds in self._pred.items()
+                )
+            else:
+                for u, nbrs in self._adj.items():
+                    # Reuse the copy made from the other end of the edges.
+                    adj[u] = {
+                        v: adj[v][u] if v in adj else keydict.copy()
+                        for v, keydict in nbrs.items()
+                    }
+            return G
         G.add_nodes_from((n, d.copy()) for n, d in self._node.items())
         G.add_edges_from(
             (u, v, key, datadict.copy())
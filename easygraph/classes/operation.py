@@ -127,6 +127,7 @@ def set_edge_attributes(G, values, name=None):
                     G[u][v].update(d)
                 except KeyError:
                     pass
+    _attributes_changed(G)
 
 
 def add_path(G_to_add_to, nodes_for_path, **attr):
@@ -259,13 +260,23 @@ def set_node_attributes(G, values, name=None):
                 G.nodes[n].update(d)
             except KeyError:
                 pass
+    _attributes_changed(G)
+
+
+def _attributes_changed(G):
+    """Drops the CSR snapshots and degrees cached with the old attributes."""
+    # Views write into the attribute dicts of the graph they show
+    while getattr(G, "_graph", None) is not None:
+        G = G._graph
+    if hasattr(G, "_clear_cache"):
+        G._clear_cache()
 
 
 def topological_generations(G):
     if not G.is_directed():
         raise AssertionError("Topological sort not defined on undirected graphs.")
-    indegree_map = {v: d for v, d in G.in_degree() if d > 0}
-    zero_indegree = [v for v, d in G.in_degree() if d == 0]
+    indegree_map = {v: d for v, d in G.in_degree(weight=None).items() if d > 0}
+    zero_indegree = [v for v, d in G.in_degree(weight=None).items() if d == 0]
     while zero_indegree:
         this_generation = zero_indegree
         zero_indegree = []
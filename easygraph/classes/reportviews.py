@@ -0,0 +1,240 @@
+"""Lazy views reporting the edges and degrees of a graph."""
+
+from collections.abc import Mapping
+
+
+__all__ = ["EdgeView", "OutEdgeView", "DegreeView"]
+
+
+class OutEdgeView:
+    """A lazy view of the edges of a directed graph.
+
+    Iterating the view walks the adjacency of the graph once and yields
+    ``(u, v, data)`` tuples, nothing is materialized in advance.
+    The view always reflects the current state of the graph.
+
+    Calling the view returns a view with filters applied, see
+    :meth:`OutEdgeView.__call__`.
+
+    Examples
+    --------
+    >>> G = eg.DiGraph([(1, 2), (2, 3)])
+    >>> len(G.edges)
+    2
+    >>> (1, 2) in G.edges
+    True
+    >>> list(G.edges(data=False))
+    [(1, 2), (2, 3)]
+
+    """
+
+    __slots__ = ("_graph", "_adj", "_nbunch", "_data", "_default")
+
+    def __init__(self, G, nbunch=None, data=True, default=None):
+        self._graph = G
+        self._adj = G._adj
+        self._nbunch = None if nbunch is None else dict.fromkeys(G.nbunch_iter(nbunch))
+        self._data = data
+        self._default = default
+
+    def __call__(self, nbunch=None, data=True, default=None):
+        """Returns a view of the edges with filters applied.
+
+        Parameters
+        ----------
+        nbunch : single node, container, or all nodes (default= all nodes)
+            The view will only report edges incident to these nodes.
+
+        data : bool or string, optional (default : True)
+            If True, report ``(u, v, data)`` tuples. If False, report ``(u, v)``
+            tuples. If a string, report ``(u, v, value)`` tuples, where value is
+            the edge attribute named `data`.
+
+        default : value, optional (default : None)
+            The value reported for edges without the attribute `data`.
+            Only relevant if `data` is a string.
+
+        Returns
+        -------
+        edges : EdgeView or OutEdgeView
+
+        """
+        return self.__class__(self._graph, nbunch=nbunch, data=data, default=default)
+
+    def _nodes_nbrs(self):
+        if self._nbunch is None:
+            return self._adj.items()
+        # The nodes of nbunch may have been removed since the view was made
+        adj = self._adj
+        return ((n, adj[n]) for n in self._nbunch if n in adj)
+
+    def _report(self, u, v, d):
+        data = self._data
+        if data is True:
+            return (u, v, d)
+        if data is False:
+            return (u, v)
+        return (u, v, d.get(data, self._default))
+
+    def __iter__(self):
+        report = self._report
+        for u, nbrs in self._nodes_nbrs():
+            for v, d in nbrs.items():
+                yield report(u, v, d)
+
+    def __len__(self):
+        if self._nbunch is not None:
+            return sum(len(nbrs) for u, nbrs in self._nodes_nbrs())
+        cache = self._graph._cache
+        if "number_of_edges" not in cache:
+            cache["number_of_edges"] = sum(len(nbrs) for nbrs in self._adj.values())
+        return cache["number_of_edges"]
+
+    def __contains__(self, e):
+        try:
+            u, v = e[:2]
+            return v in self._adj[u] and (self._nbunch is None or u in self._nbunch)
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def __getitem__(self, index):
+        # Index like the edge lists reported by earlier versions
+        if not isinstance(index, (int, slice)):
+            raise TypeError(
+                "edge views are indexed by position, not by {}".format(
+                    type(index).__name__
+                )
+            )
+        return list(self)[index]
+
+    def __eq__(self, other):
+        # Compare like the edge lists reported by earlier versions
+        if isinstance(other, OutEdgeView):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self) == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
+
+
+class EdgeView(OutEdgeView):
+    """A lazy view of the edges of an undirected graph.
+
+    Every edge is reported once. Instead of remembering the reported edges,
+    the view remembers the nodes whose adjacency was already walked: an edge
+    ``(u, v)`` is reported while walking `u` only if `v` has not been walked
+    yet, so the extra memory is proportional to the number of nodes.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2), (2, 3)])
+    >>> list(G.edges)
+    [(1, 2, {}), (2, 3, {})]
+    >>> (2, 1) in G.edges
+    True
+    >>> list(G.edges(nbunch=[3], data=False))
+    [(3, 2)]
+
+    """
+
+    __slots__ = ()
+
+    def __iter__(self):
+        report = self._report
+        seen = set()
+        for u, nbrs in self._nodes_nbrs():
+            for v, d in nbrs.items():
+                if v not in seen:
+                    yield report(u, v, d)
+            seen.add(u)
+
+    def __len__(self):
+        if self._nbunch is not None:
+            return sum(1 for e in self)
+        cache = self._graph._cache
+        if "number_of_edges" not in cache:
+            adj = self._adj
+            entries = sum(len(nbrs) for nbrs in adj.values())
+            selfloops = sum(1 for u, nbrs in adj.items() if u in nbrs)
+            cache["number_of_edges"] = (entries + selfloops) // 2
+        return cache["number_of_edges"]
+
+    def __contains__(self, e):
+        try:
+            u, v = e[:2]
+            if v not in self._adj[u]:
+                return False
+        except (KeyError, TypeError, ValueError):
+            return False
+        if self._nbunch is None:
+            return True
+        return u in self._nbunch or v in self._nbunch
+
+
+class DegreeView(Mapping):
+    """A read-only mapping from each node to its (weighted) degree.
+
+    The degrees are computed in one pass over the adjacency by the graph,
+    which caches them per weight key until it is modified, so repeated calls
+    like ``G.degree()[n]`` are cheap. The view shares the cached dict, hence
+    it is read-only; use ``dict(view)`` for a mutable copy. Weights written
+    into ``G[u][v]`` directly do not drop the cache, the view then keeps
+    reporting the old degrees.
+
+    The nodes are in the same order as in ``G.nodes`` and in the CSR snapshot
+    ``G.csr()``, which makes :meth:`to_numpy` aligned with the node index.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2, {"weight": 3}), (2, 3)])
+    >>> G.degree()[2]
+    4
+    >>> G.degree(weight=None).to_numpy()
+    array([1, 2, 1])
+
+    """
+
+    __slots__ = ("_degree",)
+
+    def __init__(self, degree):
+        self._degree = degree
+
+    def __getitem__(self, n):
+        return self._degree[n]
+
+    def __iter__(self):
+        return iter(self._degree)
+
+    def __len__(self):
+        return len(self._degree)
+
+    def __contains__(self, n):
+        return n in self._degree
+
+    def to_numpy(self, dtype=None):
+        """Returns the degrees as a NumPy array in node order.
+
+        Parameters
+        ----------
+        dtype : NumPy data-type, optional (default : None)
+            The data type of the array. If None, it is inferred from the degrees.
+
+        Returns
+        -------
+        degrees : numpy.ndarray
+            ``degrees[i]`` is the degree of the node with index ``i`` in
+            ``G.csr()``.
+
+        """
+        import numpy as np
+
+        if dtype is None:
+            return np.array(list(self._degree.values()))
+        return np.fromiter(self._degree.values(), dtype, len(self._degree))
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self._degree)
@@ -0,0 +1,507 @@
+import easygraph as eg
+import pytest
+
+
+np = pytest.importorskip("numpy")
+
+
+class TestCSR:
+    def setup_method(self):
+        self.G = eg.Graph()
+        self.G.add_edges([("a", "b"), ("b", "c")], edges_attr=[{"weight": 3}, {}])
+        self.G.add_node("d")
+
+    def test_undirected(self):
+        csr = self.G.csr()
+        assert csr.nodes == ["a", "b", "c", "d"]
+        assert csr.node_index == {"a": 0, "b": 1, "c": 2, "d": 3}
+        assert csr.indptr.tolist() == [0, 1, 3, 4, 4]
+        assert csr.indices.tolist() == [1, 0, 2, 1]
+        assert csr.weights.tolist() == [3.0, 3.0, 1.0, 1.0]
+        assert not csr.directed
+
+    def test_unweighted(self):
+        assert self.G.csr(weight=None).weights.tolist() == [1.0] * 4
+
+    def test_directed(self):
+        G = eg.DiGraph([(1, 2), (2, 3), (3, 1), (1, 3)])
+        csr = G.csr()
+        assert csr.directed
+        assert csr.indptr.tolist() == [0, 2, 3, 4]
+        assert csr.neighbors(0).tolist() == [1, 2]
+        assert csr.neighbors(2).tolist() == [0]
+
+    def test_multigraph_weights_are_summed(self):
+        G = eg.MultiGraph()
+        G.add_edge(1, 2, weight=2)
+        G.add_edge(1, 2, weight=5)
+        assert G.csr().weights.tolist() == [7.0, 7.0]
+
+    def test_read_only(self):
+        with pytest.raises(ValueError):
+            self.G.csr().weights[0] = 10
+
+    def test_cached_until_mutation(self):
+        csr = self.G.csr()
+        assert self.G.csr() is csr
+        assert self.G.csr(weight=None) is not csr
+
+        self.G.add_edge("c", "d")
+        new_csr = self.G.csr()
+        assert new_csr is not csr
+        assert new_csr.indptr.tolist() == [0, 1, 3, 5, 6]
+
+        self.G.remove_node("a")
+        assert self.G.csr().nodes == ["b", "c", "d"]
+
+        self.G.remove_edge("c", "d")
+        assert self.G.csr().nnz == 2
+
+    def test_transpose(self):
+        G = eg.DiGraph([(1, 2, {"weight": 4}), (2, 3), (3, 1), (1, 3)])
+        pred = G.csr().transpose()
+        assert pred.indptr.tolist() == [0, 1, 2, 4]
+        assert pred.indices.tolist() == [2, 0, 0, 1]
+        assert pred.weights.tolist() == [1.0, 4.0, 1.0, 1.0]
+        assert self.G.csr().transpose() is self.G.csr()
+
+    def test_shared_memory(self):
+        pytest.importorskip("multiprocessing.shared_memory")
+        import pickle
+
+        G = eg.DiGraph([(1, 2, {"weight": 4}), (2, 3)])
+        with G.csr().share() as shared:
+            handle = pickle.loads(pickle.dumps(shared.handle))
+            csr, pred = handle.attach()
+            assert csr.indptr.tolist() == G.csr().indptr.tolist()
+            assert csr.weights.tolist() == [4.0, 1.0]
+            assert pred.indices.tolist() == G.csr().transpose().indices.tolist()
+            assert not csr.weights.flags.writeable
+            H = eg.csr_view(csr, pred)
+            assert H.adj == {1: {2: {"weight": 4.0}}, 2: {3: {"weight": 1.0}}, 3: {}}
+            assert H._pred == {1: {}, 2: {1: {"weight": 4.0}}, 3: {2: {"weight": 1.0}}}
+            del H, csr, pred, handle
+
+    def test_csr_view(self):
+        H = eg.csr_view(self.G.csr())
+        assert list(H.nodes) == ["a", "b", "c", "d"] and H.nodes["a"] == {}
+        assert H["a"]["b"] == {"weight": 3.0} and "d" in H and "e" not in H
+        assert list(H.edges(data=False)) == [("a", "b"), ("b", "c")]
+        assert H.csr() is self.G.csr()
+        assert eg.closeness_centrality(H) == eg.closeness_centrality(self.G)
+        with pytest.raises(eg.EasyGraphError):
+            H.add_edge("a", "d")
+
+    def test_directed_cached_until_mutation(self):
+        G = eg.DiGraph([(1, 2)])
+        csr = G.csr()
+        G.remove_edges_from([(1, 2)])
+        assert G.csr() is not csr
+        assert G.csr().nnz == 0
+
+
+class TestEdgeView:
+    def setup_method(self):
+        self.G = eg.Graph()
+        self.G.add_edges([(1, 2), (2, 3), (3, 3)], edges_attr=[{"weight": 2}, {}, {}])
+
+    def test_iter_reports_each_edge_once(self):
+        assert list(self.G.edges) == [
+            (1, 2, {"weight": 2}),
+            (2, 3, {}),
+            (3, 3, {}),
+        ]
+        assert len(self.G.edges) == 3
+        assert self.G.number_of_edges() == 3
+        assert self.G.size() == 3
+
+    def test_contains(self):
+        assert (2, 1) in self.G.edges
+        assert (3, 3) in self.G.edges
+        assert (1, 3) not in self.G.edges
+        assert (4, 1) not in self.G.edges
+
+    def test_filters(self):
+        assert list(self.G.edges(data=False)) == [(1, 2), (2, 3), (3, 3)]
+        assert list(self.G.edges(data="weight", default=1)) == [
+            (1, 2, 2),
+            (2, 3, 1),
+            (3, 3, 1),
+        ]
+        view = self.G.edges(nbunch=[1])
+        assert list(view) == [(1, 2, {"weight": 2})]
+        assert len(view) == 1
+        assert (2, 1) in view
+        assert (2, 3) not in view
+
+    def test_nbunch_duplicates_and_missing_nodes(self):
+        view = self.G.edges(nbunch=[1, 1, 2, 9], data=False)
+        assert list(view) == [(1, 2), (2, 3)]
+        assert len(view) == 2
+        G = eg.DiGraph([(1, 2), (1, 3), (2, 3)])
+        view = G.edges(nbunch=[1, 1, 9], data=False)
+        assert list(view) == [(1, 2), (1, 3)]
+        assert len(view) == 2
+        G.remove_node(1)
+        assert list(view) == []
+        assert len(view) == 0
+
+    def test_indexing(self):
+        assert self.G.edges[0] == (1, 2, {"weight": 2})
+        assert self.G.edges[-1] == (3, 3, {})
+        assert self.G.edges(data=False)[1:] == [(2, 3), (3, 3)]
+        with pytest.raises(IndexError):
+            self.G.edges[3]
+        with pytest.raises(TypeError):
+            self.G.edges[1, 2]
+
+    def test_len_follows_mutation(self):
+        edges = self.G.edges
+        assert len(edges) == 3
+        self.G.add_edge(1, 4)
+        assert len(edges) == 4
+        self.G.remove_edge(3, 3)
+        assert len(edges) == 3
+
+    def test_remove_edges_of_the_view(self):
+        self.G.remove_edges(self.G.edges)
+        assert len(self.G.edges) == 0
+        G = eg.DiGraph([(1, 2), (2, 1), (2, 2)])
+        G.remove_edges_from(G.edges)
+        assert len(G.edges) == 0
+
+    def test_directed(self):
+        G = eg.DiGraph([(1, 2), (2, 1), (2, 2)])
+        assert list(G.edges(data=False)) == [(1, 2), (2, 1), (2, 2)]
+        assert len(G.edges) == 3
+        assert (2, 1) in G.edges
+        assert (1, 1) not in G.edges
+
+
+class TestDegreeView:
+    def setup_method(self):
+        self.G = eg.Graph()
+        self.G.add_edges([(1, 2), (2, 3), (3, 3)], edges_attr=[{"weight": 2}, {}, {}])
+        self.G.add_node(4)
+
+    def test_undirected(self):
+        assert self.G.degree() == {1: 2, 2: 3, 3: 3, 4: 0}
+        assert self.G.degree(weight=None) == {1: 1, 2: 2, 3: 3, 4: 0}
+        assert self.G.size(weight="weight") == 4
+
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            self.G.degree()[1] = 5
+
+    def test_cached_until_mutation(self):
+        degree = self.G.degree()
+        assert self.G.degree()._degree is degree._degree
+        self.G.add_edge(1, 4, weight=5)
+        assert self.G.degree()[1] == 7
+        assert self.G.degree()[4] == 5
+        self.G.remove_node(1)
+        assert 1 not in self.G.degree()
+
+    def test_to_numpy(self):
+        degree = self.G.degree().to_numpy(dtype=float)
+        csr = self.G.csr()
+        assert degree.tolist() == [2.0, 3.0, 3.0, 0.0]
+        assert degree[csr.node_index[2]] == 3.0
+
+    def test_directed(self):
+        G = eg.DiGraph()
+        G.add_edges([(1, 2), (1, 3), (3, 1)], edges_attr=[{"weight": 4}, {}, {}])
+        assert G.out_degree() == {1: 5, 2: 0, 3: 1}
+        assert G.in_degree() == {1: 1, 2: 4, 3: 1}
+        assert G.degree(weight=None) == {1: 3, 2: 1, 3: 2}
+        G.remove_edge(1, 2)
+        assert G.in_degree()[2] == 0
+        assert G.degree()[1] == 2
+
+    def test_degree_centrality(self):
+        G = eg.DiGraph([(1, 2), (1, 3)])
+        assert eg.degree_centrality(G) == {1: 1.0, 2: 0.5, 3: 0.5}
+        assert eg.out_degree_centrality(G) == {1: 1.0, 2: 0.0, 3: 0.0}
+
+
+class TestColumnarGraph:
+    def setup_method(self):
+        self.G = eg.ColumnarGraph(node_columns={"size": "int64"})
+        self.G.add_edge(1, 2, weight=2.5, color="red")
+        self.G.add_edges([(2, 3), (3, 4)], edges_attr=[{"weight": 3}, {}])
+        self.G.add_node(1, size=5)
+
+    def test_attributes_look_like_dicts(self):
+        assert self.G[1][2] == {"weight": 2.5, "color": "red"}
+        assert self.G[2][1] is self.G[1][2]
+        assert self.G[2][3]["weight"] == 3.0
+        assert "weight" not in self.G[3][4]
+        assert self.G.nodes[1] == {"size": 5}
+
+        self.G[3][4]["weight"] = "heavy"
+        assert self.G[3][4]["weight"] == "heavy"
+        self.G[3][4]["weight"] = 4
+        assert self.G[3][4] == {"weight": 4.0}
+        del self.G[1][2]["color"]
+        assert self.G[1][2] == {"weight": 2.5}
+
+    def test_columns(self):
+        values, present = self.G.edge_attr_column("weight")
+        csr = self.G.csr()
+        assert csr.edge_ids.tolist() == [0, 0, 1, 1, 2, 2]
+        assert values[csr.edge_ids].tolist() == [2.5, 2.5, 3.0, 3.0, 0.0, 0.0]
+        assert present.tolist() == [True, True, False]
+        assert csr.weights.tolist() == [2.5, 2.5, 3.0, 3.0, 1.0, 1.0]
+        assert self.G.node_attr_column("size", default=-1).tolist() == [5, -1, -1, -1]
+
+    def test_edge_ids_are_recycled(self):
+        self.G.remove_edge(1, 2)
+        self.G.add_edge(5, 6)
+        assert self.G[5][6] == {}
+        assert self.G.csr().edge_ids.tolist() == [1, 1, 2, 2, 0, 0]
+
+    def test_copy(self):
+        G = eg.ColumnarDiGraph(edge_columns={"cost": "int64"}, node_columns={"x": "f8"})
+        G.add_edges([(1, 2), (2, 3)], edges_attr=[{"cost": 4, "label": "a"}, {}])
+        G.add_node(1, x=0.5)
+        H = G.copy()
+        assert H[1][2] == {"cost": 4, "label": "a"} and H.nodes[1] == {"x": 0.5}
+        assert H._pred[2][1] is H[1][2]
+        assert H.edge_attr_column("cost")[0].tolist() == [4, 0]
+        H[1][2]["cost"] = 7
+        H.add_edge(3, 4, cost=1)
+        assert G[1][2]["cost"] == 4 and not G.has_edge(3, 4)
+        assert H._edge_store.columns.keys() == {"cost"}
+        assert H.node_attr_column("x").tolist() == [0.5, 0.0, 0.0, 0.0]
+
+    def test_columns_grow(self):
+        for i in range(3000):
+            self.G.add_edge(i + 10, i + 11, weight=i)
+        assert self.G[2000][2001]["weight"] == 1990.0
+        assert self.G.size(weight="weight") == sum(range(3000)) + 5.5 + 1
+
+    def test_directed(self):
+        G = eg.ColumnarDiGraph([(1, 2), (2, 3)])
+        G[1][2]["weight"] = 4
+        assert G.out_degree() == {1: 4.0, 2: 1, 3: 0}
+        assert G.csr().weights.tolist() == [4.0, 1.0]
+
+
+class TestAddEdgesFromArrays:
+    def test_matches_add_edge(self):
+        src = np.array([1, 2, 3, 1, 2])
+        dst = np.array([2, 3, 1, 2, 2])
+        weights = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        labels = np.array(["a", "b", "c", "d", "e"])
+        G = eg.Graph()
+        G.add_edges_from_arrays(src, dst, weights=weights, label=labels)
+        H = eg.Graph()
+        for u, v, w, label in zip(src.tolist(), dst.tolist(), weights, labels):
+            H.add_edge(u, v, weight=w, label=label)
+        assert list(G.edges) == list(H.edges)
+        assert all(list(G.adj[n]) == list(H.adj[n]) for n in H)
+        assert G[2][1] is G[1][2]
+        assert G[1][2] == {"weight": 4.0, "label": "d"}
+
+    def test_existing_edges_and_objects(self):
+        G = eg.Graph([("a", "b")])
+        src = np.empty(2, dtype=object)
+        src[:] = ["b", (1, 2)]
+        G.add_edges_from_arrays(src, np.array(["a", "c"], dtype=object), [2, 3])
+        assert list(G.edges) == [
+            ("a", "b", {"weight": 2}),
+            ((1, 2), "c", {"weight": 3}),
+        ]
+
+    def test_directed(self):
+        G = eg.DiGraph()
+        G.add_edges_from_arrays(["a", "b", "a"], ["b", "a", "b"], weights=[1, 2, 3])
+        assert list(G.edges) == [("a", "b", {"weight": 3}), ("b", "a", {"weight": 2})]
+        assert G._pred == {"a": {"b": {"weight": 2}}, "b": {"a": {"weight": 3}}}
+        assert G.in_degree() == {"a": 2, "b": 3}
+
+    def test_columnar(self):
+        G = eg.ColumnarGraph(edge_columns={"weight": "float64", "cost": "int64"})
+        G.add_edges_from_arrays(
+            np.arange(3), np.arange(1, 4), weights=np.arange(3.0), cost=[5, 6, 7]
+        )
+        assert G[2][1] == {"weight": 1.0, "cost": 6}
+        assert G.csr().weights.tolist() == [0.0, 0.0, 1.0, 1.0, 2.0, 2.0]
+
+    def test_empty(self):
+        empty = np.array([], dtype=int)
+        for cls in [eg.Graph, eg.DiGraph, eg.ColumnarGraph]:
+            G = cls([(1, 2)])
+            G.add_edges_from_arrays(empty, empty)
+            G.add_edges_from_arrays(empty, empty, weights=np.array([]))
+            assert list(G.nodes) == [1, 2]
+            assert G.number_of_edges() == 1
+
+    def test_columnar_weights_view(self):
+        G = eg.ColumnarDiGraph()
+        G.add_edges_from_arrays([0, 0, 1, 2], [1, 2, 2, 0], weights=[1.0, 2, 3, 4])
+        values, present = G.edge_attr_column("weight")
+        weights = G.csr().weights
+        assert weights.tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert np.shares_memory(weights, values)
+        H = eg.ColumnarGraph()
+        H.add_edges_from_arrays([0, 1], [1, 2], weights=[1.0, 2.0])
+        assert H.csr().weights.tolist() == [1.0, 1.0, 2.0, 2.0]
+
+    def test_wrong_lengths(self):
+        with pytest.raises(eg.EasyGraphError):
+            eg.Graph().add_edges_from_arrays([1, 2], [3])
+        with pytest.raises(eg.EasyGraphError):
+            eg.Graph().add_edges_from_arrays([1, 2], [3, 4], weights=[1])
+
+
+class TestCopy:
+    def setup_method(self):
+        self.G = eg.Graph(name="g")
+        self.G.add_edges([(1, 2), (2, 3), (3, 3)], edges_attr=[{"weight": 2}, {}, {}])
+        self.G.add_node(4, color="red")
+
+    def test_copy(self):
+        H = self.G.copy()
+        assert H.graph == {"name": "g"}
+        assert H.nodes == self.G.nodes and H.adj == self.G.adj
+        assert H[1][2] is H[2][1]
+        assert H[1][2] is not self.G[1][2]
+        H[1][2]["weight"] = 5
+        H.nodes[4]["color"] = "blue"
+        H.remove_node(3)
+        assert self.G[1][2]["weight"] == 2
+        assert self.G.nodes[4]["color"] == "red"
+        assert self.G.has_edge(3, 3)
+
+    def test_share_attrs(self):
+        H = self.G.copy(share_attrs=True)
+        assert H.adj == self.G.adj
+        assert H[1][2] is self.G[1][2]
+        H.remove_node(2)
+        H.add_edge(1, 4)
+        assert list(self.G.adj[1]) == [2]
+        assert self.G.number_of_edges() == 3
+
+    def test_directed(self):
+        G = eg.DiGraph([(1, 2), (2, 1)])
+        for H in (G.copy(), G.copy(share_attrs=True)):
+            assert H.adj == G.adj and H._pred == G._pred
+            assert H._pred[2][1] is H[1][2]
+            H.remove_edge(1, 2)
+            assert G.has_edge(1, 2)
+
+
+class TestSubgraphView:
+    def setup_method(self):
+        self.G = eg.Graph([(1, 2, {"weight": 3}), (2, 3), (3, 4), (1, 1)])
+
+    def test_subgraph(self):
+        H = self.G.subgraph([1, 2, 3, 9])
+        assert set(H.nodes) == {1, 2, 3}
+        assert list(H.edges(data=False)) == [(1, 2), (1, 1), (2, 3)]
+        assert H[1][2] is self.G[1][2]
+        assert dict(H.degree()) == {1: 5, 2: 4, 3: 1}
+        assert 4 not in H and not H.has_edge(3, 4)
+
+    def test_follows_base_graph(self):
+        H = self.G.subgraph([1, 2, 3])
+        assert len(H.edges) == 3 and H.csr().indptr.tolist() == [0, 2, 4, 5]
+        self.G.add_edge(1, 3)
+        self.G.add_edge(3, 5)
+        assert len(H.edges) == 4 and H.csr().indptr.tolist() == [0, 3, 5, 7]
+        assert 5 not in H
+
+    def test_read_only(self):
+        H = self.G.subgraph([1, 2])
+        with pytest.raises(eg.EasyGraphError):
+            H.add_edge(1, 3)
+        with pytest.raises(eg.EasyGraphError):
+            H.remove_node(1)
+        D = eg.DiGraph([(1, 2), (2, 3)]).subgraph([1, 2])
+        with pytest.raises(eg.EasyGraphError):
+            D.remove_edges_from([(1, 2)])
+        assert D.has_edge(1, 2)
+        C = H.copy()
+        C.add_edge(1, 3)
+        assert C.adj == {
+            1: {2: {"weight": 3}, 1: {}, 3: {}},
+            2: {1: {"weight": 3}},
+            3: {1: {}},
+        }
+        assert not self.G.has_edge(1, 3)
+
+    def test_ego_subgraph(self):
+        for G in (self.G, eg.DiGraph([(1, 2), (3, 2), (2, 4), (4, 1)])):
+            E = G.ego_subgraph(2, as_view=True)
+            assert E.adj == G.ego_subgraph(2).adj
+
+    def test_edge_filter_directed(self):
+        G = eg.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4)])
+        H = eg.subgraph_view(G, filter_edge=lambda u, v: u != 3)
+        assert list(H.edges(data=False)) == [(1, 2), (2, 3)]
+        assert dict(H.in_degree()) == {1: 0, 2: 1, 3: 1, 4: 0}
+        assert list(H._pred[1]) == []
+
+
+class TestJournal:
+    def test_version(self):
+        G = eg.Graph()
+        versions = [G.version]
+        G.add_edge(1, 2)
+        versions.append(G.version)
+        G.add_edge(1, 2, weight=3)
+        versions.append(G.version)
+        G.remove_node(1)
+        versions.append(G.version)
+        assert versions == sorted(set(versions))
+
+    def test_changes_since(self):
+        G = eg.Graph([(1, 2)])
+        assert G.changes_since(G.version) is None
+        G.enable_journal()
+        v = G.version
+        G.add_edge(2, 3)
+        G.add_edge(2, 3, weight=2)
+        G.remove_node(2)
+        changes = [c[1:] for c in G.changes_since(v)]
+        assert changes == [
+            ("add_node", 3),
+            ("add_edge", 2, 3),
+            ("remove_edge", 2, 1),
+            ("remove_edge", 2, 3),
+            ("remove_node", 2),
+        ]
+        assert G.changes_since(G.version) == []
+
+    def test_bounded(self):
+        G = eg.DiGraph()
+        G.enable_journal(maxlen=3)
+        v = G.version
+        G.add_edges_from([(1, 2), (2, 3)])
+        assert len(G.journal) == 3
+        assert G.changes_since(v) is None
+        w = G.version
+        G.remove_edge(1, 2)
+        assert [c[1:] for c in G.changes_since(w)] == [("remove_edge", 1, 2)]
+
+    def test_multigraph_keys(self):
+        G = eg.MultiGraph()
+        G.enable_journal()
+        G.add_edges_from([(1, 2), (1, 2)])
+        G.remove_node(2)
+        changes = [c[1:] for c in G.changes_since(0) if c[1].endswith("edge")]
+        assert changes == [
+            ("add_edge", 1, 2, 0),
+            ("add_edge", 1, 2, 1),
+            ("remove_edge", 2, 1, 0),
+            ("remove_edge", 2, 1, 1),
+        ]
+
+    def test_edge_arrays(self):
+        G = eg.Graph([(1, 2)])
+        G.enable_journal()
+        v = G.version
+        G.add_edges_from_arrays(np.array([1, 2]), np.array([2, 3]))
+        changes = [c[1:] for c in G.changes_since(v)]
+        assert changes == [("add_node", 3), ("add_edge", 2, 3)]
@@ -59,3 +59,17 @@ class TestMultiGraph:
         assert G.adj == {1: {2: {0: {}}}, 2: {1: {0: {}}}}
         with pytest.raises(eg.EasyGraphError):
             G.remove_node(-1)
+
+    def test_copy_share_attrs(self):
+        for cls in [eg.MultiGraph, eg.MultiDiGraph]:
+            G = cls()
+            G.add_edges_from([(1, 2, {"weight": 3}), (1, 2), (2, 2)])
+            H = G.copy(share_attrs=True)
+            assert H.adj == G.adj
+            assert H[1][2][0] is G[1][2][0]
+            if G.is_directed():
+                assert H._pred[2][1] is H[1][2]
+            else:
+                assert H[2][1] is H[1][2]
+            H.remove_edge(1, 2)
+            assert len(G[1][2]) == 2 and len(H[1][2]) == 1
@@ -13,3 +13,34 @@ def test_selfloops(graph_type):
     assert edges_equal(eg.selfloop_edges(G), [(0, 0)])
     assert edges_equal(eg.selfloop_edges(G, data=True), [(0, 0, {})])
     assert eg.number_of_selfloops(G) == 1
+
+
+@pytest.mark.parametrize("graph_type", [eg.Graph, eg.DiGraph])
+def test_set_attributes_clears_cache(graph_type):
+    G = graph_type([(1, 2), (2, 3), (1, 3)])
+    csr = G.csr()
+    degree = G.degree(weight="weight")
+    version = G.version
+    eg.set_edge_attributes(G, {(1, 3): 10}, "weight")
+    assert G.version > version
+    assert G.csr() is not csr
+    assert G.degree(weight="weight")[3] == degree[3] + 9
+    bc = eg.betweenness_centrality(G, weight="weight", normalized=False)
+    assert bc == eg.betweenness_centrality(
+        G, weight="weight", normalized=False, engine="dict"
+    )
+    assert bc[2] > 0
+
+    version = G.version
+    eg.set_node_attributes(G, {1: "red"}, "color")
+    assert G.version > version
+
+
+def test_set_attributes_of_a_view_clears_cache():
+    G = eg.Graph([(1, 2), (2, 3), (1, 3)])
+    view = G.subgraph([1, 3])
+    assert view.csr().weights.tolist() == [1.0, 1.0]
+    csr = G.csr()
+    eg.set_edge_attributes(view, {(1, 3): 10}, "weight")
+    assert G.csr() is not csr
+    assert view.csr().weights.tolist() == [10.0, 10.0]
@@ -96,23 +96,11 @@ def get_graph_blogcatalog():
     """
     from scipy.io import loadmat
 
-    def sparse2graph(x):
-        from collections import defaultdict
-
-        G = defaultdict(lambda: set())
-        cx = x.tocoo()
-        for i, j, v in zip(cx.row, cx.col, cx.data):
-            G[i].add(j)
-        return {str(k): [str(x) for x in v] for k, v in G.items()}
-
     mat = loadmat("./samples/blogcatalog.mat")
-    A = mat["network"]
-    data = sparse2graph(A)
+    A = mat["network"].tocoo()
 
     G = eg.Graph()
-    for u in data:
-        for v in data[u]:
-            G.add_edge(u, v)
+    G.add_edges_from_arrays(A.row.astype(str), A.col.astype(str))
 
     return G
 
@@ -131,26 +119,18 @@ def get_graph_youtube():
     .. [1] http://socialnetworks.mpi-sws.mpg.de/data/youtube-links.txt.gz
 
     """
-    import gzip
-
     from urllib import request
 
     url = "http://socialnetworks.mpi-sws.mpg.de/data/youtube-links.txt.gz"
     zipped_data_path = "./samples/youtube-links.txt.gz"
-    unzipped_data_path = "./samples/youtube-links.txt"
 
     # Download .gz file
     print("Downloading Youtube dataset...")
     request.urlretrieve(url, zipped_data_path, _show_progress)
 
-    # Unzip
-    unzipped_data = gzip.GzipFile(zipped_data_path)
-    open(unzipped_data_path, "wb+").write(unzipped_data.read())
-    unzipped_data.close()
-
-    # Returns graph
+    # Returns graph, read from the .gz file in chunks
     G = eg.Graph()
-    G.add_edges_from_file(file=unzipped_data_path)
+    G.add_edges_from_file(file=zipped_data_path)
     return G
 
 
@@ -168,26 +148,18 @@ def get_graph_flickr():
     .. [1] http://socialnetworks.mpi-sws.mpg.de/data/flickr-links.txt.gz
 
     """
-    import gzip
-
     from urllib import request
 
     url = "http://socialnetworks.mpi-sws.mpg.de/data/flickr-links.txt.gz"
     zipped_data_path = "./samples/flickr-links.txt.gz"
-    unzipped_data_path = "./samples/flickr-links.txt"
 
     # Download .gz file
     print("Downloading Flickr dataset...")
     request.urlretrieve(url, zipped_data_path, _show_progress)
 
-    # Unzip
-    unzipped_data = gzip.GzipFile(zipped_data_path)
-    open(unzipped_data_path, "wb+").write(unzipped_data.read())
-    unzipped_data.close()
-
-    # Returns graph
+    # Returns graph, read from the .gz file in chunks
     G = eg.Graph()
-    G.add_edges_from_file(file=unzipped_data_path)
+    G.add_edges_from_file(file=zipped_data_path)
     return G
 
 
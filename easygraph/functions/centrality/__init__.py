@@ -1,4 +1,8 @@
 from .betweenness import *
 from .clossness import *
 from .degree import *
+from .dynamic_betweenness import *
+from .eigenvector import *
 from .flowbetweenness import *
+from .hits import *
+from .katz import *
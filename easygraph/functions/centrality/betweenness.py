@@ -1,9 +1,15 @@
+import math
+import random
+
+from collections import deque
+
 from easygraph.utils import *
 from easygraph.utils.decorators import *
 
 
 __all__ = [
     "betweenness_centrality",
+    "edge_betweenness_centrality",
 ]
 
 
@@ -15,9 +21,26 @@ def betweenness_centrality_parallel(nodes, G, path_length, accumulate):
     return betweenness
 
 
+def _csr_betweenness_parallel(nodes, G, weight, endpoints):
+    csr = G.csr(weight)
+    node_index = csr.node_index
+    sources = [node_index[node] for node in nodes]
+    return dict(zip(csr.nodes, _csr_betweenness(csr, sources, weight, endpoints)))
+
+
 @not_implemented_for("multigraph")
 def betweenness_centrality(
-    G, weight=None, normalized=True, endpoints=False, n_workers=None
+    G,
+    weight=None,
+    normalized=True,
+    endpoints=False,
+    n_workers=None,
+    engine="csr",
+    k=None,
+    epsilon=None,
+    delta=0.1,
+    seed=None,
+    return_error=False,
 ):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
@@ -59,12 +82,257 @@ def betweenness_centrality(
     endpoints : bool, optional
       If True include the endpoints in the shortest path counts.
 
+    n_workers : int or None, optional (default=None)
+      The number of workers. If None, the computation is serial.
+
+    engine : {'csr', 'dict'}, optional (default='csr')
+      'csr' runs Brandes' algorithm over the integer indices of the CSR
+      snapshot of `G`, reusing the same sigma/delta/distance arrays for every
+      source. 'dict' runs it over the adjacency dicts of `G`. The snapshot
+      is cached by `G` until it is modified, weights written into
+      ``G[u][v]`` directly are not detected, see :meth:`easygraph.Graph.csr`.
+
+    k : int or None, optional (default=None)
+      If not None, only `k` sources sampled uniformly at random are used,
+      and the result is scaled by `n/k` to estimate the betweenness [3]_.
+
+    epsilon : float or None, optional (default=None)
+      If not None, the betweenness is estimated from shortest paths between
+      pairs of nodes sampled uniformly at random, so that every estimate is
+      within `epsilon` of the exact betweenness normalized by
+      `1/(n(n-1))`, with probability at least `1 - delta` [4]_. The number
+      of samples depends on `epsilon`, `delta` and the vertex diameter of
+      `G`, not on its size. It must be between 0 and 1, and needs the
+      'csr' engine.
+
+    delta : float, optional (default=0.1)
+      The probability that the error bound of a sampled estimate fails,
+      between 0 and 1.
+
+    seed : int or None, optional (default=None)
+      The seed of the random sampling.
+
+    return_error : bool, optional (default=False)
+      If True, also return the error bound.
+
     Returns
     -------
     nodes : dictionary
        Dictionary of nodes with betweenness centrality as the value.
+
+    error : float
+       Only if `return_error` is True. With probability at least
+       `1 - delta`, every value in `nodes` is within `error` of the exact
+       one, on the same scale. It is 0 for exact computations.
+
+    Examples
+    --------
+    Estimate the normalized betweenness within 0.01 with probability 0.9:
+
+    >>> bc, error = eg.betweenness_centrality(G, epsilon=0.01, return_error=True)
+
+    References
+    ----------
+    .. [3] Brandes U., Pich C. Centrality estimation in large networks.
+       International Journal of Bifurcation and Chaos, 2007.
+    .. [4] Riondato M., Kornaropoulos E. M. Fast approximation of betweenness
+       centrality through sampling. Data Mining and Knowledge Discovery, 2016.
+    """
+
+    if engine not in ("csr", "dict"):
+        raise ValueError("engine must be 'csr' or 'dict', not {!r}.".format(engine))
+    if k is not None and epsilon is not None:
+        raise ValueError("Pass either k or epsilon, not both.")
+    if epsilon is not None and not 0 < epsilon < 1:
+        raise ValueError("epsilon must be between 0 and 1, exclusive.")
+    if (k is not None or epsilon is not None) and not 0 < delta < 1:
+        raise ValueError("delta must be between 0 and 1, exclusive.")
+
+    n = len(G)
+    error = 0.0
+    if epsilon is not None:
+        if engine != "csr":
+            raise ValueError("epsilon needs the 'csr' engine.")
+        betweenness, error = _path_sampling_betweenness(
+            G, weight, endpoints, epsilon, delta, seed, n_workers
+        )
+    else:
+        nodes = G.nodes
+        if k is not None:
+            if not 0 < k <= n:
+                raise ValueError("k must be between 1 and the number of nodes.")
+            nodes = random.Random(seed).sample(list(G), k)
+        if engine == "csr":
+            betweenness = _csr_brandes(G, nodes, weight, endpoints, n_workers)
+        else:
+            betweenness = _dict_brandes(G, nodes, weight, endpoints, n_workers)
+        if k is not None and k < n:
+            # Hoeffding's bound for every node, where each source adds at
+            # most n - 2 (n - 1 with endpoints) to the betweenness of a node.
+            most = n - 1 if endpoints else n - 2
+            error = n * most * math.sqrt(math.log(2 * n / delta) / (2 * k))
+            for v in betweenness:
+                betweenness[v] *= n / k
+
+    scale = _scale(n, normalized, directed=G.is_directed(), endpoints=endpoints)
+    if scale is not None:
+        for v in betweenness:
+            betweenness[v] *= scale
+        error *= scale
+    if return_error:
+        return betweenness, error
+    return betweenness
+
+
+@not_implemented_for("multigraph")
+def edge_betweenness_centrality(
+    G, weight=None, normalized=True, n_workers=None, engine="csr", with_nodes=False
+):
+    r"""Compute the shortest-path betweenness centrality for edges.
+
+    .. math::
+
+        c_B(e)  = \sum_{s,t \in V} \frac{\sigma(s, t|e)}{\sigma(s, t)}
+
+    where V is the set of nodes, :math:`\sigma(s, t)` is the number of
+    shortest (s, t)-paths, and :math:`\sigma(s, t|e)` is the number of those
+    paths passing through edge e.
+
+    Node and edge betweenness are accumulated in the same dependency pass,
+    so `with_nodes` returns both for the cost of one.
+
+    Parameters
+    ----------
+    G : graph
+      A easygraph graph.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    normalized : bool, optional (default=True)
+      If True the edge betweenness values are normalized by `1/(n(n-1))`,
+      and the node betweenness values as in :func:`betweenness_centrality`.
+
+    n_workers : int or None, optional (default=None)
+      The number of workers. If None, the computation is serial.
+
+    engine : {'csr', 'dict'}, optional (default='csr')
+      See :func:`betweenness_centrality`.
+
+    with_nodes : bool, optional (default=False)
+      If True, also return the node betweenness centrality.
+
+    Returns
+    -------
+    edges : dictionary
+       Dictionary of edges ``(u, v)``, in the order of ``G.edges``, with
+       betweenness centrality as the value.
+
+    nodes : dictionary
+       Only if `with_nodes` is True. Dictionary of nodes with betweenness
+       centrality as the value, equal to ``betweenness_centrality(G,
+       weight=weight, normalized=normalized)``.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2), (2, 3), (3, 4)])
+    >>> eg.edge_betweenness_centrality(G, normalized=False)
+    {(1, 2): 3.0, (2, 3): 4.0, (3, 4): 3.0}
+
+    """
+    if engine not in ("csr", "dict"):
+        raise ValueError("engine must be 'csr' or 'dict', not {!r}.".format(engine))
+
+    if n_workers is not None:
+        betweenness = dict.fromkeys(G, 0.0)
+        dependencies = {}
+        ret = parallel_map(
+            _edge_brandes,
+            G,
+            G.nodes,
+            n_workers,
+            csr_weight=weight,
+            weight=weight,
+            engine=engine,
+        )
+        for node_res, edge_res in ret:
+            for key in node_res:
+                betweenness[key] += node_res[key]
+            for key in edge_res:
+                dependencies[key] = dependencies.get(key, 0) + edge_res[key]
+    else:
+        betweenness, dependencies = _edge_brandes(G.nodes, G, weight, engine)
+
+    n = len(G)
+    directed = G.is_directed()
+    if normalized:
+        edge_scale = 1 / (n * (n - 1)) if n > 1 else None
+    else:  # rescale by 2 for undirected graphs
+        edge_scale = None if directed else 0.5
+    edge_betweenness = {}
+    for u, v, _ in G.edges:
+        value = dependencies.get((u, v), 0.0)
+        if not directed and u != v:
+            value += dependencies.get((v, u), 0.0)
+        edge_betweenness[u, v] = value * edge_scale if edge_scale else value
+    if not with_nodes:
+        return edge_betweenness
+
+    scale = _scale(n, normalized, directed=directed)
+    if scale is not None:
+        for v in betweenness:
+            betweenness[v] *= scale
+    return edge_betweenness, betweenness
+
+
+def _edge_brandes(nodes, G, weight, engine):
+    """Sums the node and edge dependencies of the sources `nodes`.
+
+    Returns the node betweenness and the dependencies of the ordered pairs
+    ``(v, w)`` of adjacent nodes, not rescaled.
     """
+    if engine == "dict":
+        betweenness = dict.fromkeys(G, 0.0)
+        dependencies = {}
+        for node in nodes:
+            if weight is None:
+                S, P, sigma = _single_source_bfs_path(G, node)
+            else:
+                S, P, sigma = _single_source_dijkstra_path(G, node, weight=weight)
+            _accumulate_edges(betweenness, dependencies, S, P, sigma, node)
+        return betweenness, dependencies
+
+    csr = _csr_of(G, weight)
+    node_index = csr.node_index
+    n = len(csr)
+    rows, row_weights = _csr_rows(csr, weight)
+    bc = [0.0] * n
+    edges = {}
+    sigma = [0.0] * n
+    dist = [-1] * n
+    P = [[] for _ in range(n)]
+    S = []
+    for node in nodes:
+        s = node_index[node]
+        if weight is None:
+            _csr_bfs(rows, s, S, P, sigma, dist)
+        else:
+            _csr_dijkstra(rows, row_weights, s, S, P, sigma, dist)
+        _accumulate_edges(bc, edges, S, P, sigma, s)
+        for w in S:
+            sigma[w] = 0.0
+            dist[w] = -1
+            P[w].clear()
+        S.clear()
+
+    nodes = csr.nodes
+    dependencies = {(nodes[v], nodes[w]): c for (v, w), c in edges.items()}
+    return dict(zip(nodes, bc)), dependencies
 
+
+def _dict_brandes(G, nodes, weight, endpoints, n_workers):
+    """Sums the dependencies of the sources `nodes` over the adjacency dicts."""
     import functools
 
     if weight is not None:
@@ -77,51 +345,319 @@ def betweenness_centrality(
     else:
         accumulate = functools.partial(_accumulate_basic)
 
-    nodes = G.nodes
     betweenness = dict.fromkeys(G, 0.0)
 
     if n_workers is not None:
         #  use the parallel version for large graph
-        import random
-
-        from functools import partial
-        from multiprocessing import Pool
-
-        nodes = list(nodes)
-        random.shuffle(nodes)
-
-        if len(nodes) > n_workers * 30000:
-            nodes = split_len(nodes, step=30000)
-        else:
-            nodes = split(nodes, n_workers)
-        local_function = partial(
+        ret = parallel_map(
             betweenness_centrality_parallel,
-            G=G,
+            G,
+            nodes,
+            n_workers,
+            csr_weight=weight,
             path_length=path_length,
             accumulate=accumulate,
         )
-        with Pool(n_workers) as p:
-            ret = p.imap(local_function, nodes)
-            for res in ret:
-                for key in res:
-                    betweenness[key] += res[key]
+        for res in ret:
+            for key in res:
+                betweenness[key] += res[key]
     else:
         # use np-parallel version for small graph
         for node in nodes:
             S, P, sigma = path_length(G, source=node)
             betweenness = accumulate(betweenness, S, P, sigma, node)
+    return betweenness
+
+
+def _csr_brandes(G, nodes, weight, endpoints, n_workers):
+    """Sums the dependencies of the sources `nodes` over the CSR snapshot."""
+    if n_workers is not None:
+        betweenness = dict.fromkeys(G, 0.0)
+        ret = parallel_map(
+            _csr_betweenness_parallel,
+            G,
+            nodes,
+            n_workers,
+            csr_weight=weight,
+            weight=weight,
+            endpoints=endpoints,
+        )
+        for res in ret:
+            for key in res:
+                betweenness[key] += res[key]
+        return betweenness
+    csr = _csr_of(G, weight)
+    node_index = csr.node_index
+    sources = [node_index[node] for node in nodes]
+    return dict(zip(csr.nodes, _csr_betweenness(csr, sources, weight, endpoints)))
+
+
+def _path_sampling_betweenness(G, weight, endpoints, epsilon, delta, seed, n_workers):
+    """Estimates the betweenness by sampling shortest paths [4]_.
 
-    betweenness = _rescale(
-        betweenness,
-        len(G),
-        normalized=normalized,
-        directed=G.is_directed(),
-        endpoints=endpoints,
+    Returns the estimates of the sums over ordered pairs of nodes, as
+    accumulated by Brandes' algorithm, and their error bound.
+    """
+    n = len(G)
+    betweenness = dict.fromkeys(G, 0.0)
+    if n < 2:
+        return betweenness, 0.0
+    csr = _csr_of(G, weight)
+    vd = _vertex_diameter_bound(csr, weight)
+    # Paths of at most vd nodes, of which vd - 2 are inner ones.
+    size = max(vd if endpoints else vd - 2, 1)
+    r = math.ceil(
+        0.5 / epsilon**2 * (math.floor(math.log2(size)) + 1 + math.log(1 / delta))
     )
+
+    # Pairs are grouped by source, so that each source is searched once.
+    # Each source gets its own seed, so that results do not depend on how
+    # sources are split between workers.
+    rng = random.Random(seed)
+    nodes = csr.nodes
+    targets = {}
+    for _ in range(r):
+        s = rng.randrange(n)
+        t = rng.randrange(n - 1)
+        if t >= s:
+            t += 1
+        if nodes[s] not in targets:
+            targets[nodes[s]] = (rng.getrandbits(64), [])
+        targets[nodes[s]][1].append(nodes[t])
+
+    if n_workers is not None:
+        ret = parallel_map(
+            _csr_path_counts_parallel,
+            G,
+            list(targets),
+            n_workers,
+            csr_weight=weight,
+            weight=weight,
+            endpoints=endpoints,
+            targets=targets,
+        )
+        for res in ret:
+            for key in res:
+                betweenness[key] += res[key]
+    else:
+        betweenness = _path_counts(csr, targets, weight, endpoints, targets)
+
+    # Each path is a sample of the betweenness normalized by 1/(n(n-1)).
+    pairs = n * (n - 1)
+    for v in betweenness:
+        betweenness[v] *= pairs / r
+    return betweenness, epsilon * pairs
+
+
+def _csr_path_counts_parallel(nodes, G, weight, endpoints, targets):
+    return _path_counts(G.csr(weight), nodes, weight, endpoints, targets)
+
+
+def _path_counts(csr, nodes, weight, endpoints, targets):
+    node_index = csr.node_index
+    pairs = {
+        node_index[s]: (targets[s][0], [node_index[t] for t in targets[s][1]])
+        for s in nodes
+    }
+    return dict(zip(csr.nodes, _csr_path_counts(csr, pairs, weight, endpoints)))
+
+
+def _csr_of(G, weight):
+    if hasattr(G, "csr"):
+        return G.csr(weight)
+    # e.g. GraphC, which does not cache snapshots.
+    from easygraph.classes.csr import CSRGraph
+
+    return CSRGraph.from_graph(G, weight=weight)
+
+
+def _csr_betweenness(csr, sources, weight, endpoints):
+    """Accumulates the dependencies of `sources` over a CSR snapshot.
+
+    Nodes are the integer indices of `csr`. The per-node arrays are
+    allocated once and only the entries reached from a source are reset
+    after it, so each source costs time in the part of the graph it reaches.
+    """
+    n = len(csr)
+    rows, row_weights = _csr_rows(csr, weight)
+
+    betweenness = [0.0] * n
+    sigma = [0.0] * n
+    delta = [0.0] * n
+    dist = [-1] * n
+    P = [[] for _ in range(n)]
+    S = []
+    for s in sources:
+        if weight is None:
+            _csr_bfs(rows, s, S, P, sigma, dist)
+        else:
+            _csr_dijkstra(rows, row_weights, s, S, P, sigma, dist)
+
+        if endpoints:
+            betweenness[s] += len(S) - 1
+        for w in reversed(S):
+            coeff = (1 + delta[w]) / sigma[w]
+            for v in P[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                betweenness[w] += delta[w] + 1 if endpoints else delta[w]
+
+        for w in S:
+            sigma[w] = 0.0
+            delta[w] = 0.0
+            dist[w] = -1
+            P[w].clear()
+        S.clear()
     return betweenness
 
 
-def _rescale(betweenness, n, normalized, directed=False, endpoints=False):
+def _csr_path_counts(csr, pairs, weight, endpoints):
+    """Counts the nodes on one random shortest path per pair of `pairs`.
+
+    `pairs` maps each source index to ``(seed, targets)``. Among the
+    shortest paths from the source to a target, each is picked with the same
+    probability, by walking back from the target and picking each
+    predecessor with a probability proportional to its path count.
+    """
+    n = len(csr)
+    rows, row_weights = _csr_rows(csr, weight)
+
+    counts = [0] * n
+    sigma = [0.0] * n
+    dist = [-1] * n
+    P = [[] for _ in range(n)]
+    S = []
+    for s, (seed, targets) in pairs.items():
+        if weight is None:
+            _csr_bfs(rows, s, S, P, sigma, dist)
+        else:
+            _csr_dijkstra(rows, row_weights, s, S, P, sigma, dist)
+
+        rng = random.Random(seed)
+        for t in targets:
+            if dist[t] < 0:
+                # No path from s to t.
+                continue
+            if endpoints:
+                counts[t] += 1
+            w = t
+            while True:
+                preds = P[w]
+                if len(preds) == 1:
+                    w = preds[0]
+                else:
+                    w = rng.choices(preds, [sigma[v] for v in preds])[0]
+                if w == s:
+                    break
+                counts[w] += 1
+            if endpoints:
+                counts[s] += 1
+
+        for w in S:
+            sigma[w] = 0.0
+            dist[w] = -1
+            P[w].clear()
+        S.clear()
+    return counts
+
+
+def _csr_rows(csr, weight):
+    """Returns the neighbor indices, and weights if any, of every row as lists."""
+    n = len(csr)
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    rows = [indices[indptr[i] : indptr[i + 1]] for i in range(n)]
+    row_weights = None
+    if weight is not None:
+        weights = csr.weights.tolist()
+        row_weights = [weights[indptr[i] : indptr[i + 1]] for i in range(n)]
+    return rows, row_weights
+
+
+def _vertex_diameter_bound(csr, weight):
+    """Returns an upper bound of the number of nodes of any shortest path.
+
+    For unweighted undirected graphs, the eccentricity `e` of any node of a
+    connected component bounds its shortest paths by `2e + 1` nodes. Else,
+    shortest paths are only bounded by the size of their weakly connected
+    component.
+    """
+    rows, _ = _csr_rows(csr, None)
+    if csr.directed:
+        reverse, _ = _csr_rows(csr.transpose(), None)
+        rows = [a + b for a, b in zip(rows, reverse)]
+    n = len(rows)
+    dist = [-1] * n
+    bound = 1
+    for root in range(n):
+        if dist[root] >= 0:
+            continue
+        dist[root] = 0
+        component = [root]
+        for v in component:
+            for w in rows[v]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    component.append(w)
+        size = len(component)
+        if weight is None and not csr.directed:
+            size = min(size, 2 * dist[component[-1]] + 1)
+        bound = max(bound, size)
+    return bound
+
+
+def _csr_bfs(rows, s, S, P, sigma, dist):
+    sigma[s] = 1.0
+    dist[s] = 0
+    S.append(s)
+    # S is the BFS queue too: nodes are appended in the order they are
+    # reached, and i is the head of the queue.
+    i = 0
+    while i < len(S):
+        v = S[i]
+        i += 1
+        Dv = dist[v] + 1
+        sigmav = sigma[v]
+        for w in rows[v]:
+            if dist[w] < 0:
+                S.append(w)
+                dist[w] = Dv
+            if dist[w] == Dv:
+                sigma[w] += sigmav
+                P[w].append(v)
+
+
+def _csr_dijkstra(rows, row_weights, s, S, P, sigma, dist):
+    from heapq import heappop
+    from heapq import heappush
+    from itertools import count
+
+    # dist marks the settled nodes, seen holds the tentative distances.
+    seen = {s: 0}
+    sigma[s] = 1.0
+    c = count()
+    Q = [(0, next(c), s, s)]
+    while Q:
+        d, _, pred, v = heappop(Q)
+        if dist[v] >= 0:
+            continue
+        sigma[v] += sigma[pred]
+        S.append(v)
+        dist[v] = d
+        for w, vw in zip(rows[v], row_weights[v]):
+            vw_dist = d + vw
+            if dist[w] < 0 and (w not in seen or vw_dist < seen[w]):
+                seen[w] = vw_dist
+                heappush(Q, (vw_dist, next(c), v, w))
+                sigma[w] = 0.0
+                P[w][:] = [v]
+            elif vw_dist == seen[w]:  # handle equal paths
+                sigma[w] += sigma[v]
+                P[w].append(v)
+
+
+def _scale(n, normalized, directed=False, endpoints=False):
+    """Returns the factor rescaling sums over ordered pairs, or None."""
     if normalized:
         if endpoints:
             if n < 2:
@@ -138,10 +674,7 @@ def _rescale(betweenness, n, normalized, directed=False, endpoints=False):
             scale = 0.5
         else:
             scale = None
-    if scale is not None:
-        for v in betweenness:
-            betweenness[v] *= scale
-    return betweenness
+    return scale
 
 
 def _single_source_bfs_path(G, source):
@@ -151,10 +684,10 @@ def _single_source_bfs_path(G, source):
     D = {}
     sigma[source] = 1.0
     D[source] = 0
-    Q = [source]
+    Q = deque([source])
     adj = G.adj
     while Q:
-        v = Q.pop(0)
+        v = Q.popleft()
         S.append(v)
         Dv = D[v]
         sigmav = sigma[v]
@@ -219,6 +752,20 @@ def _accumulate_endpoints(betweenness, S, P, sigma, s):
     return betweenness
 
 
+def _accumulate_edges(betweenness, edges, S, P, sigma, s):
+    # S is left as is, so that the CSR engine can reset the nodes it lists.
+    delta = dict.fromkeys(S, 0)
+    for w in reversed(S):
+        coeff = (1 + delta[w]) / sigma[w]
+        for v in P[w]:
+            c = sigma[v] * coeff
+            edges[v, w] = edges.get((v, w), 0) + c
+            delta[v] += c
+        if w != s:
+            betweenness[w] += delta[w]
+    return betweenness, edges
+
+
 def _accumulate_basic(betweenness, S, P, sigma, s):
     delta = dict.fromkeys(S, 0)
     while S:
@@ -1,13 +1,18 @@
+from easygraph.functions.centrality.betweenness import _csr_rows
 from easygraph.functions.path import *
+from easygraph.functions.path.bfs import _csr_of
 from easygraph.utils import *
 
 
 __all__ = [
     "closeness_centrality",
+    "harmonic_centrality",
 ]
 
 
 def closeness_centrality_parallel(nodes, G, path_length):
+    if path_length is None:
+        return _bfs_closeness(nodes, G)
     ret = []
     length = len(G)
     for node in nodes:
@@ -22,7 +27,7 @@ def closeness_centrality_parallel(nodes, G, path_length):
 
 
 @not_implemented_for("multigraph")
-def closeness_centrality(G, weight=None, n_workers=None):
+def closeness_centrality(G, weight=None, n_workers=None, top_k=None):
     r"""Compute closeness centrality for nodes.
 
     .. math::
@@ -42,51 +47,375 @@ def closeness_centrality(G, weight=None, n_workers=None):
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_workers : int or None, optional (default=None)
+      The number of workers. If None, no parallelism.
+
+    top_k : int or None, optional (default=None)
+      If not None, only the `top_k` nodes of highest closeness are
+      returned, and the traversals from the other nodes are mostly cut
+      short, see Notes. It runs serially, `n_workers` is ignored. If 0 or
+      less, no node is returned.
+
     Returns
     -------
     nodes : dictionary
       Dictionary of nodes with closeness centrality as the value.
+      With `top_k`, in decreasing order of closeness, ties being broken
+      arbitrarily.
+
+    Notes
+    -----
+    With `top_k`, the sources are traversed by decreasing degree, as in
+    the pruned BFS of [1]_. After each BFS level, or each node settled by
+    Dijkstra's algorithm, the farness of the source is bounded from below
+    by assuming that the remaining reachable nodes are as close as
+    possible. For BFS, at most as many as the edges leaving the last level
+    are at the next distance, and all the others one further. For
+    Dijkstra's algorithm, the nodes seen but not settled are at the
+    distance of the node being settled, and all the others one lightest
+    edge further. The number of reachable nodes is the size of the
+    connected component of the source, or, for directed graphs, bounded
+    by the sizes of the strongly connected components downstream of its
+    own. The traversal stops as soon as the resulting upper bound of the
+    closeness is below the `top_k`-th highest
+    closeness found so far.
+
+    Unweighted distances, and all distances with `top_k`, are computed over
+    the CSR snapshot cached by `G` until it is modified, see
+    :meth:`easygraph.Graph.csr`. Weights written into ``G[u][v]`` directly
+    are not detected.
+
+    References
+    ----------
+    .. [1] Bergamini, E., Borassi, M., Crescenzi, P., Marino, A. &
+       Meyerhenke, H. (2019). Computing top-k closeness centrality faster
+       in unweighted graphs. ACM Transactions on Knowledge Discovery from
+       Data, 13(5), 1-40.
 
     """
+    if top_k is not None:
+        return _top_k_closeness(G, top_k, weight)
     closeness = dict()
     nodes = G.nodes
-    length = len(nodes)
     import functools
 
     if weight is not None:
         path_length = functools.partial(single_source_dijkstra, weight=weight)
     else:
-        path_length = functools.partial(single_source_bfs)
+        # Unweighted distances are counted by batched BFS.
+        path_length = None
 
     if n_workers is not None:
         # use parallel version for large graph
-        import random
-
-        from functools import partial
-        from multiprocessing import Pool
-
-        nodes = list(nodes)
-        random.shuffle(nodes)
-
-        if len(nodes) > n_workers * 30000:
-            nodes = split_len(nodes, step=30000)
-        else:
-            nodes = split(nodes, n_workers)
-        local_function = partial(
-            closeness_centrality_parallel, G=G, path_length=path_length
+        ret = parallel_map(
+            closeness_centrality_parallel,
+            G,
+            nodes,
+            n_workers,
+            csr_weight=weight,
+            path_length=path_length,
         )
-        with Pool(n_workers) as p:
-            ret = p.imap(local_function, nodes)
-            res = [x for i in ret for x in i]
+        res = [x for i in ret for x in i]
         closeness = dict(res)
     else:
-        # use np-parallel version for small graph
-        for node in nodes:
-            x = path_length(G, node)
-            dist = sum(x.values())
-            cnt = len(x)
+        closeness = dict(closeness_centrality_parallel(nodes, G, path_length))
+    return closeness
+
+
+def _bfs_closeness(nodes, G):
+    import numpy as np
+
+    ret = []
+    length = len(G)
+    for batch, counts in bfs_level_counts(G, nodes):
+        cnts = counts.sum(axis=0).tolist()
+        dists = (np.arange(len(counts)) @ counts).tolist()
+        for node, cnt, dist in zip(batch, cnts, dists):
             if dist == 0:
-                closeness[node] = 0
+                ret.append([node, 0])
             else:
-                closeness[node] = (cnt - 1) * (cnt - 1) / (dist * (length - 1))
-    return closeness
+                ret.append([node, (cnt - 1) * (cnt - 1) / (dist * (length - 1))])
+    return ret
+
+
+def _top_k_closeness(G, k, weight):
+    from heapq import heappush
+    from heapq import heappushpop
+
+    if k <= 0:
+        return {}
+    csr = _csr_of(G, weight)
+    rows, row_weights = _csr_rows(csr, weight)
+    n = len(rows)
+    reach = _reachable_bounds(csr)
+    # Only undirected graphs know exactly how many nodes a source reaches.
+    exact = not csr.directed
+    min_weight = max(0, float(csr.weights.min())) if csr.nnz else 0
+    seen = [False] * n
+    top = []
+    order = sorted(range(n), key=lambda i: len(rows[i]), reverse=True)
+    for rank, s in enumerate(order):
+        threshold = top[0][0] if len(top) >= k else None
+        if weight is None:
+            res = _cut_bfs(rows, s, reach[s], exact, threshold, seen)
+        else:
+            res = _cut_dijkstra(
+                rows, row_weights, s, reach[s], exact, threshold, min_weight
+            )
+        if res is None:
+            continue
+        farness, cnt = res
+        c = 0 if farness == 0 else (cnt - 1) * (cnt - 1) / (farness * (n - 1))
+        if len(top) < k:
+            heappush(top, (c, -rank, s))
+        else:
+            heappushpop(top, (c, -rank, s))
+    top.sort(reverse=True)
+    nodes = csr.nodes
+    return {nodes[s]: c for c, _, s in top}
+
+
+def _reachable_bounds(csr):
+    """Upper bounds of the number of nodes reached from each node, itself included.
+
+    They are exact for undirected graphs. For directed graphs, the bound of
+    a strongly connected component is its size plus the bounds of its
+    successors in the condensation.
+    """
+    import numpy as np
+
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    n = len(csr)
+    A = csr_matrix((np.ones(len(csr.indices)), csr.indices, csr.indptr), shape=(n, n))
+    n_comp, labels = connected_components(A, directed=csr.directed, connection="strong")
+    sizes = np.bincount(labels, minlength=n_comp)
+    if not csr.directed:
+        return sizes[labels].tolist()
+
+    tails = labels[np.repeat(np.arange(n), np.diff(csr.indptr))]
+    heads = labels[csr.indices]
+    between = tails != heads
+    pairs = np.unique(tails[between] * n_comp + heads[between])
+    successors = [[] for _ in range(n_comp)]
+    indegree = [0] * n_comp
+    for c, d in zip((pairs // n_comp).tolist(), (pairs % n_comp).tolist()):
+        successors[c].append(d)
+        indegree[d] += 1
+    topological = [c for c in range(n_comp) if indegree[c] == 0]
+    for c in topological:
+        for d in successors[c]:
+            indegree[d] -= 1
+            if indegree[d] == 0:
+                topological.append(d)
+    bound = sizes.tolist()
+    for c in reversed(topological):
+        bound[c] = min(n, bound[c] + sum(bound[d] for d in successors[c]))
+    return [bound[c] for c in labels.tolist()]
+
+
+def _closeness_upper_bound(farness, cnt, reach, exact, n, dist, n_next, step):
+    """Upper bound of the closeness of a source from a partial traversal.
+
+    The `cnt` nodes found so far are at total distance `farness`. At most
+    `n_next` of the others are at distance `dist`, the rest at distance
+    ``dist + step`` at least. The source reaches `reach` nodes, or at most
+    `reach` unless `exact`. Between the candidate numbers of reached nodes
+    tried below, the bound is a quasi-convex function of that number, so
+    its maximum is at one of them.
+    """
+    if exact:
+        candidates = (reach,)
+    else:
+        candidates = (cnt, min(cnt + n_next, reach), reach)
+    bound = 0
+    for x in candidates:
+        f = farness + dist * min(n_next, x - cnt)
+        f += (dist + step) * max(0, x - cnt - n_next)
+        if f > 0:
+            bound = max(bound, (x - 1) * (x - 1) / (f * (n - 1)))
+        elif x > 1:
+            # e.g. before Dijkstra's algorithm settles the source.
+            return float("inf")
+    return bound
+
+
+def _prune(bound, threshold):
+    # Slack for distances summed in another order than the exact value.
+    return threshold is not None and bound * (1 + 1e-9) < threshold
+
+
+def _cut_bfs(rows, s, reach, exact, threshold, seen):
+    """Returns the farness and the number of nodes reached from `s`, or None.
+
+    None means that the BFS was cut, the closeness of `s` being below
+    `threshold`. `seen` is all False before and after the call.
+    """
+    n = len(rows)
+    seen[s] = True
+    reached = [s]
+    level = [s]
+    farness = 0
+    d = 0
+    # The number of edges leaving the current level towards new nodes,
+    # bounding the size of the next level. Undirected edges to the
+    # previous level do not count.
+    n_next = len(rows[s])
+    try:
+        while level:
+            if threshold is not None:
+                bound = _closeness_upper_bound(
+                    farness, len(reached), reach, exact, n, d + 1, n_next, 1
+                )
+                if _prune(bound, threshold):
+                    return None
+            d += 1
+            next_level = []
+            n_next = 0
+            for v in level:
+                for w in rows[v]:
+                    if not seen[w]:
+                        seen[w] = True
+                        next_level.append(w)
+                        n_next += len(rows[w])
+            if exact:
+                n_next -= len(next_level)
+            farness += d * len(next_level)
+            reached.extend(next_level)
+            level = next_level
+        return farness, len(reached)
+    finally:
+        for v in reached:
+            seen[v] = False
+
+
+def _cut_dijkstra(rows, row_weights, s, reach, exact, threshold, min_weight):
+    """Returns the farness and the number of nodes reached from `s`, or None.
+
+    None means that the search was cut, the closeness of `s` being below
+    `threshold`.
+    """
+    from heapq import heappop
+    from heapq import heappush
+    from itertools import count
+
+    n = len(rows)
+    dist = {}
+    seen = {s: 0}
+    c = count()
+    Q = [(0, next(c), s)]
+    farness = 0
+    while Q:
+        d, _, v = heappop(Q)
+        if v in dist:
+            continue
+        # Every node not settled yet is at distance d at least, and the ones
+        # not seen yet are one edge further.
+        if threshold is not None:
+            bound = _closeness_upper_bound(
+                farness,
+                len(dist),
+                reach,
+                exact,
+                n,
+                d,
+                len(seen) - len(dist),
+                min_weight,
+            )
+            if _prune(bound, threshold):
+                return None
+        dist[v] = d
+        farness += d
+        for w, vw in zip(rows[v], row_weights[v]):
+            vw_dist = d + vw
+            if w not in dist and (w not in seen or vw_dist < seen[w]):
+                seen[w] = vw_dist
+                heappush(Q, (vw_dist, next(c), w))
+    return farness, len(dist)
+
+
+def harmonic_centrality_parallel(nodes, G, path_length):
+    if path_length is None:
+        return _bfs_harmonic(nodes, G)
+    ret = []
+    for node in nodes:
+        x = path_length(G, node)
+        ret.append([node, sum(1 / d for d in x.values() if d > 0)])
+    return ret
+
+
+def _bfs_harmonic(nodes, G):
+    import numpy as np
+
+    ret = []
+    for batch, counts in bfs_level_counts(G, nodes):
+        inverse = 1 / np.arange(1, len(counts))
+        ret.extend(zip(batch, (inverse @ counts[1:]).tolist()))
+    return ret
+
+
+@not_implemented_for("multigraph")
+def harmonic_centrality(G, weight=None, n_workers=None):
+    r"""Compute harmonic centrality for nodes.
+
+    Harmonic centrality [1]_ of a node `u` is the sum of the reciprocal
+    of the shortest path distances from `u` to all other nodes,
+
+    .. math::
+
+        C(u) = \sum_{v \neq u} \frac{1}{d(u, v)},
+
+    where unreachable nodes, with :math:`d(u, v) = \infty`, count for 0.
+
+    Notice that the harmonic distance function computes the
+    outcoming distance to `u` for directed graphs, as
+    :func:`closeness_centrality`. To use incoming distance,
+    act on `G.reverse()`.
+
+    Parameters
+    ----------
+    G : graph
+      A easygraph graph
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    n_workers : int or None, optional (default=None)
+      The number of workers. If None, no parallelism.
+
+    Returns
+    -------
+    nodes : dictionary
+      Dictionary of nodes with harmonic centrality as the value.
+
+    Notes
+    -----
+    Without weights, the distances from 64 sources at a time are counted by
+    :func:`easygraph.bfs_level_counts`.
+
+    References
+    ----------
+    .. [1] Boldi, P. & Vigna, S. (2014). Axioms for centrality.
+       Internet Mathematics, 10(3-4), 222-262.
+
+    """
+    import functools
+
+    if weight is not None:
+        path_length = functools.partial(single_source_dijkstra, weight=weight)
+    else:
+        path_length = None
+
+    if n_workers is not None:
+        ret = parallel_map(
+            harmonic_centrality_parallel,
+            G,
+            G.nodes,
+            n_workers,
+            csr_weight=weight,
+            path_length=path_length,
+        )
+        return dict(x for i in ret for x in i)
+    return dict(harmonic_centrality_parallel(G.nodes, G, path_length))
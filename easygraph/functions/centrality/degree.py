@@ -30,7 +30,7 @@ def degree_centrality(G):
         return {n: 1 for n in G}
 
     s = 1.0 / (len(G) - 1.0)
-    centrality = {n: d * s for n, d in G.degree()}
+    centrality = {n: d * s for n, d in G.degree().items()}
     return centrality
 
 
@@ -74,7 +74,7 @@ def in_degree_centrality(G):
         return {n: 1 for n in G}
 
     s = 1.0 / (len(G) - 1.0)
-    centrality = {n: d * s for n, d in G.in_degree()}
+    centrality = {n: d * s for n, d in G.in_degree().items()}
     return centrality
 
 
@@ -118,5 +118,5 @@ def out_degree_centrality(G):
         return {n: 1 for n in G}
 
     s = 1.0 / (len(G) - 1.0)
-    centrality = {n: d * s for n, d in G.out_degree()}
+    centrality = {n: d * s for n, d in G.out_degree().items()}
     return centrality
@@ -0,0 +1,79 @@
+from easygraph.functions.not_sorted.pagerank import _distribution
+from easygraph.functions.not_sorted.pagerank import _power_iteration
+from easygraph.functions.path.bfs import _csr_of
+from easygraph.utils.decorators import *
+
+
+__all__ = ["eigenvector_centrality"]
+
+
+@not_implemented_for("multigraph")
+def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None, weight=None):
+    """Returns the eigenvector centrality of each node in G.
+
+    The eigenvector centrality of a node is proportional to the sum of the
+    centralities of its neighbors, i.e. it is the entry of the node in the
+    eigenvector ``x`` of ``A^T x = lambda x`` for the largest eigenvalue
+    ``lambda`` of the adjacency matrix `A`. For directed graphs, the
+    centrality of a node comes from its predecessors.
+
+    Parameters
+    ----------
+    G : easygraph.Graph or easygraph.DiGraph
+
+    max_iter : int, optional (default : 100)
+        The maximum number of power iterations.
+
+    tol : float, optional (default : 1e-6)
+        The power iteration stops when the L1 norm of the change of the
+        centrality vector is below ``len(G) * tol``.
+
+    nstart : dict, optional (default : None)
+        The starting value of each node, e.g. the centrality of a previous
+        version of the graph. Missing nodes get 0. If None, the start is
+        uniform.
+
+    weight : string or None, optional (default : None)
+        The edge attribute used as weight. Edges without it get 1. If None,
+        every weight is 1.
+
+    Returns
+    -------
+    eigenvector : dict
+        The eigenvector centrality of each node, with unit Euclidean norm.
+
+    Raises
+    ------
+    EasyGraphError
+        If the power iteration does not converge in `max_iter` iterations,
+        or if `nstart` sums to 0.
+
+    Notes
+    -----
+    The power iteration multiplies by ``I + A^T``, which has the same
+    eigenvectors as ``A^T`` but cannot oscillate on bipartite graphs. It
+    runs over the sparse adjacency matrix of :meth:`easygraph.Graph.csr`,
+    in O(n + m) time per iteration.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2), (2, 3)])
+    >>> eg.eigenvector_centrality(G)
+    {1: 0.49999..., 2: 0.70710..., 3: 0.49999...}
+
+    """
+    import numpy as np
+
+    if len(G) == 0:
+        return {}
+    csr = _csr_of(G, weight)
+    AT = csr.to_scipy().T
+
+    def step(x):
+        y = AT @ x
+        y += x
+        return y / np.linalg.norm(y)
+
+    x = _distribution(csr.node_index, nstart, "nstart")
+    x = _power_iteration(step, x, max_iter, len(csr) * tol, "eigenvector_centrality")
+    return dict(zip(csr.nodes, x.tolist()))
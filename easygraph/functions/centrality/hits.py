@@ -0,0 +1,98 @@
+from easygraph.functions.not_sorted.pagerank import _distribution
+from easygraph.functions.not_sorted.pagerank import _power_iteration
+from easygraph.functions.path.bfs import _csr_of
+from easygraph.utils.decorators import *
+from easygraph.utils.exception import EasyGraphError
+
+
+__all__ = ["hits"]
+
+
+@not_implemented_for("multigraph")
+def hits(G, max_iter=100, tol=1.0e-8, nstart=None, normalized=True, weight="weight"):
+    """Returns the HITS hub and authority values of each node in G.
+
+    A good hub points to good authorities, and a good authority is pointed
+    to by good hubs: the hub vector `h` is the principal eigenvector of
+    ``A A^T``, and the authority vector is ``a = A^T h``, where `A` is the
+    adjacency matrix [1]_.
+
+    Parameters
+    ----------
+    G : easygraph.Graph or easygraph.DiGraph
+
+    max_iter : int, optional (default : 100)
+        The maximum number of power iterations.
+
+    tol : float, optional (default : 1e-8)
+        The power iteration stops when the L1 norm of the change of the hub
+        vector, scaled to a maximum of 1, is below `tol`.
+
+    nstart : dict, optional (default : None)
+        The starting hub value of each node, e.g. the hubs of a previous
+        version of the graph. Missing nodes get 0. If None, the start is
+        uniform.
+
+    normalized : bool, optional (default : True)
+        Whether to scale the hubs and the authorities to sum to 1, instead
+        of to a maximum of 1.
+
+    weight : string or None, optional (default : 'weight')
+        The edge attribute used as weight. Edges without it get 1. If None,
+        every weight is 1.
+
+    Returns
+    -------
+    hubs, authorities : two dicts
+        The hub and the authority value of each node.
+
+    Raises
+    ------
+    EasyGraphError
+        If the power iteration does not converge in `max_iter` iterations,
+        if `G` has no edges, or if the hubs vanish from `nstart`.
+
+    Notes
+    -----
+    Each iteration multiplies by `A^T` then by `A`, over the sparse
+    adjacency matrix of :meth:`easygraph.Graph.csr`, in O(n + m) time.
+
+    Examples
+    --------
+    >>> hubs, authorities = eg.hits(G)
+
+    References
+    ----------
+    .. [1] Kleinberg, J. M. (1999). Authoritative sources in a hyperlinked
+       environment. Journal of the ACM, 46(5), 604-632.
+
+    """
+    import numpy as np
+
+    if len(G) == 0:
+        return {}, {}
+    csr = _csr_of(G, weight)
+    A = csr.to_scipy()
+    AT = A.T
+    if not A.nnz or not A.data.any():
+        raise EasyGraphError("hits is not defined for graphs without edges")
+
+    def step(h):
+        h = A @ (AT @ h)
+        top = h.max()
+        if top == 0:
+            raise EasyGraphError(
+                "hits: the hubs vanish from nstart, which must give a non-zero"
+                " value to a node with successors."
+            )
+        return h / top
+
+    h = _distribution(csr.node_index, nstart, "nstart")
+    h = _power_iteration(step, h / h.max(), max_iter, tol, "hits")
+    a = AT @ h
+    if normalized:
+        h = h / h.sum()
+        a = a / a.sum()
+    else:
+        a = a / a.max()
+    return dict(zip(csr.nodes, h.tolist())), dict(zip(csr.nodes, a.tolist()))
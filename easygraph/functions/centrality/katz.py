@@ -0,0 +1,112 @@
+from easygraph.functions.not_sorted.pagerank import _power_iteration
+from easygraph.functions.path.bfs import _csr_of
+from easygraph.utils.decorators import *
+from easygraph.utils.exception import EasyGraphError
+
+
+__all__ = ["katz_centrality"]
+
+
+@not_implemented_for("multigraph")
+def katz_centrality(
+    G,
+    alpha=0.1,
+    beta=1.0,
+    max_iter=1000,
+    tol=1.0e-6,
+    nstart=None,
+    normalized=True,
+    weight=None,
+):
+    """Returns the Katz centrality of each node in G.
+
+    The Katz centrality of a node counts the walks ending at it, those of
+    length `k` weighted by ``alpha ** k``, i.e. it is the solution of
+    ``x = alpha A^T x + beta``, where `A` is the adjacency matrix.
+
+    Parameters
+    ----------
+    G : easygraph.Graph or easygraph.DiGraph
+
+    alpha : float, optional (default : 0.1)
+        The attenuation factor. It must be smaller than the inverse of the
+        largest eigenvalue of `A` for the iteration to converge.
+
+    beta : float or dict, optional (default : 1.0)
+        The weight given to every node, or to each node if a dict, which
+        must then hold every node.
+
+    max_iter : int, optional (default : 1000)
+        The maximum number of iterations.
+
+    tol : float, optional (default : 1e-6)
+        The iteration stops when the L1 norm of the change of the
+        centrality vector is below ``len(G) * tol``.
+
+    nstart : dict, optional (default : None)
+        The starting value of each node, e.g. the centrality of a previous
+        version of the graph. Missing nodes get 0. If None, 0 for every
+        node.
+
+    normalized : bool, optional (default : True)
+        Whether to scale the result to unit Euclidean norm.
+
+    weight : string or None, optional (default : None)
+        The edge attribute used as weight. Edges without it get 1. If None,
+        every weight is 1.
+
+    Returns
+    -------
+    katz : dict
+        The Katz centrality of each node.
+
+    Raises
+    ------
+    EasyGraphError
+        If the iteration does not converge in `max_iter` iterations, or if
+        `beta` is a dict missing some node.
+
+    Notes
+    -----
+    The iteration runs over the sparse adjacency matrix of
+    :meth:`easygraph.Graph.csr`, in O(n + m) time per iteration.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2), (2, 3)])
+    >>> eg.katz_centrality(G, normalized=False)
+    {1: 1.1224..., 2: 1.2244..., 3: 1.1224...}
+
+    """
+    import numpy as np
+
+    if len(G) == 0:
+        return {}
+    csr = _csr_of(G, weight)
+    n = len(csr)
+    AT = csr.to_scipy().T
+    if isinstance(beta, dict):
+        if any(node not in beta for node in csr.nodes):
+            raise EasyGraphError("beta dictionary must have a value for every node")
+        b = np.fromiter((beta[node] for node in csr.nodes), np.float64, n)
+    else:
+        b = np.full(n, float(beta))
+    x = np.zeros(n)
+    if nstart is not None:
+        index = csr.node_index
+        for node, value in nstart.items():
+            if node in index:
+                x[index[node]] = value
+
+    def step(x):
+        y = AT @ x
+        y *= alpha
+        y += b
+        return y
+
+    x = _power_iteration(step, x, max_iter, n * tol, "katz_centrality")
+    if normalized:
+        norm = np.linalg.norm(x)
+        if norm:
+            x /= norm
+    return dict(zip(csr.nodes, x.tolist()))
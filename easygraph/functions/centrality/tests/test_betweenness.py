@@ -1,3 +1,4 @@
+import random
 import unittest
 
 import easygraph as eg
@@ -15,6 +16,108 @@ class BetweennessTest(unittest.TestCase):
         for i in [2, 25, 30, 50]:
             self.assertEqual(actual_result.get(i), 0.0)
 
+    def test_n_workers(self):
+        test_graph = eg.Graph([(2, 6), (6, 10), (10, 25), (30, 40), (40, 50)])
+        test_graph.add_edge(6, 25, weight=3)
+        for weight in (None, "weight"):
+            self.assertEqual(
+                eg.betweenness_centrality(test_graph, weight=weight, n_workers=2),
+                eg.betweenness_centrality(test_graph, weight=weight),
+            )
+
+    def test_engines(self):
+        edges = [(1, 2), (2, 3), (1, 3), (3, 4), (4, 1), (5, 4)]
+        for graph in (eg.Graph(edges), eg.DiGraph(edges)):
+            graph.add_edge(2, 4, weight=2)
+            graph.add_node(6)
+            for weight in (None, "weight"):
+                for endpoints in (False, True):
+                    for normalized in (False, True):
+                        kwargs = dict(
+                            weight=weight, endpoints=endpoints, normalized=normalized
+                        )
+                        self.assertEqual(
+                            eg.betweenness_centrality(graph, engine="csr", **kwargs),
+                            eg.betweenness_centrality(graph, engine="dict", **kwargs),
+                        )
+        with self.assertRaises(ValueError):
+            eg.betweenness_centrality(eg.Graph(edges), engine="numpy")
+
+    def test_sampling(self):
+        random.seed(0)
+        test_graph = eg.Graph()
+        for i in range(600):
+            test_graph.add_edge(random.randrange(150), random.randrange(150))
+        exact = eg.betweenness_centrality(test_graph)
+
+        # Every source, in another order.
+        approx = eg.betweenness_centrality(test_graph, k=len(test_graph), seed=1)
+        for node in test_graph:
+            self.assertAlmostEqual(approx[node], exact[node])
+        for kwargs in (dict(k=60), dict(epsilon=0.02)):
+            approx, error = eg.betweenness_centrality(
+                test_graph, seed=1, return_error=True, **kwargs
+            )
+            self.assertGreater(error, 0)
+            for node in test_graph:
+                self.assertLessEqual(abs(approx[node] - exact[node]), error)
+            self.assertEqual(
+                eg.betweenness_centrality(test_graph, seed=1, **kwargs), approx
+            )
+            parallel = eg.betweenness_centrality(
+                test_graph, seed=1, n_workers=2, **kwargs
+            )
+            for node in test_graph:
+                self.assertAlmostEqual(parallel[node], approx[node])
+
+        with self.assertRaises(ValueError):
+            eg.betweenness_centrality(test_graph, k=10, epsilon=0.1)
+        with self.assertRaises(ValueError):
+            eg.betweenness_centrality(test_graph, k=1000)
+        with self.assertRaises(ValueError):
+            eg.betweenness_centrality(test_graph, epsilon=0.1, engine="dict")
+        for epsilon in (0, 1.5):
+            with self.assertRaises(ValueError):
+                eg.betweenness_centrality(test_graph, epsilon=epsilon)
+        for delta in (0, 1):
+            with self.assertRaises(ValueError):
+                eg.betweenness_centrality(test_graph, epsilon=0.1, delta=delta)
+            with self.assertRaises(ValueError):
+                eg.betweenness_centrality(test_graph, k=10, delta=delta)
+
+    def test_edge_betweenness_centrality(self):
+        test_graph = eg.Graph([(1, 2), (2, 3), (3, 4)])
+        self.assertEqual(
+            eg.edge_betweenness_centrality(test_graph, normalized=False),
+            {(1, 2): 3.0, (2, 3): 4.0, (3, 4): 3.0},
+        )
+        test_graph = eg.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4)])
+        self.assertEqual(
+            eg.edge_betweenness_centrality(test_graph, normalized=False),
+            {(1, 2): 4.0, (2, 3): 5.0, (3, 1): 3.0, (3, 4): 3.0},
+        )
+
+        edges = [(1, 2), (2, 3), (1, 3), (3, 4), (4, 1), (5, 4)]
+        for graph in (eg.Graph(edges), eg.DiGraph(edges)):
+            graph.add_edge(2, 4, weight=2)
+            for weight in (None, "weight"):
+                edge_bc, node_bc = eg.edge_betweenness_centrality(
+                    graph, weight=weight, with_nodes=True
+                )
+                self.assertEqual(
+                    node_bc, eg.betweenness_centrality(graph, weight=weight)
+                )
+                self.assertEqual(
+                    eg.edge_betweenness_centrality(graph, weight=weight, engine="dict"),
+                    edge_bc,
+                )
+                parallel = eg.edge_betweenness_centrality(
+                    graph, weight=weight, n_workers=2
+                )
+                self.assertEqual(parallel.keys(), edge_bc.keys())
+                for edge in edge_bc:
+                    self.assertAlmostEqual(parallel[edge], edge_bc[edge])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,43 @@ class ClossnessTest(unittest.TestCase):
         self.assertEqual(actual_result.get(6), actual_result.get(10))
         self.assertEqual(actual_result.get(30), actual_result.get(50))
 
+    def test_top_k(self):
+        for graph_class in (eg.Graph, eg.DiGraph):
+            test_graph = graph_class()
+            test_graph.add_nodes_from(range(40))
+            for i in range(40):
+                test_graph.add_edge(i, (i * 7 + 3) % 40, weight=i % 3 + 1)
+                test_graph.add_edge(i, (i * i) % 37, weight=1)
+            for weight in (None, "weight"):
+                expected = eg.closeness_centrality(test_graph, weight=weight)
+                self.assertEqual(eg.closeness_centrality(test_graph, top_k=0), {})
+                for k in (1, 5, 50):
+                    actual_result = eg.closeness_centrality(
+                        test_graph, weight=weight, top_k=k
+                    )
+                    values = list(actual_result.values())
+                    self.assertEqual(len(values), min(k, 40))
+                    self.assertEqual(values, sorted(values, reverse=True))
+                    best = sorted(expected.values(), reverse=True)[:k]
+                    for node, value in zip(actual_result, best):
+                        self.assertAlmostEqual(actual_result[node], value)
+                        self.assertAlmostEqual(expected[node], value)
+
+    def test_harmonic_centrality(self):
+        test_graph = eg.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4), (5, 4)])
+        expected = {
+            1: 1 + 1 / 2 + 1 / 3,
+            2: 1 + 1 / 2 + 1 / 2,
+            3: 2 + 1 / 2,
+            4: 0,
+            5: 1,
+        }
+        for kwargs in ({}, {"weight": "weight"}, {"n_workers": 2}):
+            actual_result = eg.harmonic_centrality(test_graph, **kwargs)
+            self.assertEqual(actual_result.keys(), expected.keys())
+            for node in expected:
+                self.assertAlmostEqual(actual_result[node], expected[node])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+import random
+import unittest
+
+import easygraph as eg
+
+
+class DynamicBetweennessTest(unittest.TestCase):
+    def assertBetweennessEqual(self, actual, expected):
+        self.assertEqual(actual.keys(), expected.keys())
+        for node in expected:
+            self.assertAlmostEqual(actual[node], expected[node])
+
+    def test_updates(self):
+        random.seed(1)
+        for graph_class in (eg.Graph, eg.DiGraph):
+            for weight in (None, "weight"):
+                test_graph = graph_class()
+                for i in range(80):
+                    test_graph.add_edge(
+                        random.randrange(30), random.randrange(30), weight=i % 3 + 1
+                    )
+                bc = eg.DynamicBetweenness(test_graph, weight=weight)
+                for i in range(20):
+                    if i % 2:
+                        u, v, _ = random.choice(list(test_graph.edges))
+                        bc.remove_edge(u, v)
+                    else:
+                        bc.add_edge(
+                            random.randrange(35), random.randrange(35), weight=i % 4 + 1
+                        )
+                    self.assertBetweennessEqual(
+                        bc.betweenness,
+                        eg.betweenness_centrality(test_graph, weight=weight),
+                    )
+
+    def test_affected_sources(self):
+        # A path hanging from a 4-cycle: a chord of the cycle only changes
+        # the shortest paths from its own endpoints.
+        test_graph = eg.Graph(
+            [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 4), (1, 10)]
+        )
+        bc = eg.DynamicBetweenness(test_graph, normalized=False)
+        bc.add_edge(5, 7)
+        self.assertEqual(bc.last_recomputed, 2)
+        self.assertBetweennessEqual(
+            bc.betweenness, eg.betweenness_centrality(test_graph, normalized=False)
+        )
+        bc.add_edge(1, 1)
+        self.assertEqual(bc.last_recomputed, 0)
+
+    def test_external_changes(self):
+        test_graph = eg.Graph([(1, 2), (2, 3)])
+        bc = eg.DynamicBetweenness(test_graph)
+        test_graph.add_edge(3, 4)
+        self.assertBetweennessEqual(
+            bc.betweenness, eg.betweenness_centrality(test_graph)
+        )
+        with self.assertRaises(KeyError):
+            bc.remove_edge(1, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
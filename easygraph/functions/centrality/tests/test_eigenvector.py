@@ -0,0 +1,35 @@
+import math
+import unittest
+
+import easygraph as eg
+
+
+class EigenvectorCentralityTest(unittest.TestCase):
+    def test_eigenvector_centrality(self):
+        test_graph = eg.complete_graph(5)
+        result = eg.eigenvector_centrality(test_graph)
+        for node in test_graph:
+            self.assertAlmostEqual(result[node], 1 / math.sqrt(5))
+
+        test_graph = eg.Graph([(1, 2), (2, 3)])
+        result = eg.eigenvector_centrality(test_graph, tol=1e-10)
+        self.assertAlmostEqual(result[1], 0.5)
+        self.assertAlmostEqual(result[2], math.sqrt(0.5))
+        self.assertAlmostEqual(result[3], 0.5)
+        self.assertEqual(eg.eigenvector_centrality(eg.Graph()), {})
+
+    def test_options(self):
+        test_graph = eg.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4), (4, 1)])
+        test_graph.add_edge(1, 3, weight=2)
+        result = eg.eigenvector_centrality(test_graph, weight="weight", tol=1e-10)
+        warm = eg.eigenvector_centrality(
+            test_graph, weight="weight", tol=1e-10, nstart=result, max_iter=3
+        )
+        for node in test_graph:
+            self.assertAlmostEqual(warm[node], result[node])
+        with self.assertRaises(eg.EasyGraphError):
+            eg.eigenvector_centrality(test_graph, max_iter=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
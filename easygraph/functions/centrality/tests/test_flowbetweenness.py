@@ -20,6 +20,30 @@ class FlowBetweennessCentralityTest(unittest.TestCase):
         for i in [4, 10, 12, 14]:
             self.assertEqual(actual_result.get(i), 0.0)
 
+    def test_undirected(self):
+        # The flow network of an undirected graph is its symmetric digraph.
+        edges = [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 6), (6, 4), (2, 5)]
+        directed = eg.DiGraph(edges + [(v, u) for u, v in edges])
+        expected = eg.flowbetweenness_centrality(directed)
+        actual = eg.flowbetweenness_centrality(eg.Graph(edges))
+        for node, value in expected.items():
+            self.assertAlmostEqual(actual[node], value)
+
+    def test_n_workers(self):
+        G = eg.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 3), (2, 5)])
+        expected = eg.flowbetweenness_centrality(G)
+        actual = eg.flowbetweenness_centrality(G, n_workers=2)
+        for node, value in expected.items():
+            self.assertAlmostEqual(actual[node], value)
+
+    def test_k(self):
+        G = eg.Graph([(1, 2), (2, 3), (3, 1), (3, 4), (4, 5)])
+        expected = eg.flowbetweenness_centrality(G)
+        actual = eg.flowbetweenness_centrality(G, k=len(G), seed=1)
+        for node, value in expected.items():
+            self.assertAlmostEqual(actual[node], value)
+        self.assertRaises(ValueError, eg.flowbetweenness_centrality, G, k=0)
+
 
 if __name__ == "__main__":
     unittest.main()
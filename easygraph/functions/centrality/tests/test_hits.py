@@ -0,0 +1,35 @@
+import unittest
+
+import easygraph as eg
+
+
+class HitsTest(unittest.TestCase):
+    def test_hits(self):
+        test_graph = eg.DiGraph(
+            [(1, 3), (1, 5), (2, 1), (3, 5), (5, 4), (5, 3), (6, 5)]
+        )
+        hubs, authorities = eg.hits(test_graph)
+        expected_hubs = {1: 0.366025, 2: 0, 3: 0.211325, 4: 0, 5: 0.211325, 6: 0.211325}
+        expected_authorities = {1: 0, 2: 0, 3: 0.366025, 4: 0.133975, 5: 0.5, 6: 0}
+        for node in test_graph:
+            self.assertAlmostEqual(hubs[node], expected_hubs[node], places=5)
+            self.assertAlmostEqual(
+                authorities[node], expected_authorities[node], places=5
+            )
+
+        hubs, authorities = eg.hits(test_graph, nstart=hubs, normalized=False)
+        self.assertAlmostEqual(max(hubs.values()), 1)
+        self.assertAlmostEqual(authorities[5], 1)
+
+    def test_errors(self):
+        self.assertEqual(eg.hits(eg.DiGraph()), ({}, {}))
+        test_graph = eg.DiGraph()
+        test_graph.add_nodes_from([1, 2])
+        with self.assertRaises(eg.EasyGraphError):
+            eg.hits(test_graph)
+        with self.assertRaises(eg.EasyGraphError):
+            eg.hits(eg.DiGraph([(1, 2), (2, 3)]), nstart={3: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
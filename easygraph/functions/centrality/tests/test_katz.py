@@ -0,0 +1,43 @@
+import math
+import unittest
+
+import easygraph as eg
+
+
+class KatzCentralityTest(unittest.TestCase):
+    def test_katz_centrality(self):
+        test_graph = eg.complete_graph(5)
+        result = eg.katz_centrality(test_graph)
+        for node in test_graph:
+            self.assertAlmostEqual(result[node], 1 / math.sqrt(5))
+
+        # x = alpha A x + 1 on a path of 3 nodes.
+        test_graph = eg.Graph([(1, 2), (2, 3)])
+        result = eg.katz_centrality(test_graph, normalized=False, tol=1e-12)
+        self.assertAlmostEqual(result[1], 1.1 / 0.98)
+        self.assertAlmostEqual(result[2], 1.2 / 0.98)
+        self.assertAlmostEqual(result[3], 1.1 / 0.98)
+
+    def test_options(self):
+        test_graph = eg.DiGraph([(1, 2), (2, 3)])
+        result = eg.katz_centrality(
+            test_graph, alpha=0.5, beta={1: 1, 2: 0, 3: 0}, normalized=False
+        )
+        self.assertAlmostEqual(result[3], 0.25)
+        warm = eg.katz_centrality(
+            test_graph,
+            alpha=0.5,
+            beta={1: 1, 2: 0, 3: 0},
+            nstart=result,
+            max_iter=1,
+            normalized=False,
+        )
+        self.assertEqual(warm, result)
+        with self.assertRaises(eg.EasyGraphError):
+            eg.katz_centrality(test_graph, beta={1: 1})
+        with self.assertRaises(eg.EasyGraphError):
+            eg.katz_centrality(eg.complete_graph(5), alpha=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+import easygraph as eg
+
+
+def _ego_betweenness(G, ego):
+    # Every pair of alters i -> ego -> j, not adjacent, from the definition.
+    succ = set(G.adj[ego]) - {ego}
+    pred = (set(G.predecessors(ego)) if G.is_directed() else succ) - {ego}
+    alters = succ | pred
+
+    def arc(a, b):
+        return a != b and G.has_edge(a, b)
+
+    total = 0.0
+    for i in pred:
+        for j in succ:
+            if i != j and not arc(i, j):
+                paths = 1 + sum(1 for k in alters if arc(i, k) and arc(k, j))
+                total += 1 / paths
+    return total if G.is_directed() else total / 2
+
+
+class EgoBetweennessTest(unittest.TestCase):
+    def test_ego_betweenness(self):
+        test_graph = eg.Graph([(0, 1), (0, 2), (0, 3), (1, 2), (3, 4)])
+        self.assertEqual(eg.ego_betweenness(test_graph, 0), 2.0)
+        self.assertEqual(eg.ego_betweenness(test_graph, 3), 1.0)
+        self.assertEqual(eg.ego_betweenness(test_graph, 4), 0.0)
+        test_graph = eg.DiGraph([(1, 2), (2, 3), (3, 2)])
+        self.assertEqual(eg.ego_betweenness(test_graph), {1: 0.0, 2: 1.0, 3: 0.0})
+
+    def test_all_nodes(self):
+        random.seed(3)
+        for graph_class in (eg.Graph, eg.DiGraph):
+            test_graph = graph_class()
+            for _ in range(150):
+                test_graph.add_edge(random.randrange(30), random.randrange(30))
+            expected = {v: _ego_betweenness(test_graph, v) for v in test_graph}
+            for n_workers in (None, 2):
+                result = eg.ego_betweenness(test_graph, n_workers=n_workers)
+                self.assertEqual(result.keys(), expected.keys())
+                for v in test_graph:
+                    self.assertAlmostEqual(result[v], expected[v])
+            nodes = [3, 1, 4]
+            result = eg.ego_betweenness(test_graph, nodes=nodes)
+            self.assertEqual(list(result), nodes)
+            for v in nodes:
+                self.assertAlmostEqual(result[v], expected[v])
+                self.assertAlmostEqual(eg.ego_betweenness(test_graph, v), expected[v])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -208,7 +208,7 @@ def kamada_kawai_layout(
     dist : dict (default=None)
         A two-level dictionary of optimal distances between nodes,
         indexed by source and destination node.
-        If None, the distance is computed using shortest_path_length().
+        If None, the distance is computed using distance_matrix().
 
     pos : dict or None  optional (default=None)
         Initial positions for nodes as a dictionary with node as keys
@@ -243,16 +243,18 @@ def kamada_kawai_layout(
         return {}
 
     if dist is None:
-        dist = dict(eg.Floyd(G))
-    dist_mtx = 1e6 * np.ones((nNodes, nNodes))
-    for row, nr in enumerate(G):
-        if nr not in dist:
-            continue
-        rdist = dist[nr]
-        for col, nc in enumerate(G):
-            if nc not in rdist:
+        dist_mtx = eg.distance_matrix(G, weight=weight)
+        dist_mtx[np.isinf(dist_mtx)] = 1e6
+    else:
+        dist_mtx = 1e6 * np.ones((nNodes, nNodes))
+        for row, nr in enumerate(G):
+            if nr not in dist:
                 continue
-            dist_mtx[row][col] = rdist[nc]
+            rdist = dist[nr]
+            for col, nc in enumerate(G):
+                if nc not in rdist:
+                    continue
+                dist_mtx[row][col] = rdist[nc]
 
     if pos is None:
         if dim >= 3:
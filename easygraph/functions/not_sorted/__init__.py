@@ -1,5 +1,6 @@
 from .bridges import *
 from .cluster import *
+from .dynamic_pagerank import *
 from .laplacian import *
 from .mst import *
 from .pagerank import *
@@ -0,0 +1,294 @@
+from easygraph.functions.not_sorted.pagerank import _distribution
+from easygraph.functions.not_sorted.pagerank import _PowerStep
+from easygraph.functions.not_sorted.pagerank import pagerank
+from easygraph.functions.path.bfs import _csr_of
+from easygraph.utils.exception import EasyGraphNotImplemented
+
+
+__all__ = ["DynamicPageRank"]
+
+
+class DynamicPageRank:
+    """PageRank kept up to date under edge insertions and deletions.
+
+    The PageRank `x` is computed once by :func:`easygraph.pagerank`, together
+    with its residual ``r = (1 - alpha) p + alpha M x - x``, where `M` is the
+    transition matrix and `p` the personalization vector. Edges are then
+    added and removed through :meth:`add_edge` and :meth:`remove_edge`,
+    which modify `G`. Changing the out-edges of a node `u` only changes
+    column `u` of `M`, hence the residual of the out-neighbors of `u`.
+
+    The residual is propagated by forward push, in Gauss-Southwell style:
+    pushing node `v` moves ``r[v]`` into ``x[v]`` and spreads
+    ``alpha * r[v]`` over the out-neighbors of `v`. Every node whose
+    residual is above `tol` is pushed in each round, over the CSR snapshot
+    taken by the last full computation, and rounds go on until no residual
+    is left above `tol`. Only the out-edges of the pushed nodes are read, so
+    that the cost of an update is proportional to the part of the graph
+    its change reaches, not to the size of the graph.
+
+    Parameters
+    ----------
+    G : easygraph.Graph or easygraph.DiGraph
+        The graph, modified by :meth:`add_edge` and :meth:`remove_edge`.
+
+    alpha : float, optional (default : 0.85)
+        The damping factor.
+
+    personalization : dict, optional (default : None)
+        See :func:`easygraph.pagerank`.
+
+    weight : string or None, optional (default : 'weight')
+        See :func:`easygraph.pagerank`.
+
+    dangling : dict, optional (default : None)
+        See :func:`easygraph.pagerank`.
+
+    tol : float, optional (default : 1e-10)
+        The largest residual left on a node. The L1 error of the PageRank
+        is at most ``len(G) * tol / (1 - alpha)``.
+
+    Attributes
+    ----------
+    last_pushed : int
+        The number of pushes run by the last access to :attr:`pagerank`.
+
+    Notes
+    -----
+    Changes are applied to the residual at once, and pushed on the next
+    access to :attr:`pagerank`, so that a batch of changes is propagated
+    together. The nodes without out-edges send their mass to the `dangling`
+    distribution, which is only spread over the nodes once the pending mass
+    matters. Adding a node normalizes the personalization and dangling
+    distributions again over the new set of nodes, which costs O(n).
+
+    If `G` is modified by other means, which is detected through
+    ``G.version``, the PageRank is computed again from scratch on the next
+    access.
+
+    Examples
+    --------
+    >>> pr = eg.DynamicPageRank(G)
+    >>> pr.add_edge(1, 2)
+    >>> pr.remove_edge(3, 4)
+    >>> pr.pagerank
+
+    """
+
+    def __init__(
+        self,
+        G,
+        alpha=0.85,
+        personalization=None,
+        weight="weight",
+        dangling=None,
+        tol=1.0e-10,
+    ):
+        if G.is_multigraph():
+            raise EasyGraphNotImplemented("not implemented for multigraph type")
+        self.G = G
+        self.alpha = alpha
+        self.personalization = personalization
+        self.weight = weight
+        self.dangling = dangling
+        self.tol = tol
+        self.last_pushed = 0
+        self._rebuild()
+
+    def _rebuild(self):
+        import numpy as np
+
+        G = self.G
+        self._version = G.version
+        # The residual pending on the dangling distribution, as a factor.
+        self._pending = 0.0
+        # The rows changed since the snapshot, as (heads, probabilities), or
+        # None for nodes without out-edges.
+        self._rows = {}
+        self._nodes = []
+        self._index = {}
+        if len(G) == 0:
+            return
+        x = pagerank(
+            G,
+            alpha=self.alpha,
+            personalization=self.personalization,
+            tol=self.tol,
+            weight=self.weight,
+            dangling=self.dangling,
+        )
+        csr = _csr_of(G, self.weight)
+        p = _distribution(csr.node_index, self.personalization, "personalization")
+        d = p
+        if self.dangling is not None:
+            d = _distribution(csr.node_index, self.dangling, "dangling")
+        step = _PowerStep(csr, self.alpha)
+        x = np.fromiter((x[node] for node in csr.nodes), np.float64, len(csr))
+
+        self._nodes = list(csr.nodes)
+        self._index = dict(csr.node_index)
+        self._x = x
+        self._r = step(x, p, d) - x
+        self._p = p
+        self._d = d
+        self._is_dangling = step.is_dangling.copy()
+        self._indptr = csr.indptr
+        self._indices = csr.indices
+        rows = np.repeat(np.arange(len(csr)), np.diff(csr.indptr))
+        self._probs = csr.weights * step.scale[rows]
+        self._changed = np.zeros(len(csr), dtype=bool)
+
+    def _sync(self):
+        if self.G.version != self._version:
+            self._rebuild()
+
+    @property
+    def pagerank(self):
+        """The current PageRank of every node, as a new dict."""
+        self._sync()
+        if not self._nodes:
+            return {}
+        self._push()
+        return dict(zip(self._nodes, self._x.tolist()))
+
+    def add_edge(self, u, v, **edge_attr):
+        """Adds the edge `(u, v)` to `G` and updates the residual.
+
+        Missing nodes are added first. If the edge exists, its attributes
+        are updated.
+        """
+        self._sync()
+        G = self.G
+        if len(G) == 0:
+            G.add_edge(u, v, **edge_attr)
+            self._rebuild()
+            return
+        for node in (u, v):
+            if node not in G:
+                self._add_node(node)
+        self._update(u, v, lambda: G.add_edge(u, v, **edge_attr))
+
+    def remove_edge(self, u, v):
+        """Removes the edge `(u, v)` from `G` and updates the residual."""
+        self._sync()
+        G = self.G
+        if not G.has_edge(u, v):
+            raise KeyError("No edge {}-{} in graph.".format(u, v))
+        self._update(u, v, lambda: G.remove_edge(u, v))
+
+    def _update(self, u, v, change):
+        # Only the columns of the transition matrix of the tails change.
+        tails = {u} if self.G.is_directed() else {u, v}
+        tails = [self._index[tail] for tail in tails]
+        for i in tails:
+            self._apply_column(i, -1.0)
+        change()
+        for i in tails:
+            self._rows[i] = row = self._read_row(self._nodes[i])
+            self._changed[i] = True
+            self._is_dangling[i] = row is None
+            self._apply_column(i, 1.0)
+        self._version = self.G.version
+
+    def _add_node(self, node):
+        import numpy as np
+
+        G = self.G
+        n = len(self._nodes)
+        # The pending dangling residual goes to the old distribution.
+        self._flush()
+        G.add_node(node)
+        self._index[node] = n
+        self._nodes.append(node)
+        self._rows[n] = None
+        self._x = np.append(self._x, 0.0)
+        self._r = np.append(self._r, 0.0)
+        self._is_dangling = np.append(self._is_dangling, True)
+        self._changed = np.append(self._changed, True)
+        # Both distributions are normalized again over the new index. The new
+        # node gets mass from those that are uniform or have it as a key.
+        p = _distribution(self._index, self.personalization, "personalization")
+        d = p
+        if self.dangling is not None:
+            d = _distribution(self._index, self.dangling, "dangling")
+        dangling_mass = self._x[self._is_dangling].sum()
+        self._r += (1 - self.alpha) * (p - np.append(self._p, 0.0))
+        self._r += self.alpha * dangling_mass * (d - np.append(self._d, 0.0))
+        self._p, self._d = p, d
+        self._version = G.version
+
+    def _read_row(self, node):
+        """The out-neighbors of `node` and their probabilities, or None."""
+        import numpy as np
+
+        adj = self.G.adj[node]
+        if self.weight is None:
+            weights = np.ones(len(adj))
+        else:
+            weight = self.weight
+            weights = np.array([attr.get(weight, 1) for attr in adj.values()], float)
+        out = weights.sum()
+        if out == 0:
+            return None
+        heads = np.fromiter((self._index[y] for y in adj), np.int64, len(adj))
+        return heads, weights / out
+
+    def _row(self, i):
+        if self._changed[i]:
+            return self._rows[i]
+        if self._is_dangling[i]:
+            return None
+        start, stop = self._indptr[i], self._indptr[i + 1]
+        return self._indices[start:stop], self._probs[start:stop]
+
+    def _apply_column(self, i, sign):
+        """Adds ``sign * alpha * x[i] * M[:, i]`` to the residual."""
+        mass = sign * self.alpha * self._x[i]
+        row = self._row(i)
+        if row is None:
+            self._pending += mass
+        else:
+            heads, probs = row
+            self._r[heads] += mass * probs
+
+    def _flush(self):
+        """Spreads the pending dangling residual over the nodes."""
+        if self._pending:
+            self._r += self._pending * self._d
+            self._pending = 0.0
+
+    def _push(self):
+        import numpy as np
+
+        r, x = self._r, self._x
+        tol = self.tol
+        d_max = self._d.max()
+        indptr, indices, probs = self._indptr, self._indices, self._probs
+        pushed = 0
+        while True:
+            active = np.flatnonzero(np.abs(r) > tol)
+            if not len(active):
+                if abs(self._pending) * d_max <= tol:
+                    break
+                self._flush()
+                continue
+            pushed += len(active)
+            residual = r[active]
+            x[active] += residual
+            r[active] = 0
+            mass = self.alpha * residual
+
+            dangling = self._is_dangling[active]
+            self._pending += mass[dangling].sum()
+            changed = self._changed[active] & ~dangling
+            for i, m in zip(active[changed].tolist(), mass[changed].tolist()):
+                heads, row_probs = self._rows[i]
+                r[heads] += m * row_probs
+            # The other rows are read from the snapshot.
+            rest = ~(dangling | changed)
+            active, mass = active[rest], mass[rest]
+            deg = indptr[active + 1] - indptr[active]
+            offsets = np.repeat(indptr[active] - np.cumsum(deg) + deg, deg)
+            edges = np.arange(len(offsets)) + offsets
+            np.add.at(r, indices[edges], np.repeat(mass, deg) * probs[edges])
+        self.last_pushed = pushed
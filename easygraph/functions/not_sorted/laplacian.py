@@ -1,3 +1,4 @@
+from easygraph.functions.path.bfs import _csr_of
 from easygraph.utils import *
 
 
@@ -8,15 +9,38 @@ __all__ = ["laplacian"]
 def laplacian(G, n_workers=None):
     """Returns the laplacian centrality of each node in the weighted graph
 
+    The laplacian centrality of a node is the relative drop of the
+    Laplacian energy of the graph when the node is removed [1]_. The energy
+    is ``sum(X[i] ** 2) + sum(W[i])``, where ``X[i]`` and ``W[i]`` are the
+    sums of the weights and of the squared weights of the out-edges of
+    node `i`.
+
     Parameters
     ----------
     G : graph
         weighted graph
 
+    n_workers : int or None, optional (default : None)
+        The number of workers, each computing the terms of the out-edges of
+        a chunk of nodes. If None, the terms are computed in the calling
+        process.
+
     Returns
     -------
     CL : dict
-        the laplacian centrality of each node in the weighted graph
+        the laplacian centrality of each node in the weighted graph, or an
+        empty dict if the energy of the graph is 0
+
+    Notes
+    -----
+    Removing node `i` zeroes ``X[i]`` and ``W[i]``, counted twice in the
+    energy, and lowers ``X[j]`` by ``w(j, i)`` for its predecessors `j`, so
+    that the drop of the energy is::
+
+        X[i] ** 2 + 2 W[i] + sum(2 X[j] w(j, i) - w(j, i) ** 2)
+
+    over the edges ``(j, i)`` with ``j != i``. It is computed for every
+    node at once over the CSR snapshot of the graph, in O(n + m) time.
 
     Examples
     --------
@@ -31,94 +55,73 @@ def laplacian(G, n_workers=None):
     Information Sciences, Volume 194, Pages 240-253, 2012.
 
     """
-    adj = G.adj
-    from collections import defaultdict
+    import numpy as np
 
-    X = defaultdict(int)
-    W = defaultdict(int)
-    CL = {}
+    if len(G) == 0:
+        return {}
+    csr = _csr_of(G, "weight")
+    n = len(csr)
 
     if n_workers is not None:
         # use the parallel version for large graph
-        import random
-
-        from functools import partial
-        from multiprocessing import Pool
-
-        nodes = list(G.nodes)
-        random.shuffle(nodes)
-
-        if len(nodes) > n_workers * 30000:
-            nodes = split_len(nodes, step=30000)
-        else:
-            nodes = split(nodes, n_workers)
-
-        local_function = partial(initialize_parallel, G=G, adj=adj)
-        with Pool(n_workers) as p:
-            ret = p.imap(local_function, nodes)
-            resX, resW = [], []
-            for i in ret:
-                for x in i:
-                    resX.append(x[0])
-                    resW.append(x[1])
-            X = dict(resX)
-            W = dict(resW)
-            ELG = sum(X[i] * X[i] for i in G) + sum(W[i] for i in G)
-        local_function = partial(laplacian_parallel, G=G, X=X, W=W, adj=adj, ELG=ELG)
-        with Pool(n_workers) as p:
-            ret = p.imap(local_function, nodes)
-            res = [x for i in ret for x in i]
-        CL = dict(res)
-
+        drop = np.zeros(n)
+        ELG = 0.0
+        ret = parallel_map(laplacian_parallel, G, csr.nodes, n_workers)
+        for rows, own, energy, heads, terms in ret:
+            drop[rows] += own
+            drop[heads] += terms
+            ELG += energy
     else:
-        # use np-parallel version for small graph
-        for i in G:
-            for j in G:
-                if i in G and j in G[i]:
-                    X[i] += adj[i][j].get("weight", 1)
-                    W[i] += adj[i][j].get("weight", 1) * adj[i][j].get("weight", 1)
-        ELG = sum(X[i] * X[i] for i in G) + sum(W[i] for i in G)
-        for i in G:
-            import copy
-
-            Xi = copy.deepcopy(X)
-            for j in G:
-                if j in adj.keys() and i in adj[j].keys():
-                    Xi[j] -= adj[j][i].get("weight", 1)
-            Xi[i] = 0
-            ELGi = sum(Xi[i] * Xi[i] for i in G) + sum(W[i] for i in G) - 2 * W[i]
-            if ELG:
-                CL[i] = (float)(ELG - ELGi) / ELG
-    return CL
-
-
-def initialize_parallel(nodes, G, adj):
-    ret = []
-    for i in nodes:
-        X = 0
-        W = 0
-        for j in G:
-            if j in G[i]:
-                X += adj[i][j].get("weight", 1)
-                W += adj[i][j].get("weight", 1) * adj[i][j].get("weight", 1)
-        ret.append([[i, X], [i, W]])
-    return ret
-
-
-def laplacian_parallel(nodes, G, X, W, adj, ELG):
-    ret = []
-    for i in nodes:
-        import copy
-
-        Xi = copy.deepcopy(X)
-        for j in G:
-            if j in adj.keys() and i in adj[j].keys():
-                Xi[j] -= adj[j][i].get("weight", 1)
-        Xi[i] = 0
-        ELGi = sum(Xi[i] * Xi[i] for i in G) + sum(W[i] for i in G) - 2 * W[i]
-        if ELG:
-            ret.append([i, (float)(ELG - ELGi) / ELG])
-    return ret
+        own, ELG, heads, terms = _energy_terms(csr, np.arange(n))
+        drop = own + np.bincount(heads, weights=terms, minlength=n)
+
+    if not ELG:
+        return {}
+    return dict(zip(csr.nodes, (drop / ELG).tolist()))
+
+
+def laplacian_parallel(nodes, G):
+    import numpy as np
+
+    csr = _csr_of(G, "weight")
+    index = csr.node_index
+    rows = np.fromiter((index[node] for node in nodes), np.int64, len(nodes))
+    own, energy, heads, terms = _energy_terms(csr, rows)
+    # Summed per head, so that the chunk sends at most one term per node.
+    heads, inverse = np.unique(heads, return_inverse=True)
+    terms = np.bincount(inverse, weights=terms, minlength=len(heads))
+    return rows, own, energy, heads, terms
+
+
+def _energy_terms(csr, rows):
+    """The terms of the energy drops given by the out-edges of the node indices `rows`.
+
+    Returns
+    -------
+    own : numpy.ndarray
+        ``X[i] ** 2 + 2 W[i]`` for each node `i` of `rows`.
+
+    energy : float
+        The part of the energy of the graph given by `rows`.
+
+    heads, terms : numpy.ndarray
+        The term ``2 X[j] w(j, i) - w(j, i) ** 2`` of every out-edge ``(j, i)``
+        of `rows`, and its head `i`. Self-loops give 0.
+    """
+    import numpy as np
+
+    indptr = csr.indptr
+    deg = indptr[rows + 1] - indptr[rows]
+    offsets = np.repeat(indptr[rows] - np.cumsum(deg) + deg, deg)
+    edges = np.arange(len(offsets)) + offsets
+    heads = csr.indices[edges]
+    w = csr.weights[edges]
+    position = np.repeat(np.arange(len(rows)), deg)
+    X = np.bincount(position, weights=w, minlength=len(rows))
+    W = np.bincount(position, weights=w * w, minlength=len(rows))
+    terms = 2 * X[position] * w - w * w
+    terms[heads == rows[position]] = 0
+    return X * X + 2 * W, float((X * X + W).sum()), heads, terms
 
 
 def sort(data):
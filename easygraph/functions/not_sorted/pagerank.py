@@ -1,5 +1,4 @@
-import easygraph as eg
-
+from easygraph.functions.path.bfs import _csr_of
 from easygraph.utils import *
 
 
@@ -7,7 +6,16 @@ __all__ = ["pagerank"]
 
 
 @not_implemented_for("multigraph")
-def pagerank(G, alpha=0.85):
+def pagerank(
+    G,
+    alpha=0.85,
+    personalization=None,
+    max_iter=1000,
+    tol=1.0e-10,
+    nstart=None,
+    weight="weight",
+    dangling=None,
+):
     """
     Returns the PageRank value of each node in G.
 
@@ -19,36 +27,141 @@ def pagerank(G, alpha=0.85):
     alpha : float
         The damping factor. Default is 0.85
 
-    """
-    import numpy as np
+    personalization : dict, optional (default : None)
+        The probability of each node to restart from, normalized to sum
+        to 1. Missing nodes get 0. If None, restarts are uniform.
+
+    max_iter : int, optional (default : 1000)
+        The maximum number of power iterations.
+
+    tol : float, optional (default : 1e-10)
+        The power iteration stops when the L1 norm of the change of the
+        PageRank vector is below ``len(G) * tol``.
+
+    nstart : dict, optional (default : None)
+        The starting value of each node, e.g. the PageRank of a previous
+        version of the graph, normalized to sum to 1. Missing nodes get 0.
+        If None, the start is uniform.
+
+    weight : string or None, optional (default : 'weight')
+        The edge attribute used as weight. Edges without it get 1. If None,
+        every weight is 1.
+
+    dangling : dict, optional (default : None)
+        The probability of each node to be jumped to from the nodes without
+        out-edges, normalized to sum to 1. If None, `personalization`.
+
+    Returns
+    -------
+    pagerank : dict
+        The PageRank value of each node.
+
+    Raises
+    ------
+    EasyGraphError
+        If the power iteration does not converge in `max_iter` iterations.
+
+    Notes
+    -----
+    The power iteration runs over the sparse adjacency matrix of
+    :meth:`easygraph.Graph.csr`. The mass of the nodes without out-edges is
+    redistributed as a whole at each iteration, so that the transition
+    matrix is never densified. Each iteration costs O(n + m) time.
 
+    The snapshot is cached by `G` until it is modified. Weights written into
+    ``G[u][v]`` directly are not detected, use
+    :func:`easygraph.set_edge_attributes` instead.
+
+    Examples
+    --------
+    >>> pr = eg.pagerank(G)
+
+    Starting from the PageRank before a small change of the graph takes
+    fewer iterations:
+
+    >>> G.add_edge(1, 2)
+    >>> pr = eg.pagerank(G, nstart=pr)
+
+    """
     if len(G) == 0:
         return {}
-    M = google_matrix(G, alpha=alpha)
+    csr = _csr_of(G, weight)
+    n = len(csr)
+    step = _PowerStep(csr, alpha)
+    x = _distribution(csr.node_index, nstart, "nstart")
+    p = _distribution(csr.node_index, personalization, "personalization")
+    d = p if dangling is None else _distribution(csr.node_index, dangling, "dangling")
 
-    # use numpy LAPACK solver
-    eigenvalues, eigenvectors = np.linalg.eig(M.T)
-    ind = np.argmax(eigenvalues)
-    # eigenvector of largest eigenvalue is at ind, normalized
-    largest = np.array(eigenvectors[:, ind]).flatten().real
-    norm = float(largest.sum())
-    return dict(zip(G, map(float, largest / norm)))
+    x = _power_iteration(lambda x: step(x, p, d), x, max_iter, n * tol, "pagerank")
+    return dict(zip(csr.nodes, x.tolist()))
 
 
-def google_matrix(G, alpha):
-    import numpy as np
+def _power_iteration(step, x, max_iter, threshold, name):
+    """Iterates ``x = step(x)`` until the L1 norm of the change is below `threshold`.
 
-    M = eg.utils.to_numpy_array(G)
-    N = len(G)
-    if N == 0:
-        return M
+    This is the solver shared by the power iterations over CSR snapshots,
+    e.g. PageRank, eigenvector and Katz centralities and HITS. `step`
+    returns a new vector, normalized as the method needs.
 
-    # Get dangling nodes(nodes with no out link)
-    dangling_nodes = np.where(M.sum(axis=1) == 0)[0]
-    dangling_weights = np.repeat(1.0 / N, N)
-    for node in dangling_nodes:
-        M[node] = dangling_weights
+    Raises
+    ------
+    EasyGraphError
+        If the iteration does not converge in `max_iter` iterations.
+    """
+    import numpy as np
 
-    M /= M.sum(axis=1)[:, np.newaxis]
+    for _ in range(max_iter):
+        x_last = x
+        x = step(x_last)
+        if np.abs(x - x_last).sum() < threshold:
+            return x
+    raise EasyGraphError(
+        "{}: power iteration failed to converge in {} iterations.".format(
+            name, max_iter
+        )
+    )
+
+
+class _PowerStep:
+    """One power iteration of PageRank over a CSR snapshot."""
+
+    def __init__(self, csr, alpha):
+        import numpy as np
+
+        A = csr.to_scipy()
+        out_weight = np.asarray(A.sum(axis=1)).ravel()
+        self.out_weight = out_weight
+        self.is_dangling = out_weight == 0
+        self.scale = np.divide(
+            1.0, out_weight, out=np.zeros(len(csr)), where=~self.is_dangling
+        )
+        self.AT = A.T
+        self.alpha = alpha
+
+    def __call__(self, x, p, d):
+        """Returns ``alpha * (P^T x + dangling mass * d) + (1 - alpha) * p``."""
+        y = self.AT @ (x * self.scale)
+        y += x[self.is_dangling].sum() * d
+        y *= self.alpha
+        y += (1 - self.alpha) * p
+        return y
+
+
+def _distribution(index, values, name):
+    """The normalized vector of `values`, a dict of nodes, or uniform if None.
+
+    `index` maps the nodes to their positions in the vector.
+    """
+    import numpy as np
 
-    return alpha * M + (1 - alpha) * np.repeat(1.0 / N, N)
+    n = len(index)
+    if values is None:
+        return np.full(n, 1.0 / n)
+    x = np.zeros(n)
+    for node, value in values.items():
+        if node in index:
+            x[index[node]] = value
+    total = x.sum()
+    if total == 0:
+        raise EasyGraphError("{} must have a non-zero sum.".format(name))
+    return x / total
@@ -0,0 +1,89 @@
+import random
+import unittest
+
+import easygraph as eg
+
+
+class DynamicPageRankTest(unittest.TestCase):
+    def assertPageRankEqual(self, actual, expected):
+        self.assertEqual(actual.keys(), expected.keys())
+        for node in expected:
+            self.assertAlmostEqual(actual[node], expected[node], places=9)
+
+    def test_updates(self):
+        random.seed(1)
+        for graph_class in (eg.Graph, eg.DiGraph):
+            for weight in (None, "weight"):
+                for personalization in (None, {0: 1, 3: 2}):
+                    test_graph = graph_class()
+                    for i in range(80):
+                        test_graph.add_edge(
+                            random.randrange(30), random.randrange(30), weight=i % 3 + 1
+                        )
+                    pr = eg.DynamicPageRank(
+                        test_graph,
+                        weight=weight,
+                        personalization=personalization,
+                        tol=1e-12,
+                    )
+                    for i in range(20):
+                        if i % 2:
+                            u, v, _ = random.choice(list(test_graph.edges))
+                            pr.remove_edge(u, v)
+                        else:
+                            pr.add_edge(
+                                random.randrange(35),
+                                random.randrange(35),
+                                weight=i % 4 + 1,
+                            )
+                        self.assertPageRankEqual(
+                            pr.pagerank,
+                            eg.pagerank(
+                                test_graph,
+                                weight=weight,
+                                personalization=personalization,
+                                tol=1e-13,
+                            ),
+                        )
+
+    def test_new_nodes_in_distributions(self):
+        random.seed(2)
+        personalization = {i: i % 5 + 1 for i in range(49)}
+        dangling = {i: 1 for i in range(25, 49)}
+        for kwargs in (
+            {"personalization": personalization},
+            {"dangling": dangling},
+            {"personalization": personalization, "dangling": dangling},
+        ):
+            test_graph = eg.DiGraph()
+            for i in range(60):
+                test_graph.add_edge(random.randrange(30), random.randrange(30))
+            pr = eg.DynamicPageRank(test_graph, tol=1e-12, **kwargs)
+            for u, v in [(1, 32), (32, 40), (40, 55), (55, 3)]:
+                pr.add_edge(u, v)
+                self.assertPageRankEqual(
+                    pr.pagerank, eg.pagerank(test_graph, tol=1e-13, **kwargs)
+                )
+
+    def test_local_push(self):
+        # A long directed path: a change at its end only reaches the last nodes.
+        n = 2000
+        test_graph = eg.DiGraph([(i, i + 1) for i in range(n)])
+        pr = eg.DynamicPageRank(test_graph, dangling={n: 1}, tol=1e-13)
+        pr.add_edge(n, n - 1)
+        expected = eg.pagerank(test_graph, dangling={n: 1}, tol=1e-13)
+        self.assertPageRankEqual(pr.pagerank, expected)
+        self.assertLess(pr.last_pushed, n)
+
+    def test_external_changes(self):
+        test_graph = eg.DiGraph([(1, 2), (2, 3)])
+        pr = eg.DynamicPageRank(test_graph)
+        test_graph.add_edge(3, 1)
+        self.assertPageRankEqual(pr.pagerank, eg.pagerank(test_graph, tol=1e-13))
+        with self.assertRaises(KeyError):
+            pr.remove_edge(1, 3)
+        self.assertEqual(eg.DynamicPageRank(eg.DiGraph()).pagerank, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
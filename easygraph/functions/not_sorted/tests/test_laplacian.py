@@ -0,0 +1,53 @@
+import random
+import unittest
+
+import easygraph as eg
+import numpy as np
+
+
+def _energy(G, nodes):
+    # The sum of the squared eigenvalues of the Laplacian matrix.
+    index = {node: i for i, node in enumerate(nodes)}
+    A = np.zeros((len(nodes), len(nodes)))
+    for u, v, attr in G.edges:
+        if u in index and v in index and u != v:
+            A[index[u], index[v]] = A[index[v], index[u]] = attr.get("weight", 1)
+    L = np.diag(A.sum(axis=1)) - A
+    return (np.linalg.eigvalsh(L) ** 2).sum()
+
+
+class LaplacianTest(unittest.TestCase):
+    def test_laplacian(self):
+        random.seed(2)
+        test_graph = eg.Graph()
+        for _ in range(60):
+            u, v = random.randrange(20), random.randrange(20)
+            if u != v:
+                test_graph.add_edge(u, v, weight=random.randint(1, 4))
+        test_graph.add_node(20)
+        result = eg.laplacian(test_graph)
+        nodes = list(test_graph.nodes)
+        energy = _energy(test_graph, nodes)
+        for node in nodes:
+            rest = [other for other in nodes if other != node]
+            expected = (energy - _energy(test_graph, rest)) / energy
+            self.assertAlmostEqual(result[node], expected)
+
+        parallel = eg.laplacian(test_graph, n_workers=2)
+        self.assertEqual(parallel.keys(), result.keys())
+        for node in nodes:
+            self.assertAlmostEqual(parallel[node], result[node])
+
+    def test_directed(self):
+        test_graph = eg.DiGraph([(1, 2), (2, 3), (3, 1), (1, 1)])
+        test_graph.add_edge(1, 3, weight=2)
+        # X = {1: 4, 2: 1, 3: 1}, W = {1: 6, 2: 1, 3: 1}, so that ELG = 26.
+        result = eg.laplacian(test_graph)
+        self.assertAlmostEqual(result[1], (16 + 12 + 1) / 26)
+        self.assertAlmostEqual(result[2], (1 + 2 + 7) / 26)
+        self.assertAlmostEqual(result[3], (1 + 2 + 12 + 1) / 26)
+        self.assertEqual(eg.laplacian(eg.DiGraph()), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
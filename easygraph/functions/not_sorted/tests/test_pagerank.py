@@ -23,3 +23,23 @@ class TestPageRank:
         pg = eg.pagerank(self.G1)
         for k, v in pg.items():
             assert pytest.approx(v, 0.0000001) == pg_true[k]
+
+    def test_options(self):
+        G = eg.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4)])
+        G.add_edge(1, 3, weight=3)
+        pr = eg.pagerank(G)
+        assert pytest.approx(sum(pr.values())) == 1
+        # Node 4 has no out-edges: its mass restarts like the teleports.
+        pr = eg.pagerank(G, personalization={1: 1})
+        assert pytest.approx(pr, abs=1e-8) == eg.pagerank(
+            G, personalization={1: 1}, dangling={1: 1}
+        )
+        assert pr[1] > pr[2]
+        # A warm start converges to the same values.
+        assert pytest.approx(eg.pagerank(G, nstart=pr), abs=1e-8) == eg.pagerank(G)
+        # The heavier edge 1 -> 3 takes rank away from 2.
+        assert eg.pagerank(G)[2] < eg.pagerank(G, weight=None)[2]
+        with pytest.raises(eg.EasyGraphError):
+            eg.pagerank(G, max_iter=1)
+        with pytest.raises(eg.EasyGraphError):
+            eg.pagerank(G, personalization={5: 1})
@@ -1 +1,3 @@
-from .path import *
+from .all_pairs import *
+from .bfs import *
+from .path import *
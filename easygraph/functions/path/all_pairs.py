@@ -0,0 +1,213 @@
+from easygraph.functions.path.bfs import _csr_of
+from easygraph.utils.decorators import *
+from easygraph.utils.exception import EasyGraphError
+from easygraph.utils.parallel import parallel_map
+
+
+__all__ = ["distance_matrix"]
+
+
+@not_implemented_for("multigraph")
+def distance_matrix(G, weight="weight", method="auto", dtype="float64", n_workers=None):
+    """Returns the shortest path lengths between all pairs of nodes, as a matrix.
+
+    Parameters
+    ----------
+    G : easygraph.Graph or easygraph.DiGraph
+
+    weight : string or None, optional (default : 'weight')
+        The edge attribute used as length. Edges without it get 1. If None,
+        every length is 1.
+
+    method : {'auto', 'floyd-warshall', 'johnson'}, optional (default : 'auto')
+        The algorithm. 'auto' runs Floyd-Warshall on dense graphs, with at
+        least ``n ** 2 / 4`` edges, and Johnson's algorithm otherwise.
+
+    dtype : {'float64', 'float32'}, optional (default : 'float64')
+        The type of the matrix. 'float32' halves its memory, and the time of
+        Floyd-Warshall, but rounds lengths beyond ``2 ** 24``.
+
+    n_workers : int or None, optional (default : None)
+        The number of workers running Dijkstra's algorithm from the sources
+        of Johnson's algorithm.
+
+    Returns
+    -------
+    D : numpy.ndarray
+        ``D[i, j]`` is the length of the shortest path from the `i`-th node
+        of ``list(G)`` to the `j`-th one, ``inf`` if there is none.
+
+    Raises
+    ------
+    EasyGraphError
+        If `G` has a cycle of negative length.
+
+    Notes
+    -----
+    Floyd-Warshall runs in O(n^3) time over a dense matrix, in blocks of
+    64 intermediate nodes: once a block is closed, every entry is relaxed
+    through it by a min-plus product, taken over row tiles that fit in the
+    cache [1]_.
+
+    Johnson's algorithm runs Dijkstra's algorithm from every node, in
+    O(n m log n) time. Negative lengths are first made non-negative with
+    the potentials of a Bellman-Ford search [2]_.
+
+    Examples
+    --------
+    >>> G = eg.Graph([(1, 2), (2, 3)])
+    >>> eg.distance_matrix(G)
+    array([[0., 1., 2.],
+           [1., 0., 1.],
+           [2., 1., 0.]])
+
+    References
+    ----------
+    .. [1] Venkataraman, G., Sahni, S. & Mukhopadhyaya, S. (2003). A blocked
+       all-pairs shortest-paths algorithm. ACM Journal of Experimental
+       Algorithmics, 8, 2.2.
+
+    .. [2] Johnson, D. B. (1977). Efficient algorithms for shortest paths in
+       sparse networks. Journal of the ACM, 24(1), 1-13.
+
+    """
+    import numpy as np
+
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype must be float32 or float64.")
+    csr = _csr_of(G, weight)
+    n = len(csr)
+    if method == "auto":
+        method = "floyd-warshall" if 4 * csr.nnz >= n * n else "johnson"
+    if method == "floyd-warshall":
+        return _floyd_warshall(csr, dtype)
+    if method == "johnson":
+        return _johnson(G, csr, dtype, n_workers)
+    raise ValueError("method must be 'auto', 'floyd-warshall' or 'johnson'.")
+
+
+def _floyd_warshall(csr, dtype, block=64, tile_bytes=1 << 19):
+    import numpy as np
+
+    n = len(csr)
+    D = np.full((n, n), np.inf, dtype=dtype)
+    D[np.repeat(np.arange(n), np.diff(csr.indptr)), csr.indices] = csr.weights
+    diagonal = np.einsum("ii->i", D)
+    np.minimum(diagonal, 0, out=diagonal)
+    tile = max(1, tile_bytes // max(1, n * D.itemsize))
+    for start in range(0, n, block):
+        K = slice(start, min(start + block, n))
+        # The block itself first, then the rows and the columns through it,
+        # and at last every entry through its rows and columns.
+        closed = D[K, K]
+        for k in range(closed.shape[0]):
+            np.minimum(closed, closed[:, k, None] + closed[k], out=closed)
+        if (np.einsum("ii->i", closed) < 0).any():
+            raise EasyGraphError("distance_matrix: negative cycle detected.")
+        rows = D[K].copy()
+        _min_plus(rows, closed, D[K], tile)
+        D[K] = rows
+        _min_plus(D[:, K], D[:, K].copy(), closed, tile)
+        cols = D[:, K].copy()
+        _min_plus(D, cols, rows, tile)
+    return D
+
+
+def _min_plus(D, A, B, tile):
+    """Sets `D` to ``min(D, A (x) B)``, the min-plus product, `tile` rows at a time."""
+    import numpy as np
+
+    buffer = np.empty((tile, D.shape[1]), dtype=D.dtype)
+    for start in range(0, D.shape[0], tile):
+        out = D[start : start + tile]
+        a = A[start : start + tile]
+        tmp = buffer[: len(out)]
+        for k in range(A.shape[1]):
+            np.add(a[:, k, None], B[k], out=tmp)
+            np.minimum(out, tmp, out=out)
+
+
+def _johnson(G, csr, dtype, n_workers):
+    import numpy as np
+
+    n = len(csr)
+    potential = _potential(csr) if (csr.weights < 0).any() else None
+    if n_workers is not None:
+        ret = parallel_map(
+            distance_matrix_parallel,
+            G,
+            csr.nodes,
+            n_workers,
+            csr_weight=csr.weight,
+            weight=csr.weight,
+            potential=potential,
+            dtype=dtype,
+        )
+        D = np.empty((n, n), dtype=dtype)
+        for sources, rows in ret:
+            D[sources] = rows
+        return D
+    return _dijkstra_rows(csr, np.arange(n), potential, dtype)
+
+
+def distance_matrix_parallel(nodes, G, weight, potential, dtype):
+    import numpy as np
+
+    csr = _csr_of(G, weight)
+    index = csr.node_index
+    sources = np.fromiter((index[v] for v in nodes), np.int64, len(nodes))
+    return sources, _dijkstra_rows(csr, sources, potential, dtype)
+
+
+def _potential(csr):
+    """The potentials of Johnson's algorithm, by Bellman-Ford from a new node.
+
+    The new node has an edge of length 0 to every node, so that the
+    potential of a node is the length of the shortest path ending at it.
+    """
+    import numpy as np
+
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import NegativeCycleError
+    from scipy.sparse.csgraph import bellman_ford
+
+    n = len(csr)
+    indptr = np.r_[csr.indptr, csr.nnz + n]
+    indices = np.r_[csr.indices, np.arange(n)]
+    weights = np.r_[csr.weights, np.zeros(n)]
+    A = csr_matrix((weights, indices, indptr), shape=(n + 1, n + 1))
+    try:
+        return bellman_ford(A, directed=True, indices=n)[:n]
+    except NegativeCycleError:
+        raise EasyGraphError("distance_matrix: negative cycle detected.")
+
+
+def _dijkstra_rows(csr, sources, potential, dtype, max_size=1 << 24):
+    """The rows of `sources` of the distance matrix, by Dijkstra's algorithm.
+
+    With a `potential`, the length ``w`` of the edge ``(u, v)`` is replaced
+    by ``w + potential[u] - potential[v]``, which is non-negative. Sources
+    are taken in batches of about `max_size` entries.
+    """
+    import numpy as np
+
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+
+    n = len(csr)
+    weights = csr.weights
+    if potential is not None:
+        tails = np.repeat(np.arange(n), np.diff(csr.indptr))
+        weights = weights + potential[tails] - potential[csr.indices]
+        np.maximum(weights, 0, out=weights)
+    A = csr_matrix((weights, csr.indices, csr.indptr), shape=(n, n))
+    D = np.empty((len(sources), n), dtype=dtype)
+    step = max(1, max_size // max(1, n))
+    for start in range(0, len(sources), step):
+        batch = sources[start : start + step]
+        rows = dijkstra(A, directed=True, indices=batch)
+        if potential is not None:
+            rows += potential[None, :] - potential[batch, None]
+        D[start : start + step] = rows
+    return D
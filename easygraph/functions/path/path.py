@@ -69,26 +69,13 @@ def Floyd(G):
     """
     if G.cflag == 1:
         return cpp_Floyd(G)
-    adj = G.adj.copy()
-    result_dict = {}
-    for i in G:
-        result_dict[i] = {}
-    for i in G:
-        temp_key = adj[i].keys()
-        for j in G:
-            if j in temp_key:
-                result_dict[i][j] = adj[i][j].get("weight", 1)
-            else:
-                result_dict[i][j] = float("inf")
-            if i == j:
-                result_dict[i][i] = 0
-    for k in G:
-        for i in G:
-            for j in G:
-                temp = result_dict[i][k] + result_dict[k][j]
-                if result_dict[i][j] > temp:
-                    result_dict[i][j] = temp
-    return result_dict
+    from easygraph.functions.path.all_pairs import distance_matrix
+
+    # The dense matrix of distance_matrix, unpacked into dicts.
+    nodes = list(G)
+    return {
+        i: dict(zip(nodes, row)) for i, row in zip(nodes, distance_matrix(G).tolist())
+    }
 
 
 @not_implemented_for("multigraph")
@@ -0,0 +1,63 @@
+import math
+import unittest
+
+import easygraph as eg
+import numpy as np
+
+from easygraph.functions.path.path import _dijkstra_multisource
+
+
+class DistanceMatrixTest(unittest.TestCase):
+    def _check(self, G, **kwargs):
+        nodes = list(G)
+        D = eg.distance_matrix(G, **kwargs)
+        self.assertEqual(D.shape, (len(nodes), len(nodes)))
+        for i, u in enumerate(nodes):
+            dist = _dijkstra_multisource(G, {u}, kwargs.get("weight", "weight"))
+            for j, v in enumerate(nodes):
+                self.assertAlmostEqual(D[i, j], dist.get(v, math.inf), places=5)
+
+    def _graph(self, G):
+        G.add_edges_from(
+            [(i, (i * 7 + 3) % 150, {"weight": i % 5 + 1}) for i in range(150)]
+        )
+        G.add_edges_from([(i, i + 1) for i in range(0, 150, 10)])
+        G.add_edge(150, 151)
+        return G
+
+    def test_undirected(self):
+        G = self._graph(eg.Graph())
+        for method in ["floyd-warshall", "johnson"]:
+            self._check(G, method=method)
+            self._check(G, method=method, dtype="float32")
+        self._check(G, weight=None)
+
+    def test_directed(self):
+        G = self._graph(eg.DiGraph())
+        for method in ["floyd-warshall", "johnson"]:
+            self._check(G, method=method)
+        self._check(G, method="johnson", n_workers=2)
+
+    def test_negative_weights(self):
+        G = eg.DiGraph([(1, 2, {"weight": 4}), (1, 3, {"weight": 1})])
+        G.add_edges_from([(3, 2, {"weight": -2}), (2, 4, {"weight": 1})])
+        inf = math.inf
+        expected = [[0, -1, 1, 0], [inf, 0, inf, 1], [inf, -2, 0, -1], [inf] * 3 + [0]]
+        for method in ["floyd-warshall", "johnson"]:
+            D = eg.distance_matrix(G, method=method)
+            np.testing.assert_array_equal(D, np.array(expected))
+
+        G.add_edge(2, 3, weight=1)
+        for method in ["floyd-warshall", "johnson"]:
+            with self.assertRaises(eg.EasyGraphError):
+                eg.distance_matrix(G, method=method)
+
+    def test_floyd(self):
+        G = eg.Graph([(1, 2, {"weight": 3}), (2, 3), (1, 3), (4, 5)])
+        dist = eg.Floyd(G)
+        self.assertEqual(dist[1], {1: 0, 2: 2, 3: 1, 4: math.inf, 5: math.inf})
+        self.assertEqual(dist[5][4], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+import easygraph as eg
+
+from easygraph.functions.path.path import single_source_bfs
+
+
+class BFSLevelCountsTest(unittest.TestCase):
+    def _check(self, G, batch_size):
+        seen = []
+        for batch, counts in eg.bfs_level_counts(G, batch_size=batch_size):
+            seen.extend(batch)
+            for i, source in enumerate(batch):
+                expected = [0] * len(counts)
+                for d in single_source_bfs(G, source).values():
+                    expected[d] += 1
+                self.assertEqual(counts[:, i].tolist(), expected)
+        self.assertEqual(seen, list(G.nodes))
+
+    def test_undirected(self):
+        G = eg.Graph([(i, (i * 7 + 3) % 150) for i in range(150)])
+        G.add_edges_from([(150, 151), (152, 152)])
+        self._check(G, 64)
+        self._check(G, 100)
+
+    def test_directed(self):
+        G = eg.DiGraph([(i, (i * 7 + 3) % 150) for i in range(150)])
+        G.add_edges_from([(i, i + 1) for i in range(0, 150, 10)])
+        self._check(G, 64)
+
+    def test_sources(self):
+        G = eg.Graph([(1, 2), (2, 3), (4, 5)])
+        [(batch, counts)] = list(eg.bfs_level_counts(G, sources=[3, 4, 3]))
+        self.assertEqual(batch, [3, 4, 3])
+        self.assertEqual(counts.tolist(), [[1, 1, 1], [1, 1, 1], [1, 0, 1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
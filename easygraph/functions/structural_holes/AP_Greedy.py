@@ -60,14 +60,14 @@ def common_greedy(G, k, c=1.0, weight="weight"):
 
     """
     v_sns = []
-    G_i = G.copy()
+    G_i = G.copy(share_attrs=True)
     N = len(G)
     for i in range(k):
         sorted_nodes = sort_nodes_by_degree(G_i, weight)
         C_max = 0
 
         for j in range(N - i):
-            G_i_j = G_i.copy()
+            G_i_j = G_i.copy(share_attrs=True)
             G_i_j.remove_node(sorted_nodes[j])
             upper_bound = procedure1(G_i_j, c)
             if upper_bound < C_max:
@@ -275,7 +275,7 @@ def AP_Greedy(G, k, c=1.0, weight="weight"):
     .. [1] https://dl.acm.org/profile/81484650642
     """
     v_sns = []
-    G_i = G.copy()
+    G_i = G.copy(share_attrs=True)
     N = len(G)
     for i in range(k):
         v_ap, lower_bound = _get_lower_bound_of_ap_nodes(G_i, c)
@@ -291,7 +291,7 @@ def AP_Greedy(G, k, c=1.0, weight="weight"):
             C_max = 0
 
             for j in range(N - i):
-                G_i_j = G_i.copy()
+                G_i_j = G_i.copy(share_attrs=True)
                 G_i_j.remove_node(sorted_nodes[j])
                 upper_bound = procedure1(G_i_j, c)
                 if upper_bound < C_max:
@@ -339,7 +339,7 @@ def _get_lower_bound_of_ap_nodes(G, c=1.0):
         articulation_points = list(generator_articulation_points(component_subgraph))
         N_component = len(component_subgraph)
         for articulation in articulation_points:
-            component_subgraph_after_remove = component_subgraph.copy()
+            component_subgraph_after_remove = component_subgraph.copy(share_attrs=True)
             component_subgraph_after_remove.remove_node(articulation)
 
             lower_bound_value = 0
@@ -1,5 +1,6 @@
 import easygraph as eg
 
+from easygraph.functions.path.bfs import _has_unit_weights
 from easygraph.utils import *
 
 
@@ -11,12 +12,13 @@ def inverse_closeness_centrality(G, v):
     return c_v
 
 
-def bounded_inverse_closeness_centrality(G, v, l):
+def bounded_inverse_closeness_centrality(G, v, l, shortest_path=None):
     queue = []
     queue.append(v)
     seen = set()
     seen.add(v)
-    shortest_path = eg.Floyd(G)
+    if shortest_path is None:
+        shortest_path = eg.Floyd(G)
     result = 0
     while len(queue) > 0:
         vertex = queue.pop(0)
@@ -31,6 +33,43 @@ def bounded_inverse_closeness_centrality(G, v, l):
     return result / (len(G) - 1)
 
 
+def _inverse_closeness_centralities(G, nodes):
+    """The inverse closeness centrality of each of `nodes`, as a dict."""
+    if not _has_unit_weights(G):
+        return {v: inverse_closeness_centrality(G, v) for v in nodes}
+    import numpy as np
+
+    c = {}
+    for batch, counts in eg.bfs_level_counts(G, nodes):
+        dists = (np.arange(len(counts)) @ counts).tolist()
+        for v, dist in zip(batch, dists):
+            c[v] = dist / (len(G) - 1)
+    return c
+
+
+def _bounded_inverse_closeness_centralities(G, nodes, l):
+    """The bounded inverse closeness centrality of each of `nodes`, as a dict.
+
+    The bounded BFS from `v` sums the distances to the nodes within
+    distance ``l + 1`` of `v`.
+    """
+    if not _has_unit_weights(G):
+        shortest_path = eg.Floyd(G)
+        return {
+            v: bounded_inverse_closeness_centrality(G, v, l, shortest_path)
+            for v in nodes
+        }
+    import numpy as np
+
+    c = {}
+    for batch, counts in eg.bfs_level_counts(G, nodes):
+        counts = counts[: l + 2]
+        dists = (np.arange(len(counts)) @ counts).tolist()
+        for v, dist in zip(batch, dists):
+            c[v] = dist / (len(G) - 1)
+    return c
+
+
 def Modified_DFS(G, u, V, time, n):
     V[u]["color"] = "black"
     time += 1
@@ -110,8 +149,9 @@ def ICC(G, k):
     """
     Q = []
     V = []
+    inverse_closeness = _inverse_closeness_centralities(G, G.nodes)
     for v in G.nodes:
-        i_c = inverse_closeness_centrality(G, v)
+        i_c = inverse_closeness[v]
         if len(Q) < k:
             Q.append([v, i_c])
             continue
@@ -168,8 +208,9 @@ def BICC(G, k, K, l):
     """
     H = []
     V = []
+    bounded = _bounded_inverse_closeness_centralities(G, G.nodes, l)
     for v in G.nodes:
-        b_i_c = bounded_inverse_closeness_centrality(G, v, l)
+        b_i_c = bounded[v]
         if len(H) < K:
             H.append([v, b_i_c])
             continue
@@ -182,9 +223,10 @@ def BICC(G, k, K, l):
         if b_i_c > MIN:
             H.remove([t, MIN])
             H.append([v, b_i_c])
+    inverse_closeness = _inverse_closeness_centralities(G, [i[0] for i in H])
     for i in H:
         v = i[0]
-        i_c = inverse_closeness_centrality(G, v)
+        i_c = inverse_closeness[v]
         if len(V) < k:
             V.append([v, i_c])
             continue
@@ -258,14 +300,15 @@ def AP_BICC(G, k, K, l):
             T.remove([t, MIN])
             T.append([v, A[v]["c"]])
     if len(T) < k:
-        U = {}
+        U = []
         for i in G.nodes:
             if i not in A:
                 U.append(i)
         kk = k - len(T)
         Q = []
+        bounded = _bounded_inverse_closeness_centralities(G, U, l)
         for v in U:
-            b_i_c = bounded_inverse_closeness_centrality(G, v, l)
+            b_i_c = bounded[v]
             if len(Q) < K:
                 Q.append([v, b_i_c])
             else:
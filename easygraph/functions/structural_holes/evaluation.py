@@ -29,6 +29,12 @@ sum_nmw_rec = {}
 max_nmw_rec = {}
 
 
+def _clear_caches():
+    sum_nmw_rec.clear()
+    max_nmw_rec.clear()
+    local_constraint_rec.clear()
+
+
 def normalized_mutual_weight(G, u, v, norm=sum, weight=None):
     if norm == sum:
         try:
@@ -70,7 +76,7 @@ def effective_size_borgatti_parallel(nodes, G, weight):
         if len(G[node]) == 0:
             ret.append([node, float("nan")])
             continue
-        E = G.ego_subgraph(node)
+        E = G.ego_subgraph(node, as_view=True)
         if len(E) > 1:
             ret.append([node, len(E) - 1 - (2 * E.size()) / (len(E) - 1)])
         else:
@@ -113,7 +119,7 @@ def effective_size(G, nodes=None, weight=None, n_workers=None):
        Harvard university press, 2009.
     """
     if G.cflag == 1:
-        return cpp_effective_size(G, nodes=nodes, weight=weight)
+        return cpp_effective_size(G, nodes=nodes, weight=weight, n_workers=n_workers)
     sum_nmw_rec.clear()
     max_nmw_rec.clear()
     effective_size = {}
@@ -122,23 +128,17 @@ def effective_size(G, nodes=None, weight=None, n_workers=None):
     # Use Borgatti's simplified formula for unweighted and undirected graphs
     if not G.is_directed() and weight is None:
         if n_workers is not None:
-            import random
-
-            from functools import partial
-            from multiprocessing import Pool
-
-            local_function = partial(
-                effective_size_borgatti_parallel, G=G, weight=weight
+            ret = parallel_map(
+                effective_size_borgatti_parallel,
+                G,
+                nodes,
+                n_workers,
+                cost=G.degree(weight=None),
+                csr_weight=weight,
+                initializer=_clear_caches,
+                weight=weight,
             )
-            nodes = list(nodes)
-            random.shuffle(nodes)
-            if len(nodes) > n_workers * 50000:
-                nodes = split_len(nodes, step=50000)
-            else:
-                nodes = split(nodes, n_workers)
-            with Pool(n_workers) as p:
-                ret = p.imap(local_function, nodes)
-                res = [x for i in ret for x in i]
+            res = [x for i in ret for x in i]
             effective_size = dict(res)
         else:
             for v in nodes:
@@ -146,28 +146,24 @@ def effective_size(G, nodes=None, weight=None, n_workers=None):
                 if len(G[v]) == 0:
                     effective_size[v] = float("nan")
                     continue
-                E = G.ego_subgraph(v)
+                E = G.ego_subgraph(v, as_view=True)
                 if len(E) > 1:
                     effective_size[v] = len(E) - 1 - (2 * E.size()) / (len(E) - 1)
                 else:
                     effective_size[v] = 0
     else:
         if n_workers is not None:
-            import random
-
-            from functools import partial
-            from multiprocessing import Pool
-
-            local_function = partial(effective_size_parallel, G=G, weight=weight)
-            nodes = list(nodes)
-            random.shuffle(nodes)
-            if len(nodes) > n_workers * 30000:
-                nodes = split_len(nodes, step=30000)
-            else:
-                nodes = split(nodes, n_workers)
-            with Pool(n_workers) as p:
-                ret = p.imap(local_function, nodes)
-                res = [x for i in ret for x in i]
+            ret = parallel_map(
+                effective_size_parallel,
+                G,
+                nodes,
+                n_workers,
+                cost=G.degree(weight=None),
+                csr_weight=weight,
+                initializer=_clear_caches,
+                weight=weight,
+            )
+            res = [x for i in ret for x in i]
             effective_size = dict(res)
         else:
             for v in nodes:
@@ -277,21 +273,17 @@ def constraint(G, nodes=None, weight=None, n_workers=None):
         return v, constraint_of_v
 
     if n_workers is not None:
-        import random
-
-        from functools import partial
-        from multiprocessing import Pool
-
-        local_function = partial(compute_constraint_of_nodes, G=G, weight=weight)
-        nodes = list(nodes)
-        random.shuffle(nodes)
-        if len(nodes) > n_workers * 30000:
-            nodes = split_len(nodes, step=30000)
-        else:
-            nodes = split(nodes, n_workers)
-        with Pool(n_workers) as p:
-            ret = p.imap(local_function, nodes)
-            constraint_results = [x for i in ret for x in i]
+        ret = parallel_map(
+            compute_constraint_of_nodes,
+            G,
+            nodes,
+            n_workers,
+            cost=G.degree(weight=None),
+            csr_weight=weight,
+            initializer=_clear_caches,
+            weight=weight,
+        )
+        constraint_results = [x for i in ret for x in i]
     else:
         constraint_results = []
         for v in nodes:
@@ -322,7 +314,7 @@ def local_constraint(G, u, v, weight=None):
 def hierarchy_parallel(nodes, G):
     ret = []
     for v in nodes:
-        E = G.ego_subgraph(v)
+        E = G.ego_subgraph(v, as_view=True)
         n = len(E) - 1
         C = 0
         c = {}
@@ -367,7 +359,7 @@ def hierarchy(G, nodes=None, weight=None, n_workers=None):
     https://m.book118.com/html/2019/0318/5320024122002021.shtm
     """
     if G.cflag == 1:
-        return cpp_hierarchy(G, nodes=nodes, weight=weight)
+        return cpp_hierarchy(G, nodes=nodes, weight=weight, n_workers=n_workers)
     sum_nmw_rec.clear()
     max_nmw_rec.clear()
     local_constraint_rec.clear()
@@ -375,25 +367,20 @@ def hierarchy(G, nodes=None, weight=None, n_workers=None):
         nodes = G.nodes
     hierarchy = {}
     if n_workers is not None:
-        import random
-
-        from functools import partial
-        from multiprocessing import Pool
-
-        local_function = partial(hierarchy_parallel, G=G)
-        nodes = list(nodes)
-        random.shuffle(nodes)
-        if len(nodes) > n_workers * 30000:
-            nodes = split_len(nodes, step=30000)
-        else:
-            nodes = split(nodes, n_workers)
-        with Pool(n_workers) as p:
-            ret = p.imap(local_function, nodes)
-            res = [x for i in ret for x in i]
+        ret = parallel_map(
+            hierarchy_parallel,
+            G,
+            nodes,
+            n_workers,
+            cost=G.degree(weight=None),
+            csr_weight=weight,
+            initializer=_clear_caches,
+        )
+        res = [x for i in ret for x in i]
         hierarchy = dict(res)
     else:
         for v in nodes:
-            E = G.ego_subgraph(v)
+            E = G.ego_subgraph(v, as_view=True)
             n = len(E) - 1
             C = 0
             c = {}
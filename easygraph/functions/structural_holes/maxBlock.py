@@ -234,8 +234,8 @@ def _find_topk_shs_under_l(G, f_set, k, L):
         # Choose a node s from the n nodes in G randomly
         node_s = random.choice(list(G.nodes))
         # Generate a graph G & = (V, E & ) from G under the live-edge graph model
-        G_live = G.copy()
-        for edge in G_live.edges:
+        G_live = G.copy(share_attrs=True)
+        for edge in list(G_live.edges):
             wij = G_live[edge[0]][edge[1]]["weight"]
             toss = random.random() + 0.1
             if toss >= wij:
@@ -497,21 +497,21 @@ def maxBlockFast(G, k, f_set=None, L=None, flag_weight=False):
         if l % 10000 == 0:
             print(l, "/", L, "...")
         # Generate a graph G & = (V, E & ) from G under the live-edge graph model
-        G_live = G.copy()
-        for edge in G_live.edges:
+        G_live = G.copy(share_attrs=True)
+        for edge in list(G_live.edges):
             wij = G_live[edge[0]][edge[1]]["weight"]
             toss = random.random() + 0.1
             if toss >= wij:
                 G_live.remove_edge(edge[0], edge[1])
 
-        G0 = G_live.copy()
+        G0 = G_live.copy(share_attrs=True)
         d_dict = {}
         ns = number_strongly_connected_components(G0)
         non_considered_nodes = set()
         for node in G0.nodes:
             d_dict[node] = 1
             non_considered_nodes.add(node)
-        G_p_1 = G0.copy()
+        G_p_1 = G0.copy(share_attrs=True)
         for i in range(ns):
             separation_nodes, SCC_mapping, incoming_info = _find_separation_nodes(G_p_1)
             # print("separation_nodes:", separation_nodes)
@@ -558,10 +558,10 @@ def maxBlockFast(G, k, f_set=None, L=None, flag_weight=False):
                 d_dict[chosen_node] = 0
                 for node_vj in G_tr.nodes:
                     d_dict[chosen_node] += d_dict[node_vj]
-                G_p = G_p_1.copy()
+                G_p = G_p_1.copy(share_attrs=True)
                 for neighbor in G_p_1.neighbors(node=chosen_node):
                     G_p.remove_edge(chosen_node, neighbor)
-                G_p_1 = G_p.copy()
+                G_p_1 = G_p.copy(share_attrs=True)
                 non_considered_nodes.remove(chosen_node)
             else:
                 V_set = set()
@@ -594,12 +594,12 @@ def maxBlockFast(G, k, f_set=None, L=None, flag_weight=False):
                                 print(desc_set[node_u])
                             D_u += d_dict[desc]
                         h_set[node_u] += f_set[node_v] * D_u
-                G_p = G_p_1.copy()
+                G_p = G_p_1.copy(share_attrs=True)
                 for node_v in V_set:
                     non_considered_nodes.remove(node_v)
                     for neighbor in G_p_1.neighbors(node=node_v):
                         G_p.remove_edge(node_v, neighbor)
-                G_p_1 = G_p.copy()
+                G_p_1 = G_p.copy(share_attrs=True)
     ave_H_set = {}
     for node in G.nodes:
         ave_H_set[node] = h_set[node] * n / L
@@ -4,6 +4,7 @@ import random
 import easygraph as eg
 import numpy as np
 
+from easygraph.functions.path.bfs import _has_unit_weights
 from easygraph.utils import *
 
 
@@ -44,27 +45,28 @@ def sum_of_shortest_paths(G, S):
     .. [1] https://dl.acm.org/profile/81484650642
 
     """
-    mat_G = eg.Floyd(G)
-    sum_G = 0
-    inf_const_G = math.ceil((G.number_of_nodes() ** 3) / 3)
-    for i in mat_G.values():
-        for j in i.values():
-            if math.isinf(j):
-                j = inf_const_G
-            sum_G += j
-    G_S = G.copy()
+    sum_G = _sum_of_distances(G)
+    G_S = G.copy(share_attrs=True)
     G_S.remove_nodes(S)
-    mat_G_S = eg.Floyd(G_S)
-    sum_G_S = 0
-    inf_const_G_S = math.ceil((G_S.number_of_nodes() ** 3) / 3)
-    for i in mat_G_S.values():
-        for j in i.values():
-            if math.isinf(j):
-                j = inf_const_G_S
-            sum_G_S += j
+    sum_G_S = _sum_of_distances(G_S)
     return sum_G_S - sum_G
 
 
+def _sum_of_distances(G):
+    """Sums the distances of all pairs of nodes, ceil(n^3 / 3) if unreachable."""
+    n = G.number_of_nodes()
+    inf_const = math.ceil((n**3) / 3)
+    if _has_unit_weights(G):
+        total = 0
+        for _, counts in eg.bfs_level_counts(G):
+            total += int(np.arange(len(counts)) @ counts.sum(axis=1))
+            total += int((n - counts.sum(axis=0)).sum()) * inf_const
+        return total
+    D = eg.distance_matrix(G)
+    unreachable = np.isinf(D)
+    return D[~unreachable].sum() + int(unreachable.sum()) * inf_const
+
+
 @not_implemented_for("multigraph")
 def nodes_of_max_cc_without_shs(G, S):
     r"""Returns the number of nodes in the maximum connected component in graph G\S.
@@ -94,7 +96,7 @@ def nodes_of_max_cc_without_shs(G, S):
     .. [1] https://dl.acm.org/profile/81484650642
 
     """
-    G_S = G.copy()
+    G_S = G.copy(share_attrs=True)
     G_S.remove_nodes(S)
     ccs = eg.connected_components(G_S)
     max_num = 0
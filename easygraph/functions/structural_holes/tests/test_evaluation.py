@@ -1,8 +1,17 @@
+import random
 import unittest
 
 import easygraph as eg
 
 
+try:
+    from cpp_easygraph import cpp_constraint
+
+    has_cpp = True
+except ImportError:
+    has_cpp = False
+
+
 class EvaluationTest(unittest.TestCase):
     def test_effective_size(self):
         test_graph = eg.Graph([(1, 2), (2, 3), (3, 4)])
@@ -120,6 +129,30 @@ class EvaluationTest(unittest.TestCase):
             test_two_expected_result,
         )
 
+    @unittest.skipUnless(has_cpp, "the C++ extension is not built")
+    def test_cpp_n_workers(self):
+        random.seed(0)
+        edges = [(random.randrange(60), random.randrange(60)) for _ in range(200)]
+        G = eg.Graph()
+        G_cpp = eg.GraphC()
+        for u, v in edges:
+            G.add_edge(u, v, weight=u % 3 + 1)
+            G_cpp.add_edge(u, v, weight=u % 3 + 1)
+        G.add_node(100)
+        G_cpp.add_node(100)
+        for func in (eg.constraint, eg.effective_size, eg.hierarchy):
+            for weight in (None, "weight"):
+                expected = func(G, weight=weight)
+                serial = func(G_cpp, weight=weight)
+                threaded = func(G_cpp, weight=weight, n_workers=3)
+                self.assertEqual(serial.keys(), expected.keys())
+                for node in expected:
+                    if node == 100 and func is not eg.hierarchy:
+                        self.assertNotEqual(threaded[node], threaded[node])
+                        continue
+                    self.assertAlmostEqual(serial[node], expected[node], places=4)
+                    self.assertEqual(threaded[node], serial[node])
+
 
 if __name__ == "__main__":
     unittest.main()
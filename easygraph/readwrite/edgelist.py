@@ -1,8 +1,11 @@
+import re
+
 import easygraph as eg
 
 
 __all__ = [
     "parse_edgelist",
+    "read_edgelist_chunks",
 ]
 
 
@@ -127,3 +130,159 @@ def parse_edgelist(
                 edgedata.update({edge_key: edge_value})
         G.add_edge(u, v, **edgedata)
     return G
+
+
+def read_edgelist_chunks(path, weighted=False, comments="#", chunk_size=1 << 24):
+    """Reads an edge list file chunk by chunk, as NumPy arrays.
+
+    Each line is ``u v`` or, if `weighted`, ``u v weight``, where the fields
+    are separated by whitespace or commas. Only `chunk_size` characters of
+    the file (rounded up to whole lines) are held in memory at a time.
+
+    Parameters
+    ----------
+    path : string or path-like
+        The file path. Files ending in ``.gz``, ``.gzip``, ``.bz2`` and
+        ``.xz`` are decompressed on the fly.
+
+    weighted : bool, optional (default : False)
+        Whether the third field of each line is the edge weight.
+
+    comments : string, optional (default : '#')
+        Lines starting with this marker are skipped. Use None to keep them.
+
+    chunk_size : int, optional (default : 16M)
+        Approximate number of characters read per chunk.
+
+    Yields
+    ------
+    src, dst : numpy.ndarray of str
+        The two ends of the edges of the chunk.
+
+    weights : numpy.ndarray of float64 or None
+        The weights of the edges of the chunk, if `weighted`.
+
+    malformed : int
+        The number of lines of the chunk skipped because they have too few
+        fields or a weight which is not a number. Blank lines and comments are
+        not counted.
+
+    Examples
+    --------
+    >>> G = eg.Graph()
+    >>> for src, dst, weights, malformed in eg.read_edgelist_chunks(
+    ...     "edges.txt.gz", weighted=True
+    ... ):
+    ...     G.add_edges_from_arrays(src, dst, weights=weights)
+
+    See Also
+    --------
+    easygraph.Graph.add_edges_from_file
+    """
+    import io
+
+    from os.path import splitext
+
+    import numpy as np
+
+    from easygraph.utils.decorators import fopeners
+
+    fields = 3 if weighted else 2
+    opener = fopeners.get(splitext(str(path))[1], open)
+    with io.TextIOWrapper(opener(path, "rb"), encoding="utf-8") as fp:
+        while True:
+            lines = fp.readlines(chunk_size)
+            if not lines:
+                break
+            text = "".join(lines).replace(",", " ")
+            columns, malformed = _split_columns(text, fields, comments)
+            src, dst = columns[0], columns[1]
+            if not len(src) and not malformed:
+                # Only blank lines and comments.
+                continue
+            weights = None
+            if weighted:
+                try:
+                    weights = columns[2].astype(np.float64)
+                except ValueError:
+                    weights = np.array([_to_float(x) for x in columns[2].tolist()])
+                    valid = ~np.isnan(weights) | (np.char.lower(columns[2]) == "nan")
+                    malformed += int(len(src) - valid.sum())
+                    src, dst, weights = src[valid], dst[valid], weights[valid]
+            yield src, dst, weights, malformed
+
+
+_IRREGULAR_SPACE = re.compile(r"[^\S \t\r\n]")
+
+
+def _split_columns(text, fields, comments):
+    """Splits the lines of `text` into their first `fields` fields, as arrays.
+
+    The fields are found at once from the bytes of `text`: a field starts
+    after a space, and belongs to the line of the newlines before it. Text
+    with other whitespace, e.g. non-breaking spaces or form feeds, is split
+    line by line as :meth:`str.split` and :meth:`str.splitlines` do.
+
+    Returns
+    -------
+    columns : list of numpy.ndarray of str
+        The `fields` columns of the lines with enough fields.
+
+    malformed : int
+        The number of lines with too few fields. Blank lines and comments
+        are not counted.
+    """
+    import numpy as np
+
+    data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    if text.isascii():
+        irregular = ((data >= 11) & (data <= 12)) | ((data >= 28) & (data <= 31))
+        irregular = irregular.any()
+    else:
+        irregular = _IRREGULAR_SPACE.search(text) is not None
+    if irregular:
+        return _split_rows(text, fields, comments)
+    tokens = np.array(text.split(), dtype=str)
+    if not len(tokens):
+        return [tokens] * fields, 0
+    space = (data == 32) | (data == 9) | (data == 13) | (data == 10)
+    starts = np.flatnonzero(~space & np.concatenate([[True], space[:-1]]))
+    line = np.searchsorted(np.flatnonzero(data == 10), starts)
+    first = np.flatnonzero(np.concatenate([[True], line[1:] != line[:-1]]))
+    count = np.diff(np.append(first, len(tokens)))
+    if comments is not None:
+        # Only the lines starting with the first byte of `comments` can be
+        # comments.
+        marker = comments.encode("utf-8")[:1]
+        if marker:
+            maybe = np.flatnonzero(data[starts[first]] == ord(marker))
+        else:
+            maybe = np.arange(len(first))
+        keep = np.ones(len(first), dtype=bool)
+        keep[maybe] = ~np.char.startswith(tokens[first[maybe]], comments)
+        first, count = first[keep], count[keep]
+    edges = first[count >= fields]
+    columns = [tokens[edges + i] for i in range(fields)]
+    return columns, len(first) - len(edges)
+
+
+def _split_rows(text, fields, comments):
+    """:func:`_split_columns` by splitting each line in Python."""
+    import numpy as np
+
+    rows = [row.split() for row in text.splitlines()]
+    rows = [
+        row
+        for row in rows
+        if row and (comments is None or not row[0].startswith(comments))
+    ]
+    edges = [row for row in rows if len(row) >= fields]
+    columns = [np.array([row[i] for row in edges], dtype=str) for i in range(fields)]
+    return columns, len(rows) - len(edges)
+
+
+def _to_float(s):
+    try:
+        return float(s)
+    except ValueError:
+        return float("nan")
@@ -1,3 +1,8 @@
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
 import unittest
 
 import easygraph as eg
@@ -22,5 +27,85 @@ class ParseEdgeList(unittest.TestCase):
         return list(eg.parse_edgelist(lines, nodetype=int, data=(("weight", float),)))
 
 
+class ReadEdgeListChunks(unittest.TestCase):
+    lines = "Jack Mary 23.0\nMary,Tom,15.0\n# comment\n\nTom Ben x\nBen\nTom Ben 20\n"
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, name, opener=open):
+        path = os.path.join(self.dir.name, name)
+        with opener(path, "wb") as f:
+            f.write(self.lines.encode())
+        return path
+
+    def test_chunks(self):
+        path = self.write("edges.txt")
+        chunks = list(eg.read_edgelist_chunks(path, weighted=True, chunk_size=16))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(
+            [x for src, dst, w, bad in chunks for x in zip(src, dst, w)],
+            [("Jack", "Mary", 23.0), ("Mary", "Tom", 15.0), ("Tom", "Ben", 20.0)],
+        )
+        self.assertEqual(sum(bad for src, dst, w, bad in chunks), 2)
+
+    def test_add_edges_from_compressed_file(self):
+        for name, opener in [
+            ("edges.txt", open),
+            ("edges.txt.gz", gzip.open),
+            ("edges.txt.bz2", bz2.open),
+            ("edges.txt.xz", lzma.open),
+        ]:
+            G = eg.Graph()
+            with self.assertWarns(UserWarning):
+                malformed = G.add_edges_from_file(self.write(name, opener), True)
+            self.assertEqual(malformed, 2)
+            self.assertEqual(
+                list(G.edges),
+                [
+                    ("Jack", "Mary", {"weight": 23.0}),
+                    ("Mary", "Tom", {"weight": 15.0}),
+                    ("Tom", "Ben", {"weight": 20.0}),
+                ],
+            )
+
+    def test_comments_only(self):
+        self.lines = "# comment\n\n# another one\n"
+        path = self.write("edges.txt")
+        self.assertEqual(list(eg.read_edgelist_chunks(path)), [])
+        for G in [eg.Graph(), eg.DiGraph()]:
+            self.assertEqual(G.add_edges_from_file(path, True), 0)
+            self.assertEqual(len(G), 0)
+
+    def test_all_malformed(self):
+        self.lines = "1 2 x\n3 4 y\n"
+        path = self.write("edges.txt")
+        for G in [eg.Graph(), eg.DiGraph()]:
+            with self.assertWarns(UserWarning):
+                self.assertEqual(G.add_edges_from_file(path, True), 2)
+            self.assertEqual(len(G), 0)
+
+    def test_irregular_whitespace(self):
+        self.lines = "a\xa0b 1\nc\x0cd e 2\n"
+        path = self.write("edges.txt")
+        [(src, dst, weights, malformed)] = eg.read_edgelist_chunks(path, True)
+        self.assertEqual(
+            list(zip(src, dst, weights)), [("a", "b", 1.0), ("d", "e", 2.0)]
+        )
+        self.assertEqual(malformed, 1)
+
+    def test_directed_unweighted(self):
+        G = eg.DiGraph()
+        with self.assertWarns(UserWarning):
+            self.assertEqual(G.add_edges_from_file(self.write("edges.txt")), 1)
+        self.assertEqual(
+            list(G.edges(data=False)),
+            [("Jack", "Mary"), ("Mary", "Tom"), ("Tom", "Ben")],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
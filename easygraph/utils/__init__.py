@@ -6,5 +6,6 @@ from easygraph.utils.exception import *
 from easygraph.utils.index_of_node import *
 from easygraph.utils.mapped_queue import *
 from easygraph.utils.misc import *
+from easygraph.utils.parallel import *
 from easygraph.utils.relabel import *
 from easygraph.utils.type_change import *
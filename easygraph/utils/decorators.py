@@ -2,6 +2,7 @@ import bz2
 import collections
 import gzip
 import inspect
+import lzma
 import re
 
 from collections import defaultdict
@@ -106,6 +107,7 @@ fopeners = {
     ".gz": gzip.open,
     ".gzip": gzip.open,
     ".bz2": bz2.BZ2File,
+    ".xz": lzma.open,
 }
 _dispatch_dict = defaultdict(lambda: open, **fopeners)  # type: ignore
 
@@ -0,0 +1,400 @@
+"""Running graph algorithms on chunks of nodes in worker processes or threads."""
+
+import atexit
+import itertools
+import os
+
+
+__all__ = [
+    "Executor",
+    "get_executor",
+    "guided_chunks",
+    "parallel_map",
+    "set_parallel_backend",
+]
+
+_BACKENDS = ("process", "thread")
+_default_backend = "process"
+_executors = {}
+_job_ids = itertools.count()
+
+
+def set_parallel_backend(backend):
+    """Sets the backend used by the `n_workers` parameter of the algorithms.
+
+    Parameters
+    ----------
+    backend : {'process', 'thread'}
+        Worker processes suit pure Python algorithms, which hold the GIL.
+        Threads avoid starting processes and copying the graph, and suit
+        algorithms spending their time in NumPy or C++ code.
+
+    Returns
+    -------
+    previous : string
+        The previous backend.
+
+    """
+    global _default_backend
+    if backend not in _BACKENDS:
+        raise ValueError(
+            "backend must be one of {}, not {!r}.".format(_BACKENDS, backend)
+        )
+    previous, _default_backend = _default_backend, backend
+    return previous
+
+
+def get_executor(n_workers, backend=None):
+    """Returns the persistent :class:`Executor` of a backend.
+
+    One executor is kept per backend, so that its workers are started once
+    and reused by every call. Asking for a different number of workers
+    replaces it.
+
+    Parameters
+    ----------
+    n_workers : int
+        The number of workers.
+
+    backend : {'process', 'thread'} or None, optional (default : None)
+        If None, the backend set by :func:`set_parallel_backend`.
+
+    Returns
+    -------
+    executor : Executor
+
+    """
+    backend = backend or _default_backend
+    executor = _executors.get(backend)
+    if executor is None or executor.n_workers != n_workers:
+        if executor is not None:
+            executor.shutdown()
+        executor = _executors[backend] = Executor(n_workers, backend)
+    return executor
+
+
+@atexit.register
+def _shutdown_executors():
+    for executor in _executors.values():
+        executor.shutdown()
+    _executors.clear()
+
+
+def parallel_map(
+    func,
+    G,
+    nodes,
+    n_workers,
+    cost=None,
+    csr_weight="weight",
+    initializer=None,
+    backend=None,
+    **kwargs,
+):
+    """Maps ``func(chunk, G=G, **kwargs)`` over chunks of `nodes` in parallel.
+
+    It is the entry point of the `n_workers` parameter of the algorithms,
+    running on the persistent executor returned by :func:`get_executor`.
+    See :meth:`Executor.map` for the parameters.
+
+    Returns
+    -------
+    results : iterator
+        The results of `func`, in completion order.
+
+    """
+    return get_executor(n_workers, backend).map(
+        func,
+        G,
+        nodes,
+        cost=cost,
+        csr_weight=csr_weight,
+        initializer=initializer,
+        **kwargs,
+    )
+
+
+class Executor:
+    """A reusable pool of workers running graph algorithms on chunks of nodes.
+
+    The nodes are cut into chunks by :func:`guided_chunks`: the costliest
+    nodes come first, and chunks shrink as the remaining work does, so that
+    no worker is left alone with a heavy chunk at the end. Idle workers take
+    the next chunk from the shared queue of the pool.
+
+    With the process backend, the graph is not pickled into the tasks. Its
+    CSR snapshot is copied once per call into shared memory, and each worker
+    attaches to it zero-copy through :func:`easygraph.csr_view`. The worker
+    function and its arguments are pickled once per call into shared memory
+    too, so that tasks only carry their chunk of nodes.
+
+    Parameters
+    ----------
+    n_workers : int
+        The number of workers.
+
+    backend : {'process', 'thread'}, optional (default : 'process')
+
+    Examples
+    --------
+    >>> with Executor(4) as executor:
+    ...     for result in executor.map(func, G, G.nodes, cost=G.degree(weight=None)):
+    ...         ...
+
+    """
+
+    def __init__(self, n_workers, backend="process"):
+        if backend not in _BACKENDS:
+            raise ValueError(
+                "backend must be one of {}, not {!r}.".format(_BACKENDS, backend)
+            )
+        self.n_workers = max(1, int(n_workers))
+        self.backend = backend
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.backend == "thread":
+                from multiprocessing.pool import ThreadPool
+
+                self._pool = ThreadPool(self.n_workers)
+            else:
+                from multiprocessing import Pool
+
+                self._pool = Pool(self.n_workers)
+        return self._pool
+
+    def map(
+        self, func, G, nodes, cost=None, csr_weight="weight", initializer=None, **kwargs
+    ):
+        """Maps ``func(chunk, G=G, **kwargs)`` over chunks of `nodes`.
+
+        Parameters
+        ----------
+        func : callable
+            A module-level function ``func(chunk, G, **kwargs)``, where
+            `chunk` is a list of nodes.
+
+        G : easygraph.Graph or easygraph.DiGraph
+
+        nodes : iterable of nodes
+
+        cost : mapping or callable, optional (default : None)
+            The estimated cost of each node, e.g. ``G.degree(weight=None)``
+            for algorithms working on neighborhoods. If None, every node
+            costs the same.
+
+        csr_weight : string or None, optional (default : 'weight')
+            With the process backend, the only edge attribute the workers
+            see. Edges without it get 1.
+
+        initializer : callable, optional (default : None)
+            A module-level function called without arguments before the
+            first chunk of the call, once per worker process, or once in the
+            calling thread with the thread backend. Workers outlive the
+            call, so it should reset the module-level state `func` relies on,
+            e.g. memoization dicts.
+
+        kwargs : keyword arguments
+            Passed to every call of `func`.
+
+        Returns
+        -------
+        results : iterator
+            The results of `func`, in completion order.
+
+        Notes
+        -----
+        With the process backend, workers see a read-only graph with the
+        same nodes and edges as `G`, but without node attributes. If shared
+        memory is not available (Python < 3.8), or `G` cannot be exported to
+        CSR, `G` is sent once per worker to a pool started for the call.
+
+        """
+        chunks = guided_chunks(list(nodes), self.n_workers, cost)
+        if self.backend == "thread":
+            if initializer is not None:
+                initializer()
+            return self._get_pool().imap_unordered(_ThreadTask(func, G, kwargs), chunks)
+        return self._map_processes(func, G, chunks, csr_weight, initializer, kwargs)
+
+    def _map_processes(self, func, G, chunks, csr_weight, initializer, kwargs):
+        try:
+            shared = G.csr(csr_weight).share()
+        except (ImportError, AttributeError):
+            yield from _map_fresh_pool(
+                func, G, chunks, self.n_workers, initializer, kwargs
+            )
+            return
+        done = False
+        try:
+            import pickle
+
+            from easygraph.classes.csr import _share_bytes
+
+            payload = pickle.dumps(
+                (func, initializer, kwargs), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            shared._blocks.append(_share_bytes(payload))
+            job = _Job(
+                (os.getpid(), next(_job_ids)),
+                shared.handle,
+                (shared._blocks[-1].name, len(payload)),
+            )
+            yield from self._get_pool().imap_unordered(
+                _run_job, ((job, chunk) for chunk in chunks)
+            )
+            done = True
+        finally:
+            if not done:
+                # Stop the tasks left behind by an error or an early exit.
+                self.shutdown()
+            shared.close()
+
+    def shutdown(self):
+        """Stops the workers. The executor starts new ones when used again."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def guided_chunks(nodes, n_workers, cost=None):
+    """Cuts `nodes` into chunks of decreasing cost, for dynamic scheduling.
+
+    Nodes are sorted by decreasing cost. Each chunk takes about
+    ``1 / (2 * n_workers)`` of the remaining cost, as in the guided
+    scheduling of OpenMP: the first chunks are large to keep the overhead
+    low, and the last ones are small to balance the load.
+
+    Parameters
+    ----------
+    nodes : list of nodes
+
+    n_workers : int
+
+    cost : mapping or callable, optional (default : None)
+        The estimated cost of each node. If None, every node costs the same.
+
+    Returns
+    -------
+    chunks : list of lists of nodes
+
+    """
+    if not nodes:
+        return []
+    if cost is None:
+        costs = [1] * len(nodes)
+    else:
+        get = cost if callable(cost) else cost.__getitem__
+        # Any work costs something, e.g. isolated nodes.
+        costs = [get(node) + 1 for node in nodes]
+        order = sorted(range(len(nodes)), key=costs.__getitem__, reverse=True)
+        nodes = [nodes[i] for i in order]
+        costs = [costs[i] for i in order]
+
+    remaining = sum(costs)
+    # Tiny chunks cost more in overhead than they gain in balance.
+    floor = remaining / (64 * n_workers)
+    chunks = []
+    chunk = []
+    chunk_cost = 0
+    target = max(remaining / (2 * n_workers), floor)
+    for node, c in zip(nodes, costs):
+        chunk.append(node)
+        chunk_cost += c
+        if chunk_cost >= target:
+            chunks.append(chunk)
+            remaining -= chunk_cost
+            chunk = []
+            chunk_cost = 0
+            target = max(remaining / (2 * n_workers), floor)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class _ThreadTask:
+    __slots__ = ("func", "G", "kwargs")
+
+    def __init__(self, func, G, kwargs):
+        self.func = func
+        self.G = G
+        self.kwargs = kwargs
+
+    def __call__(self, chunk):
+        return self.func(chunk, G=self.G, **self.kwargs)
+
+
+class _Job:
+    """What a worker process needs to run the tasks of one call."""
+
+    __slots__ = ("id", "handle", "payload")
+
+    def __init__(self, id, handle, payload):
+        self.id = id
+        self.handle = handle
+        self.payload = payload
+
+    def __reduce__(self):
+        return (self.__class__, (self.id, self.handle, self.payload))
+
+
+# The job of the last task run by this worker process, and its state.
+_worker = {}
+
+
+def _run_job(task):
+    job, chunk = task
+    if _worker.get("id") != job.id:
+        _release_job()
+        import pickle
+
+        from easygraph.classes.csr import _load_bytes
+        from easygraph.classes.graphviews import csr_view
+
+        func, initializer, kwargs = pickle.loads(_load_bytes(*job.payload))
+        if initializer is not None:
+            initializer()
+        _worker.update(
+            id=job.id,
+            handle=job.handle,
+            G=csr_view(*job.handle.attach()),
+            func=func,
+            kwargs=kwargs,
+        )
+    return _worker["func"](chunk, G=_worker["G"], **_worker["kwargs"])
+
+
+def _release_job():
+    handle = _worker.get("handle")
+    _worker.clear()
+    if handle is not None:
+        handle.detach()
+
+
+def _map_fresh_pool(func, G, chunks, n_workers, initializer, kwargs):
+    from multiprocessing import Pool
+
+    with Pool(
+        n_workers,
+        initializer=_init_fresh_worker,
+        initargs=(func, G, initializer, kwargs),
+    ) as p:
+        yield from p.imap_unordered(_run_fresh, chunks)
+
+
+def _init_fresh_worker(func, G, initializer, kwargs):
+    if initializer is not None:
+        initializer()
+    _worker.update(func=func, G=G, kwargs=kwargs)
+
+
+def _run_fresh(chunk):
+    return _worker["func"](chunk, G=_worker["G"], **_worker["kwargs"])
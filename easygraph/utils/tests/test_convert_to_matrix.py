@@ -38,7 +38,7 @@ class ConvertToMatrix(unittest.TestCase):
         array_with_data_types_expected_return = [
             tuple((0, 0, {"weight": 1.0, "cost": 2}))
         ]
-        self.assertListEqual(test_graph.edges, expected_return)
+        self.assertListEqual(list(test_graph.edges), expected_return)
         self.assertEqual(
             test_multigraph.edges, multigraph_and_parallel_edges_expected_return
         )
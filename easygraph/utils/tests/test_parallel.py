@@ -0,0 +1,92 @@
+import unittest
+
+import easygraph as eg
+
+from easygraph.utils.parallel import Executor
+
+
+_state = {}
+
+
+def _reset():
+    _state.clear()
+
+
+def _degrees(nodes, G, offset=0):
+    _state.setdefault("calls", 0)
+    _state["calls"] += 1
+    return [(node, len(G[node]) + offset, _state["calls"]) for node in nodes]
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.G = eg.Graph([(i, (i * 7 + 3) % 50) for i in range(50)])
+
+    def test_guided_chunks(self):
+        nodes = list(range(100))
+        chunks = eg.guided_chunks(nodes, 4)
+        self.assertEqual(sorted(n for c in chunks for n in c), nodes)
+        sizes = [len(c) for c in chunks]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        self.assertGreater(len(chunks), 4)
+
+        cost = {n: n for n in nodes}
+        chunks = eg.guided_chunks(nodes, 4, cost=cost)
+        self.assertEqual(chunks[0][0], 99)
+        self.assertEqual(sorted(n for c in chunks for n in c), nodes)
+        self.assertEqual(eg.guided_chunks([], 4), [])
+
+    def _check(self, executor):
+        expected = {n: len(self.G[n]) + 1 for n in self.G}
+        for _ in range(2):
+            ret = executor.map(
+                _degrees, self.G, self.G.nodes, initializer=_reset, offset=1
+            )
+            res = {n: d for chunk in ret for n, d, _ in chunk}
+            self.assertEqual(res, expected)
+
+    def test_process_backend(self):
+        with Executor(2) as executor:
+            self._check(executor)
+            pool = executor._pool
+            self._check(executor)
+            self.assertIs(executor._pool, pool)
+        self.assertIsNone(executor._pool)
+
+    def test_thread_backend(self):
+        with Executor(2, backend="thread") as executor:
+            self._check(executor)
+
+    def test_initializer(self):
+        # Every call starts from a clean state in each worker.
+        with Executor(1) as executor:
+            for _ in range(2):
+                ret = executor.map(
+                    _degrees, self.G, [0, 1, 2], initializer=_reset, offset=0
+                )
+                calls = [c for chunk in ret for _, _, c in chunk]
+                self.assertEqual(min(calls), 1)
+
+    def test_get_executor(self):
+        executor = eg.get_executor(2, backend="thread")
+        self.assertIs(eg.get_executor(2, backend="thread"), executor)
+        other = eg.get_executor(3, backend="thread")
+        self.assertIsNot(other, executor)
+        self.assertEqual(other.n_workers, 3)
+        other.shutdown()
+
+    def test_set_parallel_backend(self):
+        previous = eg.set_parallel_backend("thread")
+        try:
+            res = eg.betweenness_centrality(self.G, n_workers=2)
+            expected = eg.betweenness_centrality(self.G)
+            for node in self.G:
+                self.assertAlmostEqual(res[node], expected[node])
+        finally:
+            eg.set_parallel_backend(previous)
+        with self.assertRaises(ValueError):
+            eg.set_parallel_backend("gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
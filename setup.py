@@ -13,8 +13,10 @@ sources = list(str(x) for x in cpp_source_dir.rglob("*.cpp"))
 
 uname = platform.uname()
 compileArgs = []
+linkArgs = []
 if uname[0] == "Darwin" or uname[0] == "Linux":
-    compileArgs = ["-std=c++11"]
+    compileArgs = ["-std=c++11", "-pthread"]
+    linkArgs = ["-pthread"]
 CYTHON_STR = "Cython"
 
 setuptools.setup(
@@ -65,7 +67,11 @@ setuptools.setup(
     tests_require=[],
     ext_modules=[
         setuptools.Extension(
-            "cpp_easygraph", sources, optional=True, extra_compile_args=compileArgs
+            "cpp_easygraph",
+            sources,
+            optional=True,
+            extra_compile_args=compileArgs,
+            extra_link_args=linkArgs,
         )
     ],
 )